@@ -1,256 +1,348 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Sequence, Set, Tuple, Union
 import json
 import re
-import requests
 import os
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from weakref import WeakKeyDictionary
+from dataclasses import dataclass, field
 from datetime import datetime
 from dotenv import load_dotenv
 import time
 import streamlit as st
 # Import the SmartEvaluator
-from smart_evaluator import SmartEvaluator
+from smart_evaluator import SmartEvaluator, SmartContextDetector
+from evaluation_executor import EvaluationExecutor
+from pre_scorer import CandidatePreScorer
+from query_overlap import QueryOverlapEstimator
+from query_packer import QueryPacker, TermStats
+from strategy_bandit import StrategyBandit
+from query_performance_store import QueryPerformanceStore
+from top_k import TopKCollector
+from keyword_matcher import KeywordHits, KeywordMatcher, get_keyword_matcher
+from token_index import TokenIndex
+from job_profile import JobProfile
+from location_engine import Location, get_location_engine
+from memo_cache import ContentMemo
+from taxonomy import CompiledTaxonomy, CompiledTemplate, DEFAULT_TAXONOMY_PATH, get_taxonomy
+from http_client import get_http_client
 
 load_dotenv()
 
+# Analyzer owned by each analyze_jobs worker process
+_worker_analyzer = None
+
+def _init_analysis_worker(analyzer: "JobDescriptionAnalyzer") -> None:
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+def _analyze_chunk(job_descriptions: List[str]) -> List[Dict[str, Any]]:
+    return [_worker_analyzer.analyze_job(job_description) for job_description in job_descriptions]
+
 class JobDescriptionAnalyzer:
     """Enhanced analyzer for job descriptions with industry classification and skill extraction"""
     
-    def __init__(self):
-        self.job_families = {
-            "engineering": ["engineer", "developer", "programmer", "swe", "devops", "infrastructure", "backend", "frontend", "fullstack", "mobile", "platform", "site reliability", "sre"],
-            "data": ["data scientist", "ml engineer", "ai engineer", "data engineer", "analyst", "machine learning", "artificial intelligence", "data analyst"],
-            "product": ["product manager", "pm", "product owner", "product lead", "chief product officer", "cpo"],
-            "design": ["designer", "ux", "ui", "creative", "design lead", "art director", "visual designer"],
-            "sales": ["sales", "account executive", "account manager", "sales rep", "business development", "bdr", "sdr"],
-            "marketing": ["marketing", "growth", "content", "brand", "digital marketing", "social media", "seo", "sem"],
-            "finance": ["finance", "accounting", "controller", "cfo", "analyst", "fp&a", "tax", "audit", "cpa"],
-            "legal": ["lawyer", "attorney", "counsel", "legal", "paralegal", "compliance"],
-            "operations": ["operations", "project manager", "program manager", "business analyst", "consultant"],
-            "hr": ["hr", "human resources", "recruiter", "talent", "people operations", "chief people officer"],
-            "executive": ["ceo", "cfo", "cto", "coo", "chief", "vp", "vice president", "director", "head of"]
-        }
-        
-        self.seniority_levels = {
-            "entry": ["junior", "entry", "associate", "intern", "new grad", "recent graduate", "1-2 years"],
-            "mid": ["mid", "2-5 years", "3-6 years", "intermediate"],
-            "senior": ["senior", "sr", "5+ years", "6+ years", "lead", "principal", "staff"],
-            "executive": ["director", "vp", "vice president", "chief", "ceo", "cfo", "cto", "coo", "head of"]
-        }
-        
-        self.industries = {
-            "tech": ["tech", "software", "saas", "platform", "ai", "ml", "startup", "fintech", "edtech", "healthtech"],
-            "finance": ["finance", "banking", "investment", "trading", "insurance", "fintech", "hedge fund", "private equity"],
-            "healthcare": ["healthcare", "medical", "hospital", "pharma", "biotech", "health tech", "clinical"],
-            "consulting": ["consulting", "mckinsey", "bain", "bcg", "deloitte", "pwc", "accenture"],
-            "retail": ["retail", "ecommerce", "consumer", "fashion", "cpg", "fmcg"]
-        }
-        
-        # Enhanced technical skills patterns
-        self.technical_skills = {
-            # Programming Languages
-            "programming": r"\b(python|javascript|java|c\+\+|golang|rust|typescript|ruby|php|scala|kotlin|swift|objective-c|c#|r|matlab)\b",
-            
-            # Cloud & Infrastructure
-            "cloud": r"\b(aws|azure|gcp|google cloud|amazon web services|docker|kubernetes|terraform|pulumi|cloudformation|helm|istio)\b",
-            
-            # Databases
-            "databases": r"\b(postgresql|mysql|mongodb|redis|elasticsearch|dynamodb|cassandra|snowflake|bigquery|databricks)\b",
-            
-            # DevOps & Tools
-            "devops": r"\b(jenkins|gitlab ci|github actions|ansible|chef|puppet|docker|kubernetes|prometheus|grafana|datadog|splunk)\b",
-            
-            # Frontend
-            "frontend": r"\b(react|angular|vue|svelte|next\.js|nuxt|webpack|vite|sass|less|tailwind|bootstrap)\b",
-            
-            # Backend
-            "backend": r"\b(node\.js|express|django|flask|spring|rails|laravel|fastapi|graphql|rest api|microservices)\b",
-            
-            # ML/AI
-            "ml_ai": r"\b(tensorflow|pytorch|scikit-learn|pandas|numpy|jupyter|mlflow|kubeflow|langchain|openai|hugging face|transformers)\b",
-            
-            # Finance/Accounting
-            "finance": r"\b(gaap|ifrs|sox|cpa|cfa|frm|quickbooks|sap|oracle financials|hyperion|cognos|tableau|power bi)\b",
-            
-            # Legal
-            "legal": r"\b(westlaw|lexisnexis|clio|contracts|litigation|ip|patent|trademark|compliance|gdpr|ccpa)\b"
-        }
+    def __init__(self, memo: Optional[ContentMemo] = None, taxonomy_path: str = DEFAULT_TAXONOMY_PATH):
+        # Profiles memoized by JD content, so re-analyzing unchanged text is free
+        self.memo = memo if memo is not None else ContentMemo()
+        # Keyword tables, skills and the prebuilt matcher live in data/taxonomy.json
+        self.taxonomy_path = taxonomy_path
+    
+    @property
+    def taxonomy(self) -> CompiledTaxonomy:
+        """Shared compiled taxonomy, hot-reloaded when the data file changes"""
+        return get_taxonomy(self.taxonomy_path)
+    
+    @property
+    def technical_skills(self) -> Dict[str, List[str]]:
+        return self.taxonomy.technical_skills
+    
+    @property
+    def job_families(self) -> Dict[str, List[str]]:
+        return self.taxonomy.job_families
+    
+    @property
+    def seniority_levels(self) -> Dict[str, List[str]]:
+        return self.taxonomy.seniority_levels
+    
+    @property
+    def industries(self) -> Dict[str, List[str]]:
+        return self.taxonomy.industries
+    
+    @property
+    def keyword_tables(self) -> Dict[str, Dict[str, List[str]]]:
+        return self.taxonomy.analysis_tables
+    
+    @property
+    def keyword_matcher(self) -> KeywordMatcher:
+        """One automaton over all keyword tables finds every hit in a single pass"""
+        return self.taxonomy.keyword_matcher
 
+    # Batches smaller than this are analyzed in-process; pool startup would dominate
+    IN_PROCESS_THRESHOLD = 256
+    
     def analyze_job(self, job_description: str) -> Dict[str, Any]:
         """Comprehensive job analysis"""
+        return self.build_profile(job_description).as_analysis()
+    
+    def analyze_jobs(self, job_descriptions: Iterable[str], workers: Optional[int] = None,
+                     chunk_size: int = 128) -> Iterator[Dict[str, Any]]:
+        """Analyze many job descriptions, yielding analyze_job results in input order.
+        
+        Classification is CPU bound, so inputs are sent to a process pool in
+        chunks of ``chunk_size`` to amortize IPC. At most two chunks per worker
+        are in flight, so arbitrarily long iterables stream in bounded memory.
+        With ``workers`` <= 1, or fewer than IN_PROCESS_THRESHOLD inputs, the
+        analysis runs in-process.
+        """
+        workers = workers if workers is not None else (os.cpu_count() or 1)
+        job_descriptions = iter(job_descriptions)
+        
+        head = list(islice(job_descriptions, self.IN_PROCESS_THRESHOLD))
+        if workers <= 1 or len(head) < self.IN_PROCESS_THRESHOLD:
+            for job_description in head:
+                yield self.analyze_job(job_description)
+            for job_description in job_descriptions:
+                yield self.analyze_job(job_description)
+            return
+        
+        chunks = self._chunks(head, job_descriptions, chunk_size)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_analysis_worker,
+                                 initargs=(self,)) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(_analyze_chunk, chunk))
+                # Yield the oldest chunk once enough work is queued to keep every worker busy
+                if len(pending) >= workers * 2:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+    
+    def _chunks(self, head: List[str], rest: Iterator[str], chunk_size: int) -> Iterator[List[str]]:
+        """Split the already-read head and the remaining iterator into lists of chunk_size"""
+        for i in range(0, len(head), chunk_size):
+            chunk = head[i:i + chunk_size]
+            if len(chunk) < chunk_size:
+                chunk.extend(islice(rest, chunk_size - len(chunk)))
+            yield chunk
+        while True:
+            chunk = list(islice(rest, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+    
+    def build_profile(self, job_description: str,
+                      context_detector: Optional[SmartContextDetector] = None) -> JobProfile:
+        """Analyze a job description once into an immutable JobProfile.
+        
+        With a SmartContextDetector, its context is detected from the same
+        token scan, so the description is tokenized and classified once.
+        Results are memoized by content, ignoring whitespace and bullets,
+        and recomputed after either taxonomy is reloaded.
+        """
+        # Keyed on the detector's tables, not its identity: ids are reused after GC
+        detector_version = context_detector.version if context_detector is not None else None
+        profile = self.memo.get_or_compute(
+            job_description,
+            lambda: self._build_profile(job_description, context_detector),
+            variant=(detector_version, self.taxonomy.source_hash)
+        )
+        if profile.description != job_description:
+            # Same content, different layout: keep the caller's text and job key
+            profile = profile.with_description(job_description)
+        return profile
+    
+    def _build_profile(self, job_description: str,
+                       context_detector: Optional[SmartContextDetector]) -> JobProfile:
         text = job_description.lower()
+        index = TokenIndex(job_description)
+        
+        matcher = self.keyword_matcher
+        if context_detector is not None and context_detector.keyword_matcher is not matcher:
+            matcher = get_keyword_matcher({**self.keyword_tables, **context_detector.keyword_tables})
+        hits = matcher.scan(index)
         
         # Analyze job family
-        job_family = self._classify_job_family(text)
+        job_family = self._classify_job_family(hits)
         
         # Analyze seniority
-        seniority = self._detect_seniority(text)
+        seniority = self._detect_seniority(hits)
         
         # Analyze industry
-        industry = self._detect_industry(text)
+        industry = self._detect_industry(hits)
         
-        # Extract skills
-        skills = self._extract_skills(text)
+        # Extract skills (case matters for a few terms, e.g. "Go")
+        skills = self._extract_skills(job_description)
         
         # Extract locations
         locations = self._extract_locations(job_description)
         
         # Determine if role is technical/leadership/remote-eligible
         is_technical = job_family in ["engineering", "data"] or any(skills.values())
-        is_leadership = seniority in ["senior", "executive"] or any(term in text for term in ["lead", "manager", "director", "head"])
-        remote_eligible = any(term in text for term in ["remote", "distributed", "work from home", "wfh"])
+        is_leadership = seniority in ["senior", "executive"] or index.contains_any(["lead", "manager", "director", "head"])
+        remote_eligible = index.contains_any(["remote", "distributed", "work from home", "wfh"])
         
-        return {
-            "job_family": job_family,
-            "seniority": seniority,
-            "industry": industry,
-            "skills": skills,
-            "locations": locations,
-            "is_technical": is_technical,
-            "is_leadership": is_leadership,
-            "remote_eligible": remote_eligible,
-            "total_skills": sum(len(v) for v in skills.values())
-        }
+        return JobProfile.create(
+            job_description,
+            index,
+            skills=skills,
+            locations=[location.label for location in locations],
+            location_details=locations,
+            context=context_detector.context_from_hits(hits) if context_detector is not None else {},
+            job_family=job_family,
+            seniority=seniority,
+            industry=industry,
+            is_technical=is_technical,
+            is_leadership=is_leadership,
+            remote_eligible=remote_eligible
+        )
     
-    def _classify_job_family(self, text: str) -> str:
+    def _classify_job_family(self, hits: KeywordHits) -> str:
         """Classify job into family category"""
-        family_scores = {}
-        for family, keywords in self.job_families.items():
-            score = sum(1 for keyword in keywords if keyword in text)
-            if score > 0:
-                family_scores[family] = score
-        
-        return max(family_scores.items(), key=lambda x: x[1])[0] if family_scores else "operations"
+        return hits.best("job_family", default="operations")
     
-    def _detect_seniority(self, text: str) -> str:
+    def _detect_seniority(self, hits: KeywordHits) -> str:
         """Detect seniority level"""
-        for level, keywords in self.seniority_levels.items():
-            if any(keyword in text for keyword in keywords):
-                return level
-        return "mid"  # Default
+        return hits.first("seniority", default="mid")
     
-    def _detect_industry(self, text: str) -> str:
+    def _detect_industry(self, hits: KeywordHits) -> str:
         """Detect industry"""
-        for industry, keywords in self.industries.items():
-            if any(keyword in text for keyword in keywords):
-                return industry
-        return "tech"  # Default
+        return hits.first("industry", default="tech")
     
     def _extract_skills(self, text: str) -> Dict[str, List[str]]:
         """Extract technical skills by category"""
-        skills = {}
-        for category, pattern in self.technical_skills.items():
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            skills[category] = list(set(matches)) if matches else []
-        return skills
-    
-    def _extract_locations(self, text: str) -> List[str]:
-        """Extract location information"""
-        # Common location patterns
-        location_patterns = [
-            r"\b([A-Z][a-z]+ [A-Z][a-z]+, [A-Z]{2})\b",  # City, State
-            r"\b([A-Z][a-z]+, [A-Z]{2})\b",  # City, State  
-            r"\b(New York|San Francisco|Los Angeles|Chicago|Boston|Seattle|Austin|Denver|Atlanta|Miami|remote)\b"
-        ]
-        
-        locations = []
-        for pattern in location_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            locations.extend(matches)
-        
-        return list(set(locations))
+        return self.extract_skills_bulk([text])[0]
+    
+    def extract_skills_bulk(self, texts: Sequence[str]) -> List[Dict[str, List[str]]]:
+        """Extract skills from many texts (JDs or candidate snippets) in one regex pass.
+        
+        Returns one {category: [skills]} dict per text, with synonyms mapped
+        to their canonical skill ("k8s" -> "kubernetes") in order of first mention.
+        """
+        taxonomy = self.taxonomy
+        results = [{category: [] for category in taxonomy.technical_skills} for _ in texts]
+        
+        for i, match in self._skill_matches(texts):
+            skills = results[i]
+            skill = taxonomy.skill_canonical[match.group(0).lower()]
+            for category in (match.lastgroup,) + taxonomy.skill_extra_categories.get(skill, ()):
+                if skill not in skills[category]:
+                    skills[category].append(skill)
+        return results
+    
+    def extract_skill_ids_bulk(self, texts: Sequence[str]) -> List[Set[int]]:
+        """Canonical skill ids (see CompiledTaxonomy.skill_ids) per text, in one regex pass"""
+        surface_skill_ids = self.taxonomy.surface_skill_ids
+        results: List[Set[int]] = [set() for _ in texts]
+        for i, match in self._skill_matches(texts):
+            results[i].add(surface_skill_ids[match.group(0).lower()])
+        return results
+    
+    def skill_ids(self, skills: Dict[str, Sequence[str]]) -> Set[int]:
+        """Ids of already extracted {category: [skills]}, e.g. a JobProfile's skills"""
+        ids = self.taxonomy.skill_ids
+        return {ids[skill] for category_skills in skills.values() for skill in category_skills if skill in ids}
+    
+    def _skill_matches(self, texts: Sequence[str]) -> Iterator[Tuple[int, Any]]:
+        """(text index, match) for every skill mention across the texts"""
+        if not texts:
+            return
+        
+        # Join with newlines (never part of a term) and map match offsets back to texts
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+        joined = "\n".join(texts)
+        
+        for match in self.taxonomy.skill_pattern.finditer(joined):
+            yield bisect_right(starts, match.start()) - 1, match
+    
+    def _extract_locations(self, text: str) -> List[Location]:
+        """Extract locations via the gazetteer, in order of first mention"""
+        return get_location_engine().extract(text)
+
+class PlaceholderValues(dict):
+    """Placeholder values of one JobProfile, each computed on first use and then reused.
+    
+    Passed to CompiledTemplate.render; ``format_map`` calls ``__missing__``
+    for placeholders not resolved yet.
+    """
+    
+    def __init__(self, generator: "QueryGenerator", profile: JobProfile):
+        super().__init__()
+        self.generator = generator
+        self.profile = profile
+    
+    def __missing__(self, placeholder: str) -> str:
+        value = self[placeholder] = self.generator._generate_placeholder_value(placeholder, self.profile, "")
+        return value
 
 class QueryGenerator:
     """Generates optimized LinkedIn X-Ray search queries based on job analysis"""
     
-    def __init__(self):
-        # Role-specific query templates
-        self.query_templates = {
-            "devops_engineer": {
-                "primary": 'site:linkedin.com/in/ ("DevOps Engineer" OR "Site Reliability Engineer" OR "Infrastructure Engineer") {location} {experience} {tech_stack}',
-                "specialized": 'site:linkedin.com/in/ "DevOps Engineer" {company_context} ({cloud_platforms}) {iac_tools}',
-                "industry_specific": 'site:linkedin.com/in/ ("DevOps Engineer" OR "Infrastructure Engineer") {industry_context} {certification}'
-            },
-            "ml_engineer": {
-                "primary": 'site:linkedin.com/in/ ("ML Engineer" OR "Machine Learning Engineer" OR "AI Engineer") {location} {experience} {ml_frameworks}',
-                "specialized": 'site:linkedin.com/in/ "ML Engineer" {company_context} ({production_ml}) {ai_domains}',
-                "research_focused": 'site:linkedin.com/in/ ("ML Engineer" OR "Research Engineer") {research_context} {academic_background}'
-            },
-            "software_engineer": {
-                "primary": 'site:linkedin.com/in/ ("Software Engineer" OR "Software Developer") {location} {experience} {programming_languages}',
-                "specialized": 'site:linkedin.com/in/ "Software Engineer" {company_context} {tech_stack} {specialization}',
-                "fullstack": 'site:linkedin.com/in/ ("Full Stack Engineer" OR "Full Stack Developer") {frontend_backend} {modern_stack}'
-            },
-            "tax_director": {
-                "primary": 'site:linkedin.com/in/ ("Tax Director" OR "Tax Manager" OR "Senior Tax Manager") {location} {experience} {tax_credentials}',
-                "specialized": 'site:linkedin.com/in/ "Tax Director" {company_size} {tax_specialization} {cpa_requirement}',
-                "industry_specific": 'site:linkedin.com/in/ ("Tax Director" OR "Tax Manager") {industry_focus} {compliance_experience}'
-            }
-        }
-        
-        # Keyword mappings for different domains
-        self.keyword_mappings = {
-            "cloud_platforms": {
-                "aws": ["AWS", "Amazon Web Services", "EC2", "S3", "Lambda"],
-                "azure": ["Azure", "Microsoft Azure", "AKS", "ARM"],
-                "gcp": ["GCP", "Google Cloud", "BigQuery", "GKE"]
-            },
-            "iac_tools": {
-                "terraform": ["Terraform", "HCL"],
-                "pulumi": ["Pulumi"],
-                "cloudformation": ["CloudFormation", "AWS CloudFormation"]
-            },
-            "ml_frameworks": {
-                "tensorflow": ["TensorFlow", "tf"],
-                "pytorch": ["PyTorch", "torch"],
-                "scikit": ["scikit-learn", "sklearn"]
-            },
-            "programming_languages": {
-                "python": ["Python"],
-                "javascript": ["JavaScript", "JS", "Node.js"],
-                "java": ["Java"],
-                "golang": ["Go", "Golang"]
-            },
-            "tax_credentials": {
-                "cpa": ["CPA", "Certified Public Accountant"],
-                "tax_llm": ["Tax LLM", "Master of Laws"],
-                "ea": ["EA", "Enrolled Agent"]
-            }
-        }
+    # OR-clause placeholders whose terms the packer picks to fill the query word budget
+    PACKED_PLACEHOLDERS = ("tech_stack", "programming_languages")
+    
+    def __init__(self, taxonomy_path: str = DEFAULT_TAXONOMY_PATH, packer: Optional[QueryPacker] = None):
+        # Role-specific query templates and keyword mappings live in data/taxonomy.json
+        self.taxonomy_path = taxonomy_path
+        self.packer = packer if packer is not None else QueryPacker()
+        # Placeholder values per JobProfile, shared by every strategy and call for that profile
+        self._placeholder_values: "WeakKeyDictionary[JobProfile, PlaceholderValues]" = WeakKeyDictionary()
+    
+    @property
+    def query_templates(self) -> Dict[str, Dict[str, str]]:
+        return get_taxonomy(self.taxonomy_path).query_templates
     
-    def generate_queries(self, job_analysis: Dict[str, Any], job_description: str, max_queries: int = 3) -> List[Dict[str, Any]]:
-        """Generate multiple optimized search queries based on job analysis"""
+    @property
+    def keyword_mappings(self) -> Dict[str, Dict[str, List[str]]]:
+        return get_taxonomy(self.taxonomy_path).keyword_mappings
+    
+    @property
+    def compiled_templates(self) -> Dict[str, Dict[str, CompiledTemplate]]:
+        """query_templates parsed once per taxonomy load"""
+        return get_taxonomy(self.taxonomy_path).compiled_templates
+    
+    def placeholder_values(self, profile: JobProfile) -> PlaceholderValues:
+        """Lazily resolved placeholder values for a profile, cached while the profile is alive"""
+        values = self._placeholder_values.get(profile)
+        if values is None:
+            values = self._placeholder_values[profile] = PlaceholderValues(self, profile)
+        return values
+    
+    def generate_queries(self, job: Union[JobProfile, Dict[str, Any]], job_description: str = "",
+                         max_queries: int = 3) -> List[Dict[str, Any]]:
+        """Generate multiple optimized search queries based on job analysis.
+        
+        Takes a JobProfile, or a job_analysis dict plus its job description.
+        """
+        profile = job if isinstance(job, JobProfile) else JobProfile.from_analysis(job, job_description)
         
         # Determine query strategy based on job family
-        role_key = self._map_to_role_key(job_analysis["job_family"], job_description)
+        role_key = self._map_to_role_key(profile)
         
         # Get templates for this role
-        templates = self.query_templates.get(role_key, self.query_templates["software_engineer"])
+        compiled_templates = self.compiled_templates
+        templates = compiled_templates.get(role_key, compiled_templates["software_engineer"])
+        values = self.placeholder_values(profile)
         
         queries = []
         
         # Generate primary query
-        primary_query = self._build_query(
-            templates["primary"], 
-            job_analysis, 
-            job_description,
-            strategy="primary"
-        )
         queries.append({
-            "query": primary_query,
+            "query": self._render(templates["primary"], values),
             "strategy": "primary",
             "description": "Broad role-based search with core requirements"
         })
         
         # Generate specialized query
         if "specialized" in templates:
-            specialized_query = self._build_query(
-                templates["specialized"], 
-                job_analysis, 
-                job_description,
-                strategy="specialized"
-            )
             queries.append({
-                "query": specialized_query,
+                "query": self._render(templates["specialized"], values),
                 "strategy": "specialized", 
                 "description": "Targeted search with specific tech stack and company context"
             })
@@ -258,80 +350,80 @@ class QueryGenerator:
         # Generate industry-specific or alternative query
         third_template_key = list(templates.keys())[2] if len(templates) > 2 else "specialized"
         if third_template_key in templates:
-            industry_query = self._build_query(
-                templates[third_template_key], 
-                job_analysis, 
-                job_description,
-                strategy="industry_specific"
-            )
             queries.append({
-                "query": industry_query,
+                "query": self._render(templates[third_template_key], values),
                 "strategy": third_template_key,
                 "description": "Industry or domain-specific search"
             })
         
         return queries[:max_queries]
     
-    def _map_to_role_key(self, job_family: str, job_description: str) -> str:
+    def _render(self, template: CompiledTemplate, values: PlaceholderValues) -> str:
+        """Render a template, letting the packer fill its OR-clause placeholders"""
+        packed = [placeholder for placeholder in template.placeholders if placeholder in self.PACKED_PLACEHOLDERS]
+        if not packed:
+            return template.render(values)
+        
+        candidates = {placeholder: self._placeholder_candidates(placeholder, values.profile) for placeholder in packed}
+        return self.packer.pack(template, values, candidates)
+    
+    def _placeholder_candidates(self, placeholder: str, profile: JobProfile) -> List[str]:
+        """Ranked terms a packed placeholder may use, most relevant first"""
+        if placeholder == "tech_stack":
+            # Round-robin over categories so the first terms cover the whole stack
+            per_category = [skills for skills in profile.skills.values() if skills]
+            ranked = [skills[i] for i in range(max(map(len, per_category), default=0))
+                      for skills in per_category if i < len(skills)]
+            return [f'"{term}"' for term in ranked]
+        
+        elif placeholder == "programming_languages":
+            return [language.capitalize() for language in profile.skills.get("programming", ())]
+        
+        return []
+    
+    def _map_to_role_key(self, profile: JobProfile) -> str:
         """Map job family to specific role template key"""
-        text = job_description.lower()
+        job_family = profile.job_family
+        text = profile.index
         
         if job_family == "engineering":
-            if any(term in text for term in ["devops", "infrastructure", "site reliability", "platform"]):
+            # "Engineer" puts ML roles in the engineering family; the title phrase wins
+            if text.contains_any(["ml engineer", "machine learning engineer", "ai engineer"]):
+                return "ml_engineer"
+            elif text.contains_any(["devops", "infrastructure", "site reliability", "platform"]):
                 return "devops_engineer"
             else:
                 return "software_engineer"
         elif job_family == "data":
-            if any(term in text for term in ["ml engineer", "machine learning", "ai engineer"]):
+            if text.contains_any(["ml engineer", "machine learning", "ai engineer"]):
                 return "ml_engineer"
             else:
                 return "software_engineer"
         elif job_family == "finance":
-            if any(term in text for term in ["tax director", "tax manager", "tax"]):
+            if text.contains_any(["tax director", "tax manager", "tax"]):
                 return "tax_director"
             else:
                 return "software_engineer"
         else:
             return "software_engineer"
     
-    def _build_query(self, template: str, job_analysis: Dict[str, Any], job_description: str, strategy: str) -> str:
-        """Build a specific query from template and job analysis"""
-        
-        # Extract placeholders from template
-        placeholders = re.findall(r'\{([^}]+)\}', template)
-        
-        # Generate replacement values
-        replacements = {}
-        for placeholder in placeholders:
-            replacements[placeholder] = self._generate_placeholder_value(
-                placeholder, job_analysis, job_description, strategy
-            )
-        
-        # Replace placeholders
-        query = template
-        for placeholder, value in replacements.items():
-            query = query.replace(f"{{{placeholder}}}", value)
-        
-        # Clean up query
-        query = re.sub(r'\s+', ' ', query)  # Multiple spaces to single
-        query = re.sub(r'\(\s*\)', '', query)  # Empty parentheses
-        query = query.strip()
-        
-        return query
-    
-    def _generate_placeholder_value(self, placeholder: str, job_analysis: Dict[str, Any], job_description: str, strategy: str) -> str:
+    def _generate_placeholder_value(self, placeholder: str, profile: JobProfile, strategy: str) -> str:
         """Generate value for a specific placeholder"""
         
-        text = job_description.lower()
+        text = profile.index
         
         if placeholder == "location":
-            locations = job_analysis.get("locations", [])
-            if locations:
-                return f'"{locations[0]}"'
+            # First city or region, searched by its metro name too; remote and country-wide roles get no location term
+            places = [location for location in profile.location_details if location.kind in ("city", "region")]
+            if places:
+                term_strings = [f'"{term}"' for term in places[0].search_terms]
+                return f'({" OR ".join(term_strings)})' if len(term_strings) > 1 else term_strings[0]
+            if profile.locations and not profile.location_details:
+                return f'"{profile.locations[0]}"'
             return ""
         
         elif placeholder == "experience":
-            seniority = job_analysis.get("seniority", "mid")
+            seniority = profile.seniority
             if seniority == "senior":
                 return '"5+ years" OR "6+ years" OR "senior"'
             elif seniority == "mid":
@@ -339,7 +431,7 @@ class QueryGenerator:
             return ""
         
         elif placeholder == "tech_stack":
-            skills = job_analysis.get("skills", {})
+            skills = profile.skills
             tech_terms = []
             for category, skill_list in skills.items():
                 tech_terms.extend(skill_list[:2])  # Top 2 from each category
@@ -350,42 +442,42 @@ class QueryGenerator:
             return ""
         
         elif placeholder == "cloud_platforms":
-            if any(term in text for term in ["aws", "amazon web services"]):
+            if text.contains_any(["aws", "amazon web services"]):
                 return "AWS OR Amazon Web Services"
-            elif any(term in text for term in ["azure", "microsoft azure"]):
+            elif text.contains_any(["azure", "microsoft azure"]):
                 return "Azure OR Microsoft Azure"
-            elif any(term in text for term in ["gcp", "google cloud"]):
+            elif text.contains_any(["gcp", "google cloud"]):
                 return "GCP OR Google Cloud"
             return "AWS OR Azure OR GCP"
         
         elif placeholder == "iac_tools":
-            if "pulumi" in text:
+            if text.contains("pulumi"):
                 return '"Pulumi"'
-            elif "terraform" in text:
+            elif text.contains("terraform"):
                 return '"Terraform"'
             return '"Infrastructure as Code" OR "IaC"'
         
         elif placeholder == "ml_frameworks":
             frameworks = []
-            if "tensorflow" in text:
+            if text.contains("tensorflow"):
                 frameworks.append("TensorFlow")
-            if "pytorch" in text:
+            if text.contains("pytorch"):
                 frameworks.append("PyTorch")
             if frameworks:
                 return f'({" OR ".join(frameworks)})'
             return "(TensorFlow OR PyTorch OR scikit-learn)"
         
         elif placeholder == "company_context":
-            if any(term in text for term in ["startup", "series"]):
+            if text.contains_any(["startup", "series"]):
                 return "(startup OR early stage OR series)"
-            elif any(term in text for term in ["enterprise", "large"]):
+            elif text.contains_any(["enterprise", "large"]):
                 return "(enterprise OR large company)"
             return ""
         
         elif placeholder == "programming_languages":
             languages = []
             for lang in ["python", "javascript", "java", "golang", "typescript"]:
-                if lang in text:
+                if text.contains(lang):
                     languages.append(lang.capitalize())
             
             if languages:
@@ -396,7 +488,7 @@ class QueryGenerator:
             return '"CPA" OR "Certified Public Accountant"'
         
         elif placeholder == "industry_context":
-            industry = job_analysis.get("industry", "tech")
+            industry = profile.industry
             if industry == "tech":
                 return "(startup OR early stage OR seed OR series)"
             elif industry == "finance":
@@ -406,16 +498,55 @@ class QueryGenerator:
         # Default empty for unknown placeholders
         return ""
 
+@dataclass
+class SearchEvent:
+    """Progress event emitted by AdvancedSourcingAgent.search_candidates_stream"""
+    type: str
+    data: Dict[str, Any] = field(default_factory=dict)
+    
+    ANALYSIS = "analysis"
+    QUERY = "query"
+    CANDIDATE = "candidate"
+    FINAL = "final"
+
 class AdvancedSourcingAgent:
     """Advanced sourcing agent with role-specific query generation and smart evaluation"""
     
-    def __init__(self):
+    def __init__(self, max_concurrent_evaluations: int = 4, evaluation_batch_size: int = 1,
+                 prescreen_keep_fraction: float = 0.5, prescreen_min_score: Optional[float] = None,
+                 stop_score: Optional[float] = None, stop_count: Optional[int] = None,
+                 search_budget: Optional[int] = None):
         self.analyzer = JobDescriptionAnalyzer()
-        self.query_generator = QueryGenerator()
+        # Term yields from past searches steer which skills the packer fits into queries
+        self.query_generator = QueryGenerator(packer=QueryPacker(term_stats=TermStats(path=os.getenv("SRN_TERM_STATS_PATH"))))
         self.smart_evaluator = SmartEvaluator()
         
-        # Performance tracking
-        self.query_performance = []
+        # Local pre-scoring prunes clear mismatches before any LLM call
+        self.pre_scorer = CandidatePreScorer(self.analyzer)
+        self.prescreen_keep_fraction = prescreen_keep_fraction
+        self.prescreen_min_score = prescreen_min_score
+        
+        # Candidate evaluations are network bound, so run several at once
+        self.evaluation_executor = EvaluationExecutor(max_workers=max_concurrent_evaluations)
+        
+        # Candidates scored per LLM call; 1 keeps one prompt per candidate
+        self.evaluation_batch_size = max(1, evaluation_batch_size)
+        
+        # Top-k early stop: once stop_count candidates (default num_candidates)
+        # score at least stop_score, pending evaluations are cancelled
+        self.stop_score = stop_score
+        self.stop_count = stop_count
+        
+        # Performance tracking: recent queries plus running aggregates, persisted to SQLite
+        self.query_performance = QueryPerformanceStore()
+        
+        # Skips queries whose profiles earlier queries (or past searches) already returned
+        self.query_overlap = QueryOverlapEstimator(path=os.getenv("SRN_QUERY_HISTORY_PATH"))
+        
+        # Search calls per search (default one per planned query), spread over
+        # strategies and result pages by their past yield for the role
+        self.search_budget = search_budget
+        self.strategy_bandit = StrategyBandit(path=os.getenv("SRN_STRATEGY_STATS_PATH"))
         
         # API configuration
         self.search_url = "https://www.googleapis.com/customsearch/v1"
@@ -423,29 +554,105 @@ class AdvancedSourcingAgent:
         self.search_engine_id = st.secrets["SEARCH_ENGINE_ID"]
     def search_candidates(self, job_description: str, num_candidates: int = 10) -> Dict[str, Any]:
         """Enhanced candidate search with smart evaluation"""
+        results = {}
+        for event in self.search_candidates_stream(job_description, num_candidates):
+            if event.type == SearchEvent.FINAL:
+                results = event.data
+        return results
+    
+    def search_candidates_stream(self, job_description: str, num_candidates: int = 10) -> Iterator["SearchEvent"]:
+        """Run the candidate search, yielding SearchEvents as each stage produces results.
+        
+        Yields one ANALYSIS event, a QUERY event per executed query, a CANDIDATE
+        event per evaluated candidate (in completion order) and a FINAL event
+        whose data is the same dict search_candidates returns.
+        
+        With ``stop_score`` set, evaluation stops as soon as enough candidates
+        reach it and the remaining evaluations are cancelled.
+        """
         print(f"🚀 Starting advanced candidate search for {num_candidates} candidates...")
         start_time = time.time()
         
-        # Step 1: Analyze job description
+        # Step 1: Analyze job description once; every later stage reads this profile
         print("📊 Analyzing job description...")
-        job_analysis = self.analyzer.analyze_job(job_description)
-        print(f"✅ Analysis complete: {job_analysis['job_family']} role, {job_analysis['seniority']} level")
+        job_profile = self.analyzer.build_profile(job_description, self.smart_evaluator.context_detector)
+        job_analysis = job_profile.as_analysis()
+        print(f"✅ Analysis complete: {job_profile.job_family} role, {job_profile.seniority} level")
         
         # Step 2: Generate targeted search queries
         print("🎯 Generating targeted search queries...")
-        queries = self.query_generator.generate_queries(job_analysis, job_description)
+        queries = self.query_generator.generate_queries(job_profile)
         print(f"✅ Generated {len(queries)} specialized queries")
         
+        # Merge or drop near-duplicate queries before spending search calls on them
+        queries, skipped_queries = self.query_overlap.plan(queries)
+        for query_info in skipped_queries:
+            print(f"⏭️ Skipping {query_info['strategy']} query: {query_info['skip_reason']}")
+        
+        # Spend the call budget on the strategies that paid off for this role before
+        role_key = self.query_generator._map_to_role_key(job_profile)
+        allocation = self.strategy_bandit.allocate(
+            role_key, [query_info["strategy"] for query_info in queries], self.search_budget or len(queries)
+        )
+        queries = sorted(queries, key=lambda query_info: list(allocation).index(query_info["strategy"]))
+        for query_info in queries:
+            query_info["pages"] = allocation[query_info["strategy"]]
+        for query_info in [query_info for query_info in queries if not query_info["pages"]]:
+            print(f"⏭️ Skipping {query_info['strategy']} query: no search budget allocated")
+            skipped_queries.append({**query_info, "skip_reason": "no search budget allocated"})
+        queries = [query_info for query_info in queries if query_info["pages"]]
+        
+        yield SearchEvent(SearchEvent.ANALYSIS, {
+            "job_analysis": job_analysis,
+            "queries": queries,
+            "skipped_queries": list(skipped_queries)
+        })
+        
         # Step 3: Execute searches
         all_candidates = []
         unique_urls = set()
+        executed_queries = []
+        # This search's query outcomes; the store's recent() also holds earlier searches and processes
+        query_records = []
+        # Strategy that first found each profile, and search calls made per strategy
+        found_by = {}
+        calls_by_strategy = {}
+        results_per_page = min(num_candidates, 10)
         
         for i, query_info in enumerate(queries):
-            print(f"🔍 Executing query {i+1}/{len(queries)}:")
             query = query_info["query"]
             
-            # Execute search
-            results = self._execute_search(query, num_candidates)
+            # Past result sets say most of this query's profiles are already in hand
+            overlap = self.query_overlap.overlap_with(query, executed_queries)
+            if overlap >= self.query_overlap.threshold:
+                skip_reason = f"~{overlap:.0%} of its profiles already found"
+                print(f"⏭️ Skipping query {i+1}/{len(queries)}: {skip_reason}")
+                skipped_queries.append({**query_info, "skip_reason": skip_reason})
+                yield SearchEvent(SearchEvent.QUERY, {
+                    "index": i,
+                    "total": len(queries),
+                    "query_info": query_info,
+                    "skipped": True,
+                    "skip_reason": skip_reason,
+                    "total_results": 0,
+                    "linkedin_profiles": 0,
+                    "unique_candidates": len(all_candidates)
+                })
+                continue
+            
+            print(f"🔍 Executing query {i+1}/{len(queries)}:")
+            
+            # Execute search, one call per allocated page; a short page means no more results
+            results = []
+            for page in range(query_info["pages"]):
+                page_results = self._execute_search(query, num_candidates, start=1 + page * results_per_page)
+                calls_by_strategy[query_info["strategy"]] = calls_by_strategy.get(query_info["strategy"], 0) + 1
+                results.extend(page_results)
+                if len(page_results) < results_per_page:
+                    break
+            executed_queries.append(query)
+            linkedin_profiles = []
+            new_profiles = 0
             
             if results:
                 print(f"📈 Found {len(results)} total results, returned {len(results)} items")
@@ -454,31 +661,67 @@ class AdvancedSourcingAgent:
                 linkedin_profiles = self._filter_linkedin_profiles(results)
                 print(f"🎯 Filtered to {len(linkedin_profiles)} LinkedIn profiles")
                 
-                # Track performance
-                self.query_performance.append({
-                    "query": query[:80] + "..." if len(query) > 80 else query,
-                    "total_results": len(results),
-                    "linkedin_profiles": len(linkedin_profiles),
-                    "strategy": query_info["strategy"]
-                })
-                
                 # Deduplicate based on URL
                 for profile in linkedin_profiles:
                     if profile["link"] not in unique_urls:
                         unique_urls.add(profile["link"])
                         all_candidates.append(profile)
+                        found_by[profile["link"]] = query_info["strategy"]
+                        new_profiles += 1
+                
+                # Track performance
+                query_records.append(self.query_performance.record(
+                    query, query_info["strategy"], len(results), len(linkedin_profiles), new_profiles, role_key
+                ))
+            
+            self.query_overlap.record(query, [profile["link"] for profile in linkedin_profiles])
+            self.query_generator.packer.term_stats.record(query, len(results), len(linkedin_profiles), new_profiles)
+            
+            yield SearchEvent(SearchEvent.QUERY, {
+                "index": i,
+                "total": len(queries),
+                "query_info": query_info,
+                "skipped": False,
+                "pages": query_info["pages"],
+                "total_results": len(results),
+                "linkedin_profiles": len(linkedin_profiles),
+                "unique_candidates": len(all_candidates)
+            })
         
         print(f"🎯 Found {len(all_candidates)} unique profiles after deduplication")
         
         # Step 4: Smart evaluation using SRN FitScore
-        evaluated_candidates = []
         candidates_to_evaluate = all_candidates[:min(num_candidates*2, len(all_candidates))]
         
-        for i, candidate in enumerate(candidates_to_evaluate):
-            print(f"📈 Evaluating candidate {i+1}/{len(candidates_to_evaluate)}")
-            
-            # Use SmartEvaluator for comprehensive assessment
-            smart_assessment = self.smart_evaluator.evaluate_candidate_smart(candidate, job_description)
+        # Local pre-screen: only the most promising candidates reach the LLM stage
+        candidates_to_evaluate, prescreened_out = self.pre_scorer.select(
+            candidates_to_evaluate,
+            job_profile,
+            keep_fraction=self.prescreen_keep_fraction,
+            min_score=self.prescreen_min_score,
+            min_keep=num_candidates
+        )
+        print(f"🧹 Pre-screen kept {len(candidates_to_evaluate)} candidates, pruned {len(prescreened_out)}")
+        
+        # Context and hiring criteria are generated once per job, not per candidate
+        prepared_job = self.smart_evaluator.prepare_job(job_profile)
+        
+        # Bounded top-k heap; ties rank by input order exactly as a sequential run would
+        top_k = TopKCollector(num_candidates, self.stop_score, self.stop_count)
+        completed = 0
+        evaluated_scores = {}
+        
+        evaluation_order = list(range(len(candidates_to_evaluate)))
+        if self.stop_score is not None:
+            # Evaluate the most promising candidates first so the stop rule is met sooner
+            evaluation_order.sort(key=lambda i: -candidates_to_evaluate[i]["pre_score"])
+        
+        evaluations = self._iter_evaluations(
+            [candidates_to_evaluate[i] for i in evaluation_order], prepared_job
+        )
+        for position, smart_assessment in evaluations:
+            index = evaluation_order[position]
+            candidate = candidates_to_evaluate[index]
             
             # Combine original profile with smart assessment
             enhanced_candidate = {
@@ -490,27 +733,109 @@ class AdvancedSourcingAgent:
                 "hiring_criteria": smart_assessment["hiring_criteria"]
             }
             
-            evaluated_candidates.append(enhanced_candidate)
+            top_k.push(enhanced_candidate["fit_score"], index, enhanced_candidate)
+            evaluated_scores[candidate["link"]] = enhanced_candidate["fit_score"]
+            completed += 1
+            print(f"📈 Evaluated candidate {completed}/{len(candidates_to_evaluate)}")
+            
+            yield SearchEvent(SearchEvent.CANDIDATE, {
+                "candidate": enhanced_candidate,
+                "completed": completed,
+                "total": len(candidates_to_evaluate)
+            })
+            
+            if top_k.settled:
+                print(f"🏁 {top_k.strong_count} candidates scored {self.stop_score}+, stopping evaluation early")
+                evaluations.close()
+                break
+        
+        # Step 5: Return top candidates, best first
+        top_candidates = top_k.results()
         
-        # Step 5: Sort by fit score and return top candidates
-        evaluated_candidates.sort(key=lambda x: x["fit_score"], reverse=True)
-        top_candidates = evaluated_candidates[:num_candidates]
+        self._record_strategy_outcomes(role_key, found_by, calls_by_strategy, results_per_page,
+                                       evaluated_scores, prescreened_out)
+        self.query_performance.flush()
         
         end_time = time.time()
         print(f"✅ Search completed in {end_time - start_time:.2f} seconds")
         print(f"🏆 Returning {len(top_candidates)} top candidates")
         
-        return {
+        yield SearchEvent(SearchEvent.FINAL, {
             "candidates": top_candidates,
             "job_analysis": job_analysis,
             "queries_used": queries,
-            "query_performance": self.query_performance,
+            "queries_skipped": skipped_queries,
+            "query_performance": query_records,
             "total_time": end_time - start_time,
-            "total_found": len(all_candidates)
-        }
+            "total_found": len(all_candidates),
+            "prescreened_out": len(prescreened_out),
+            "evaluations_skipped": len(candidates_to_evaluate) - completed
+        })
+    
+    def _record_strategy_outcomes(self, role_key: str, found_by: Dict[str, str], calls_by_strategy: Dict[str, int],
+                                  results_per_page: int, evaluated_scores: Dict[str, float],
+                                  prescreened_out: List[Dict]) -> None:
+        """Credit each strategy with its unique profiles, weighted by how well they scored"""
+        pruned = {candidate["link"] for candidate in prescreened_out}
+        rewards = dict.fromkeys(calls_by_strategy, 0.0)
+        for url, strategy in found_by.items():
+            if url in evaluated_scores:
+                rewards[strategy] += min(max(evaluated_scores[url] / 10.0, 0.0), 1.0)
+            elif url not in pruned:
+                # Found but never evaluated (past the evaluation cut or an early stop): unknown quality
+                rewards[strategy] += 0.5
+        
+        for strategy, calls in calls_by_strategy.items():
+            self.strategy_bandit.record(role_key, strategy, calls, calls * results_per_page, rewards[strategy])
+    
+    def _iter_evaluations(self, candidates: List[Dict], prepared_job: Dict[str, Any]) -> Iterator[tuple]:
+        """Run SRN FitScore evaluations concurrently, yielding (index, assessment) as they finish.
+        
+        A candidate whose evaluation raises is reported and left out, so one
+        failure does not end the search without its FINAL event.
+        """
+        if self.evaluation_batch_size == 1:
+            # Use SmartEvaluator for comprehensive assessment
+            def evaluate(candidate: Dict) -> Optional[Dict[str, Any]]:
+                try:
+                    return self.smart_evaluator.evaluate_prepared(candidate, prepared_job)
+                except Exception as e:
+                    print(f"❌ Evaluation failed for {candidate.get('link', 'candidate')}: {e}")
+                    return None
+            
+            completed = self.evaluation_executor.iter_completed(evaluate, candidates)
+            try:
+                for index, assessment in completed:
+                    if assessment is not None:
+                        yield index, assessment
+            finally:
+                completed.close()
+            return
+        
+        def evaluate_batch(batch: List[Dict]) -> List[Dict[str, Any]]:
+            try:
+                return self.smart_evaluator.evaluate_batch(batch, prepared_job, self.evaluation_batch_size)
+            except Exception as e:
+                print(f"❌ Evaluation failed for a batch of {len(batch)} candidates: {e}")
+                return []
+        
+        # Batch mode: score several candidates per call, batches run concurrently
+        batches = [
+            candidates[i:i + self.evaluation_batch_size]
+            for i in range(0, len(candidates), self.evaluation_batch_size)
+        ]
+        completed_batches = self.evaluation_executor.iter_completed(evaluate_batch, batches)
+        try:
+            for batch_index, assessments in completed_batches:
+                offset = batch_index * self.evaluation_batch_size
+                for i, assessment in enumerate(assessments):
+                    yield offset + i, assessment
+        finally:
+            # Propagate an early stop so queued batches are cancelled
+            completed_batches.close()
     
-    def _execute_search(self, query: str, num_results: int = 10) -> List[Dict]:
-        """Execute Google search for LinkedIn profiles"""
+    def _execute_search(self, query: str, num_results: int = 10, start: int = 1) -> List[Dict]:
+        """Execute Google search for LinkedIn profiles, from result ``start`` (1-based)"""
         print(f"🔍 Executing query: {query[:100]}...")
         
         try:
@@ -518,10 +843,11 @@ class AdvancedSourcingAgent:
                 "key": self.api_key,
                 "cx": self.search_engine_id,
                 "q": query,
-                "num": min(num_results, 10)  # Google API limit
+                "num": min(num_results, 10),  # Google API limit
+                "start": start
             }
             
-            response = requests.get(self.search_url, params=params)
+            response = get_http_client().get(self.search_url, params=params)
             response.raise_for_status()
             
             data = response.json()
@@ -556,8 +882,9 @@ class AdvancedSourcingAgent:
         return linkedin_profiles
     
     def get_performance_summary(self) -> Dict[str, Any]:
-        """Get query performance analytics"""
-        if not self.query_performance:
+        """Get query performance analytics from the store's running aggregates"""
+        summary = self.query_performance.summary()
+        if not summary["queries"]:
             return {
                 "message": "No performance data available",
                 "total_queries": 0,
@@ -567,10 +894,12 @@ class AdvancedSourcingAgent:
             }
         
         return {
-            "total_queries": len(self.query_performance),
-            "queries": self.query_performance,
-            "avg_linkedin_profiles": sum(q["linkedin_profiles"] for q in self.query_performance) / len(self.query_performance),
-            "success_rate": sum(1 for q in self.query_performance if q["linkedin_profiles"] > 0) / len(self.query_performance) * 100
+            "total_queries": summary["queries"],
+            "queries": self.query_performance.recent(),
+            "avg_linkedin_profiles": summary["avg_linkedin_profiles"],
+            "success_rate": summary["success_rate"],
+            "by_strategy": summary["by_strategy"],
+            "by_role": summary["by_role"]
         }
 
 if __name__ == "__main__":
@@ -0,0 +1,283 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Any, Callable, Iterator, Sequence
+
+from advanced_sourcing_agent import JobDescriptionAnalyzer, QueryGenerator
+from smart_evaluator import SmartContextDetector
+from location_engine import DEFAULT_GAZETTEER_PATH
+from memo_cache import ContentMemo
+from sample_jobs import get_sample_jobs
+
+# Relative change in throughput or p99 latency reported as a regression by --compare
+REGRESSION_THRESHOLD = 0.10
+# Timed passes per stage; the median pass is reported
+DEFAULT_REPEATS = 5
+
+
+def synthetic_job_descriptions(count: int, seed: int = 42) -> Iterator[str]:
+    """Seeded synthetic JDs from the sample jobs, the taxonomy keyword tables and the gazetteer.
+
+    Each JD gets a title from the seniority and role tables, an optional
+    location line, shuffled lines of the sample jobs and a random keyword list.
+    """
+    rng = random.Random(seed)
+    analyzer = JobDescriptionAnalyzer()
+    detector = SmartContextDetector()
+
+    lines = [line.strip() for job in get_sample_jobs().values() for line in job.splitlines() if line.strip()]
+    keywords = sorted({
+        keyword
+        for tables in (analyzer.keyword_tables, detector.keyword_tables)
+        for table in tables.values()
+        for table_keywords in table.values()
+        for keyword in table_keywords
+    } | {skill for skills in analyzer.technical_skills.values() for skill in skills}
+      | {synonym for synonyms in analyzer.taxonomy.skill_synonyms.values() for synonym in synonyms})
+    seniorities = [keyword for keywords in analyzer.seniority_levels.values() for keyword in keywords]
+    roles = list(detector.role_types)
+
+    with open(DEFAULT_GAZETTEER_PATH, encoding="utf-8") as f:
+        cities = [f"{name}, {region or country}" for name, country, region, _, _ in json.load(f)["cities"]]
+
+    for _ in range(count):
+        header = [f"{rng.choice(seniorities).title()} {rng.choice(roles)}"]
+        if rng.random() < 0.7:
+            header.append(f"Location: {rng.choice(cities)}" + (" (Remote OK)" if rng.random() < 0.3 else ""))
+        body = rng.sample(lines, k=min(len(lines), rng.randint(10, 40)))
+        extras = ", ".join(rng.sample(keywords, k=rng.randint(3, 12)))
+        yield "\n".join(header + body + [f"Nice to have: {extras}"])
+
+
+def _percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _timed_pass(function: Callable[[Any], Any], inputs: Sequence[Any]) -> Dict[str, float]:
+    """Throughput and p50/p99 latency of one pass over the inputs"""
+    latencies = []
+    start = time.perf_counter()
+    for item in inputs:
+        call_start = time.perf_counter_ns()
+        function(item)
+        latencies.append(time.perf_counter_ns() - call_start)
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "throughput": len(inputs) / elapsed,
+        "p50_ms": _percentile(latencies, 0.50) / 1e6,
+        "p99_ms": _percentile(latencies, 0.99) / 1e6
+    }
+
+
+def _median(values: Sequence[float]) -> float:
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    return ordered[middle] if len(ordered) % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def measure_stage(name: str, function: Callable[[Any], Any], inputs: Sequence[Any],
+                  repeats: int = DEFAULT_REPEATS, memory_sample: int = 200) -> Dict[str, Any]:
+    """Throughput, p50/p99 latency and traced peak memory of calling ``function`` on each input.
+
+    An untimed warmup pass fills caches and lazy tables, then ``repeats``
+    timed passes run and the median of each metric is reported. ``noise`` is
+    twice the larger relative median absolute deviation of throughput and
+    p99 across those passes (robust to one stalled pass), so --compare can
+    tell a real change from run-to-run variation. Peak memory
+    comes from a further pass over the first ``memory_sample`` inputs under
+    tracemalloc, which slows calls.
+    """
+    for item in inputs:
+        function(item)
+
+    passes = [_timed_pass(function, inputs) for _ in range(max(1, repeats))]
+    metrics = {metric: _median([result[metric] for result in passes]) for metric in ("throughput", "p50_ms", "p99_ms")}
+    noise = max(
+        2 * _median([abs(result[metric] - metrics[metric]) for result in passes]) / metrics[metric]
+        for metric in ("throughput", "p99_ms") if metrics[metric]
+    )
+
+    tracemalloc.start()
+    try:
+        for item in inputs[:memory_sample]:
+            function(item)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "stage": name,
+        "calls": len(inputs),
+        "repeats": len(passes),
+        **metrics,
+        "noise": noise,
+        "peak_kb": peak / 1024
+    }
+
+
+def run_stages(count: int, seed: int = 42, repeats: int = DEFAULT_REPEATS) -> Dict[str, Any]:
+    """Benchmark analyze_job, detect_context and generate_queries on one synthetic corpus"""
+    corpus = list(synthetic_job_descriptions(count, seed))
+    print(f"📚 Corpus: {len(corpus)} synthetic JDs (seed {seed}), {sum(len(jd) for jd in corpus) / len(corpus):.0f} chars avg")
+
+    # Memos that keep nothing, so every call does the full work
+    analyzer = JobDescriptionAnalyzer(memo=ContentMemo(max_entries=0))
+    detector = SmartContextDetector(memo=ContentMemo(max_entries=0))
+    generator = QueryGenerator()
+
+    # Also loads the taxonomy and gazetteer outside the timed loops
+    profiles = [analyzer.build_profile(jd) for jd in corpus]
+
+    results = [
+        measure_stage("analyze_job", analyzer.analyze_job, corpus, repeats),
+        measure_stage("detect_context", detector.detect_context, corpus, repeats),
+        measure_stage("generate_queries", generator.generate_queries, profiles, repeats)
+    ]
+
+    print(f"Median of {repeats} timed pass(es) after one warmup pass")
+    print(f"{'stage':<18}{'calls/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'noise':>8}{'peak KB':>10}")
+    for result in results:
+        print(f"{result['stage']:<18}{result['throughput']:>10.0f}{result['p50_ms']:>10.3f}"
+              f"{result['p99_ms']:>10.3f}{result['noise']:>8.0%}{result['peak_kb']:>10.0f}")
+
+    return {
+        "jobs": count,
+        "seed": seed,
+        "python": sys.version.split()[0],
+        "stages": {result["stage"]: result for result in results}
+    }
+
+
+def save_baseline(report: Dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"💾 Baseline saved to {path}")
+
+
+def compare_baseline(report: Dict[str, Any], path: str, threshold: float = REGRESSION_THRESHOLD) -> List[str]:
+    """Print per-stage changes against a saved baseline; returns the regressed stages.
+
+    A stage regresses when throughput drops or p99 grows by more than
+    ``threshold`` and by more than the run-to-run noise of either run.
+    """
+    with open(path, encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    if (baseline.get("jobs"), baseline.get("seed")) != (report["jobs"], report["seed"]):
+        print(f"⚠️ Baseline used {baseline.get('jobs')} jobs with seed {baseline.get('seed')}; numbers are not directly comparable")
+
+    regressions = []
+    for stage, result in report["stages"].items():
+        previous = baseline.get("stages", {}).get(stage)
+        if previous is None:
+            print(f"🆕 {stage}: no baseline")
+            continue
+
+        throughput_change = result["throughput"] / previous["throughput"] - 1
+        p99_change = result["p99_ms"] / previous["p99_ms"] - 1 if previous["p99_ms"] else 0.0
+        memory_change = result["peak_kb"] / previous["peak_kb"] - 1 if previous["peak_kb"] else 0.0
+
+        # Baselines saved before repeated passes carry no noise estimate
+        limit = max(threshold, result.get("noise", 0.0), previous.get("noise", 0.0))
+        regressed = throughput_change < -limit or p99_change > limit
+        if regressed:
+            regressions.append(stage)
+        print(f"{'❌' if regressed else '✅'} {stage:<18} throughput {throughput_change:+.1%}  "
+              f"p99 {p99_change:+.1%}  peak memory {memory_change:+.1%}  (limit ±{limit:.0%})")
+    return regressions
+
+
+def available_cores() -> int:
+    """CPUs this process may run on (respects affinity masks and container limits where exposed)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def default_worker_counts(cores: int) -> List[int]:
+    """1, 2, 4 ... up to the core count, and at least up to 4 so the sweep always has a shape"""
+    limit = max(cores, 4)
+    return sorted({1, cores, *[2 ** i for i in range(1, limit.bit_length()) if 2 ** i <= limit]})
+
+
+def run_parallel(count: int, worker_counts: List[int], chunk_size: int, seed: int = 42) -> Dict[str, Any]:
+    """Sweep analyze_jobs over process pool sizes; throughput, speedup and efficiency per worker count.
+
+    Efficiency is speedup per core actually usable by that many workers, so
+    1.0 is linear scaling; counts above the available cores are oversubscribed
+    and cannot scale further.
+    """
+    analyzer = JobDescriptionAnalyzer()
+    corpus = list(synthetic_job_descriptions(count, seed))
+    cores = available_cores()
+    print(f"📚 Corpus: {len(corpus)} synthetic JDs (seed {seed}), {sum(len(jd) for jd in corpus) / len(corpus):.0f} chars avg")
+    print(f"🖥️ {cores} usable core(s)")
+    if max(worker_counts) > cores:
+        print(f"⚠️ Worker counts above {cores} are oversubscribed; run on a multi-core machine to measure scaling")
+
+    sweep = []
+    baseline = None
+    print(f"{'workers':<10}{'JDs/s':>10}{'seconds':>10}{'speedup':>10}{'efficiency':>12}")
+    for workers in worker_counts:
+        start = time.perf_counter()
+        analyzed = sum(1 for _ in analyzer.analyze_jobs(corpus, workers=workers, chunk_size=chunk_size))
+        elapsed = time.perf_counter() - start
+
+        throughput = analyzed / elapsed
+        baseline = baseline or throughput
+        speedup = throughput / baseline
+        efficiency = speedup / min(workers, cores)
+        sweep.append({
+            "workers": workers,
+            "throughput": throughput,
+            "seconds": elapsed,
+            "speedup": speedup,
+            "efficiency": efficiency
+        })
+        print(f"{workers:<10}{throughput:>10.0f}{elapsed:>10.2f}{speedup:>9.2f}x{efficiency:>12.2f}")
+
+    return {
+        "jobs": count,
+        "seed": seed,
+        "python": sys.version.split()[0],
+        "cores": cores,
+        "chunk_size": chunk_size,
+        "sweep": sweep
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark job analysis, context detection and query generation")
+    parser.add_argument("--jobs", type=int, help="number of synthetic JDs (default: 2000, or 100000 with --parallel)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--save-baseline", metavar="PATH", help="write the stage results to a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare the stage results with a saved baseline; exit 1 on regression")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="relative throughput or p99 change counted as a regression")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS,
+                        help="timed passes per stage after a warmup pass; the median is reported")
+    parser.add_argument("--parallel", action="store_true", help="benchmark analyze_jobs across worker counts instead")
+    parser.add_argument("--workers", type=int, nargs="*", help="worker counts to compare (default: 1, 2, 4 ... max(cores, 4))")
+    parser.add_argument("--chunk-size", type=int, default=128)
+    args = parser.parse_args()
+
+    if args.parallel:
+        worker_counts = args.workers or default_worker_counts(available_cores())
+        report = run_parallel(args.jobs or 100_000, worker_counts, args.chunk_size, args.seed)
+        if args.save_baseline:
+            save_baseline(report, args.save_baseline)
+    else:
+        report = run_stages(args.jobs or 2000, args.seed, args.repeats)
+        if args.save_baseline:
+            save_baseline(report, args.save_baseline)
+        if args.compare and compare_baseline(report, args.compare, args.threshold):
+            sys.exit(1)
@@ -0,0 +1,98 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+
+def normalize_job_description(job_description: str) -> str:
+    """Normalize a job description so cosmetic edits map to the same key"""
+    return re.sub(r'\s+', ' ', job_description.lower()).strip()
+
+
+def job_description_key(job_description: str) -> str:
+    """Stable hash of the normalized job description"""
+    normalized = normalize_job_description(job_description)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class CriteriaCache:
+    """LRU cache of detected context + hiring criteria per job description.
+
+    Entries are keyed by ``job_description_key``. When ``path`` is given the
+    cache is mirrored to a JSON file so criteria survive process restarts.
+    """
+
+    def __init__(self, max_entries: int = 128, path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.path = path
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        if self.path:
+            self._load()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for a job key, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store an entry, evicting the least recently used one if full"""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+            if self.path:
+                self._save()
+
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        with self._lock:
+            self._entries.clear()
+            if self.path:
+                self._save()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def _load(self) -> None:
+        """Load entries from the backing file, ignoring unreadable files"""
+        if not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except Exception as e:
+            print(f"⚠️ Could not load criteria cache from {self.path}: {e}")
+            return
+
+        for key, entry in stored.items():
+            self._entries[key] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _save(self) -> None:
+        """Write entries to the backing file atomically"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"⚠️ Could not save criteria cache to {self.path}: {e}")
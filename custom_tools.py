@@ -1,8 +1,8 @@
 import os
-import requests
 from typing import Any
 from crewai_tools import tool
 from dotenv import load_dotenv
+from http_client import get_http_client
 import json
 import smtplib
 from email.mime.text import MIMEText
@@ -42,7 +42,7 @@ def pse(location: str, skills: list[str], **kwargs: Any) -> list:
     api_url = (
         f"https://www.googleapis.com/customsearch/v1?key={api_key}&cx={cx}&q={query}"
     )
-    response = requests.get(api_url)
+    response = get_http_client().get(api_url)
     # site:ca.linkedin.com/in ("Calgary * Canada") AND (Java AND Hibernate) AND (Spring OR MySQL)
 
     # Check if the request was successful
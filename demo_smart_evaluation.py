@@ -5,6 +5,7 @@ This demonstrates the system capabilities without requiring API keys.
 """
 
 from smart_evaluator import SmartEvaluator
+from fit_scoring import apply_fit_scores, recommendations
 import json
 
 def demo_smart_evaluation():
@@ -145,38 +146,9 @@ def demo_smart_evaluation():
         if "self-taught" in candidate['snippet'].lower():
             evaluation['scores']['red_flags'] = -1.0
         
-        # Calculate weighted final score
-        weights = {
-            "education": 0.20,
-            "career_trajectory": 0.20,
-            "company_relevance": 0.15,
-            "tenure_stability": 0.15,
-            "core_skills": 0.20,
-            "bonus_signals": 0.05,
-            "red_flags": -0.15
-        }
-        
-        final_score = (
-            evaluation['scores']['education'] * weights['education'] +
-            evaluation['scores']['career_trajectory'] * weights['career_trajectory'] +
-            evaluation['scores']['company_relevance'] * weights['company_relevance'] +
-            evaluation['scores']['tenure_stability'] * weights['tenure_stability'] +
-            evaluation['scores']['core_skills'] * weights['core_skills'] +
-            evaluation['scores']['bonus_signals'] * weights['bonus_signals'] +
-            evaluation['scores']['red_flags'] * abs(weights['red_flags'])
-        )
-        
-        evaluation['final_score'] = round(final_score, 1)
-        
-        # Generate recommendation
-        if final_score >= 8.5:
-            recommendation = "🟢 STRONG HIRE - Exceptional candidate meeting elite standards"
-        elif final_score >= 7.0:
-            recommendation = "🟡 CONSIDER - Good candidate, requires additional evaluation"
-        elif final_score >= 5.5:
-            recommendation = "🟠 WEAK - Below standards, significant concerns"
-        else:
-            recommendation = "🔴 NO HIRE - Does not meet minimum requirements"
+        # Calculate weighted final score and recommendation
+        apply_fit_scores([evaluation])
+        recommendation = recommendations([evaluation['final_score']])[0]
         
         # Display results
         print(f"\n💯 SRN FIT SCORE: {evaluation['final_score']}/10.0")
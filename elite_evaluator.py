@@ -1,6 +1,7 @@
 import os
 import openai
-import requests
+from http_client import get_http_client
+from prompt_builder import PromptBuilder, TokenUsageTracker, compact_json
 from typing import Dict, Any
 
 # Load environment variables
@@ -9,44 +10,54 @@ SMARTLEAD_API_KEY = os.getenv("SMARTLEAD_API_KEY", "")
 
 openai.api_key = OPENAI_API_KEY
 
-def build_elite_eval_prompt(candidate: Dict[str, Any], job: Dict[str, Any]) -> str:
-    # Build the evaluation prompt using the provided rubric
-    return f"""
-You are an elite candidate evaluator. Use the following job description and candidate profile to score the candidate using the SRN Smart Candidate Evaluation System.
-
-Job Description:
-{job['description']}
-
-Candidate Profile:
-{candidate}
+# Token budgets for the variable-length parts of the evaluation prompt
+ELITE_PROMPT_BUDGETS = {
+    "job_description": 1200,
+    "candidate": 600
+}
 
-Step 1: Extract context (Industry, Company Type, Role Type, Role Subtype).
-Step 2: Generate elite hiring criteria for this context.
-Step 3: Score the candidate using the following rubric (100 → 10.0 scale):
-- Education (20%)
-- Career Trajectory (20%)
-- Company Relevance (15%)
-- Tenure & Stability (15%)
-- Most Important Skills (20%)
-- Bonus Signals (5%)
-- Red Flags (−15%)
+# Prompt and completion tokens for every GPT call made from this module
+token_usage = TokenUsageTracker()
 
-Output format:
-Final Fit Score: X.X / 10.0
-Breakdown:
-* Education: x/10
-* Career trajectory: x/10
-* Company relevance: x/10
-* Tenure & stability: x/10
-* Most important skills: x/10
-* Bonus signals: x/5
-* Red flags: −x
-Summary (3–5 lines):
-Strengths: ...
-Weaknesses: ...
-Rationale: ...
-Override Signal: [yes/no, with reason if yes]
-"""
+def build_elite_eval_prompt(candidate: Dict[str, Any], job: Dict[str, Any]) -> str:
+    # Build the evaluation prompt using the provided rubric
+    return (
+        PromptBuilder()
+        .add("You are an elite candidate evaluator. Use the following job description and candidate profile "
+             "to score the candidate using the SRN Smart Candidate Evaluation System.")
+        .add_section("Job Description", job['description'], budget=ELITE_PROMPT_BUDGETS["job_description"])
+        .add_section("Candidate Profile", compact_json(candidate), budget=ELITE_PROMPT_BUDGETS["candidate"])
+        .add("""
+            Step 1: Extract context (Industry, Company Type, Role Type, Role Subtype).
+            Step 2: Generate elite hiring criteria for this context.
+            Step 3: Score the candidate using the following rubric (100 → 10.0 scale):
+            - Education (20%)
+            - Career Trajectory (20%)
+            - Company Relevance (15%)
+            - Tenure & Stability (15%)
+            - Most Important Skills (20%)
+            - Bonus Signals (5%)
+            - Red Flags (−15%)
+        """)
+        .add("""
+            Output format:
+            Final Fit Score: X.X / 10.0
+            Breakdown:
+            * Education: x/10
+            * Career trajectory: x/10
+            * Company relevance: x/10
+            * Tenure & stability: x/10
+            * Most important skills: x/10
+            * Bonus signals: x/5
+            * Red flags: −x
+            Summary (3–5 lines):
+            Strengths: ...
+            Weaknesses: ...
+            Rationale: ...
+            Override Signal: [yes/no, with reason if yes]
+        """)
+        .build()
+    )
 
 def evaluate_candidate_gpt(candidate: Dict[str, Any], job: Dict[str, Any]) -> Dict[str, Any]:
     prompt = build_elite_eval_prompt(candidate, job)
@@ -56,8 +67,13 @@ def evaluate_candidate_gpt(candidate: Dict[str, Any], job: Dict[str, Any]) -> Di
         max_tokens=600,
         temperature=0.2,
     )
+    _record_usage("evaluation", response)
     return response['choices'][0]['message']['content']
 
+def _record_usage(label: str, response: Any) -> None:
+    usage = response.get('usage') or {}
+    token_usage.record(label, usage.get('prompt_tokens', 0), usage.get('completion_tokens', 0))
+
 def build_outreach_prompt(candidate: Dict[str, Any], job: Dict[str, Any]) -> str:
     return f"""
 Draft a personalized LinkedIn connection message for the following scenario:
@@ -79,6 +95,7 @@ def generate_outreach_message_gpt(candidate: Dict[str, Any], job: Dict[str, Any]
         max_tokens=200,
         temperature=0.7,
     )
+    _record_usage("outreach_message", response)
     return response['choices'][0]['message']['content']
 
 def send_smartlead_email(candidate: Dict[str, Any], message: str, job: Dict[str, Any]) -> Dict[str, Any]:
@@ -96,5 +113,5 @@ def send_smartlead_email(candidate: Dict[str, Any], message: str, job: Dict[str,
         "from": os.getenv("EMAIL_ID", "")
     }
     headers = {"Authorization": f"Bearer {SMARTLEAD_API_KEY}", "Content-Type": "application/json"}
-    response = requests.post(url, json=payload, headers=headers)
+    response = get_http_client().post(url, json=payload, headers=headers)
     return response.json() 
\ No newline at end of file
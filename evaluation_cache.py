@@ -0,0 +1,182 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Optional
+
+# Lives next to the Chroma store in db/, but in its own file so Chroma's
+# migrations never see our table
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "db", "evaluation_cache.sqlite3")
+
+
+def canonical_profile_url(url: str) -> str:
+    """Normalize a LinkedIn profile URL so regional and tracking variants match"""
+    url = url.strip().lower()
+    url = re.sub(r'^https?://', '', url)
+    url = url.split('?', 1)[0].split('#', 1)[0]
+    # ca.linkedin.com/in/x, uk.linkedin.com/in/x and www.linkedin.com/in/x are the same profile
+    url = re.sub(r'^([a-z]{2,3}\.)?linkedin\.com/', 'linkedin.com/', url)
+    return url.rstrip('/')
+
+
+def content_hash(profile: Dict[str, Any]) -> str:
+    """Hash of the profile text the evaluator actually sees"""
+    text = f"{profile.get('title', '')}\n{profile.get('snippet', '')}"
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def criteria_hash(criteria: Dict[str, Any]) -> str:
+    """Hash of the hiring criteria (or job context) used for scoring"""
+    payload = json.dumps(criteria, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class EvaluationCache:
+    """SQLite-backed cache of candidate evaluations.
+
+    Entries are keyed on (namespace, canonical profile URL, content hash,
+    criteria hash), expire after ``ttl_seconds`` and are evicted least
+    recently used first once the table holds more than ``max_entries`` rows.
+    """
+
+    # Eviction runs every this many writes rather than on each one
+    EVICTION_INTERVAL = 50
+
+    def __init__(self, path: Optional[str] = None, ttl_seconds: float = 3 * 24 * 3600,
+                 max_entries: int = 20000):
+        self.path = path or os.getenv("SRN_EVALUATION_CACHE_PATH", DEFAULT_CACHE_PATH)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+
+        if self.path != ":memory:":
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        # Evaluations run on worker threads, so one connection is shared behind a lock
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS evaluation_cache (
+                namespace TEXT NOT NULL,
+                profile_url TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                criteria_hash TEXT NOT NULL,
+                evaluation TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (namespace, profile_url, content_hash, criteria_hash)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_evaluation_cache_accessed ON evaluation_cache (accessed_at)"
+        )
+        self._conn.commit()
+
+    def get(self, namespace: str, profile: Dict[str, Any], criteria: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return a cached evaluation, or None on miss or expiry"""
+        key = self._key(namespace, profile, criteria)
+        if key is None:
+            return None
+
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT evaluation, created_at FROM evaluation_cache
+                WHERE namespace = ? AND profile_url = ? AND content_hash = ? AND criteria_hash = ?
+                """,
+                key
+            ).fetchone()
+
+            if row is None or now - row[1] > self.ttl_seconds:
+                if row is not None:
+                    self._conn.execute(
+                        """
+                        DELETE FROM evaluation_cache
+                        WHERE namespace = ? AND profile_url = ? AND content_hash = ? AND criteria_hash = ?
+                        """,
+                        key
+                    )
+                    self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                """
+                UPDATE evaluation_cache SET accessed_at = ?
+                WHERE namespace = ? AND profile_url = ? AND content_hash = ? AND criteria_hash = ?
+                """,
+                (now, *key)
+            )
+            self._conn.commit()
+            self.hits += 1
+
+        return json.loads(row[0])
+
+    def put(self, namespace: str, profile: Dict[str, Any], criteria: Dict[str, Any],
+            evaluation: Dict[str, Any]) -> None:
+        """Store an evaluation for a profile/criteria pair"""
+        key = self._key(namespace, profile, criteria)
+        if key is None:
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO evaluation_cache
+                (namespace, profile_url, content_hash, criteria_hash, evaluation, created_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (*key, json.dumps(evaluation, default=str), now, now)
+            )
+            self._writes += 1
+            if self._writes % self.EVICTION_INTERVAL == 0:
+                self._evict(now)
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM evaluation_cache").fetchone()[0]
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total * 100 if total else 0,
+            "entries": size
+        }
+
+    def clear(self) -> None:
+        """Remove every cached evaluation"""
+        with self._lock:
+            self._conn.execute("DELETE FROM evaluation_cache")
+            self._conn.commit()
+
+    def _key(self, namespace: str, profile: Dict[str, Any], criteria: Dict[str, Any]) -> Optional[tuple]:
+        """Build the cache key, or None for profiles without a URL"""
+        url = profile.get("link") or profile.get("url")
+        if not url:
+            return None
+        return (namespace, canonical_profile_url(url), content_hash(profile), criteria_hash(criteria))
+
+    def _evict(self, now: float) -> None:
+        """Drop expired rows, then the least recently used rows over the size limit"""
+        self._conn.execute("DELETE FROM evaluation_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+        self._conn.execute(
+            """
+            DELETE FROM evaluation_cache WHERE rowid IN (
+                SELECT rowid FROM evaluation_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_entries,)
+        )
@@ -0,0 +1,138 @@
+import random
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Any, Callable, Iterator, Optional, Tuple
+
+
+class AdaptiveRateLimiter:
+    """Shared backoff and concurrency state for workers hitting the same rate-limited API.
+
+    A 429 response pauses every worker until the backoff window has passed and
+    doubles the window for the next throttle. Successful calls shrink it again.
+    Concurrency is adjusted AIMD-style: a 429 halves the number of requests
+    allowed in flight (from the peak actually reached), and every
+    ``concurrency_limit`` successes allow one more, up to ``max_concurrency``.
+    """
+
+    def __init__(self, initial_delay: float = 1.0, max_delay: float = 60.0, decay: float = 0.5,
+                 max_concurrency: int = 16):
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.decay = decay
+        self.current_delay = 0.0
+        self.throttle_count = 0
+        self.max_concurrency = max(1, max_concurrency)
+        self.concurrency_limit = self.max_concurrency
+        self._active = 0
+        # Most requests in flight since the last throttle
+        self._peak_active = 0
+        self._successes = 0
+        self._paused_until = 0.0
+        self._lock = threading.Condition()
+
+    def acquire(self) -> None:
+        """Wait for the backoff window and a free concurrency slot, then take the slot"""
+        while True:
+            with self._lock:
+                remaining = self._paused_until - time.monotonic()
+                if remaining <= 0:
+                    if self._active < self.concurrency_limit:
+                        self._active += 1
+                        self._peak_active = max(self._peak_active, self._active)
+                        return
+                    self._lock.wait()
+                    continue
+            time.sleep(remaining)
+
+    def release(self) -> None:
+        """Give back a slot taken with ``acquire``"""
+        with self._lock:
+            self._active -= 1
+            self._lock.notify()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold a concurrency slot for the duration of one request"""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def record_throttle(self, retry_after: Optional[float] = None) -> float:
+        """Register a 429 and return the delay every worker now waits"""
+        with self._lock:
+            self.throttle_count += 1
+            self.concurrency_limit = max(1, min(self.concurrency_limit, self._peak_active) // 2)
+            self._peak_active = self._active
+            self._successes = 0
+            if self.current_delay <= 0:
+                self.current_delay = self.initial_delay
+            else:
+                self.current_delay = min(self.current_delay * 2, self.max_delay)
+
+            delay = max(self.current_delay, retry_after or 0.0)
+            # Jitter keeps workers from retrying in lockstep
+            delay += random.uniform(0, delay * 0.25)
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            return delay
+
+    def record_success(self) -> None:
+        """Shrink the backoff window and grow the concurrency limit after a successful call"""
+        with self._lock:
+            if self.current_delay > 0:
+                self.current_delay *= self.decay
+                if self.current_delay < self.initial_delay:
+                    self.current_delay = 0.0
+
+            self._successes += 1
+            if self._successes >= self.concurrency_limit and self.concurrency_limit < self.max_concurrency:
+                self.concurrency_limit += 1
+                self._successes = 0
+                self._lock.notify()
+
+
+class EvaluationExecutor:
+    """Runs candidate evaluations concurrently with a bounded worker pool"""
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max(1, max_workers)
+
+    def map(self, evaluate: Callable[[Any], Any], candidates: List[Any],
+            on_complete: Optional[Callable[[int, Any], None]] = None) -> List[Any]:
+        """Evaluate candidates concurrently and return results in input order"""
+        results: List[Any] = [None] * len(candidates)
+        for i, result in self.iter_completed(evaluate, candidates):
+            results[i] = result
+            if on_complete:
+                on_complete(i, result)
+        return results
+
+    def iter_completed(self, evaluate: Callable[[Any], Any], candidates: List[Any]) -> Iterator[Tuple[int, Any]]:
+        """Yield (input index, result) pairs as evaluations finish.
+
+        Closing the iterator early (e.g. once a top-k result is settled)
+        cancels every evaluation that has not started yet; evaluations already
+        running finish in the background and their results are dropped.
+        """
+        if not candidates:
+            return
+
+        if self.max_workers == 1 or len(candidates) == 1:
+            for i, candidate in enumerate(candidates):
+                yield i, evaluate(candidate)
+            return
+
+        workers = min(self.max_workers, len(candidates))
+        pool = ThreadPoolExecutor(max_workers=workers)
+        futures = {pool.submit(evaluate, candidate): i for i, candidate in enumerate(candidates)}
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            cancelled = sum(1 for future in futures if future.cancel())
+            if cancelled:
+                print(f"🛑 Cancelled {cancelled} pending evaluations")
+            pool.shutdown(wait=False)
@@ -0,0 +1,106 @@
+from typing import Dict, List, Any, Optional, Sequence
+import re
+import numpy as np
+
+# SRN FitScore categories, in matrix column order
+CATEGORIES = (
+    "education",
+    "career_trajectory",
+    "company_relevance",
+    "tenure_stability",
+    "core_skills",
+    "bonus_signals",
+    "red_flags"
+)
+
+# Documented weights: 20/20/15/15/20/5/-15
+CATEGORY_WEIGHTS = np.array([0.20, 0.20, 0.15, 0.15, 0.20, 0.05, -0.15])
+
+# Raw score range the model is asked for in each category
+CATEGORY_MIN = np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -5.0])
+CATEGORY_MAX = np.array([10.0, 10.0, 10.0, 10.0, 10.0, 5.0, 0.0])
+
+# Sign applied before weighting: red flags are a 0 to -5 penalty, so their
+# magnitude times the -15% weight is subtracted (same arithmetic as the demo)
+CATEGORY_SIGN = np.array([1.0, 1.0, 1.0, 1.0, 1.0, 1.0, -1.0])
+
+RECOMMENDATION_THRESHOLDS = (8.5, 7.0, 5.5)
+RECOMMENDATIONS = (
+    "🟢 STRONG HIRE - Exceptional candidate meeting elite standards",
+    "🟡 CONSIDER - Good candidate, requires additional evaluation",
+    "🟠 WEAK - Below standards, significant concerns",
+    "🔴 NO HIRE - Does not meet minimum requirements"
+)
+
+
+def _to_float(value: Any) -> float:
+    """Coerce a model-provided score ("7", "7/10", 7.5, None) to a float"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        match = re.search(r'-?\d+(?:\.\d+)?', value)
+        if match:
+            return float(match.group(0))
+    return 0.0
+
+
+def score_matrix(evaluations: Sequence[Dict[str, Any]]) -> np.ndarray:
+    """Build an (n_candidates, 7) matrix of raw category scores from evaluations"""
+    matrix = np.zeros((len(evaluations), len(CATEGORIES)))
+    for row, evaluation in enumerate(evaluations):
+        scores = evaluation.get("scores") or {}
+        for col, category in enumerate(CATEGORIES):
+            matrix[row, col] = _to_float(scores.get(category))
+
+    # Red flags are a penalty; models sometimes report them as a positive count
+    matrix[:, -1] = -np.abs(matrix[:, -1])
+    return matrix
+
+
+def compute_fit_scores(matrix: np.ndarray, weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """Weighted SRN FitScore for every row, clamped to 0-10 and rounded to 0.1"""
+    weights = CATEGORY_WEIGHTS if weights is None else np.asarray(weights, dtype=float)
+
+    clamped = np.clip(matrix, CATEGORY_MIN, CATEGORY_MAX)
+    final = (clamped * CATEGORY_SIGN) @ weights
+    return np.round(np.clip(final, 0.0, 10.0), 1)
+
+
+def recommendations(fit_scores: np.ndarray) -> List[str]:
+    """Map fit scores to SRN hiring recommendations"""
+    fit_scores = np.asarray(fit_scores, dtype=float)
+    # Count thresholds each score falls below: 0 -> STRONG HIRE ... 3 -> NO HIRE
+    buckets = (fit_scores[:, None] < np.array(RECOMMENDATION_THRESHOLDS)).sum(axis=1)
+    return [RECOMMENDATIONS[bucket] for bucket in buckets]
+
+
+def apply_fit_scores(evaluations: List[Dict[str, Any]], weights: Optional[np.ndarray] = None) -> List[Dict[str, Any]]:
+    """Set ``final_score`` on each evaluation from its category scores, in place"""
+    if not evaluations:
+        return evaluations
+
+    fit_scores = compute_fit_scores(score_matrix(evaluations), weights)
+    for evaluation, fit_score in zip(evaluations, fit_scores):
+        evaluation["final_score"] = float(fit_score)
+    return evaluations
+
+
+def rescore_candidates(candidates: List[Dict[str, Any]], weights: Sequence[float]) -> List[Dict[str, Any]]:
+    """Re-weight an evaluated candidate pool without re-querying the model.
+
+    Takes candidates as returned by AdvancedSourcingAgent.search_candidates and
+    returns copies with updated fit_score/recommendation, best first.
+    """
+    if not candidates:
+        return []
+
+    evaluations = [candidate["smart_assessment"]["evaluation"] for candidate in candidates]
+    fit_scores = compute_fit_scores(score_matrix(evaluations), np.asarray(weights, dtype=float))
+    labels = recommendations(fit_scores)
+
+    rescored = [
+        {**candidate, "fit_score": float(fit_score), "recommendation": label}
+        for candidate, fit_score, label in zip(candidates, fit_scores, labels)
+    ]
+    rescored.sort(key=lambda x: x["fit_score"], reverse=True)
+    return rescored
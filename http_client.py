@@ -0,0 +1,137 @@
+import random
+import threading
+import time
+from contextlib import nullcontext
+from typing import Dict, Any, Optional, Tuple, Iterable
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class HttpClient:
+    """Shared HTTP client for all outbound API calls.
+
+    Keeps one keep-alive session (and connection pool) per host, applies
+    default connect/read timeouts, and retries connection errors, 429 and 5xx
+    responses with jittered exponential backoff. Non-idempotent methods (POST,
+    PATCH) are only retried when the request cannot have been processed: a
+    429 or a connect timeout. Callers whose POSTs are safe to repeat pass
+    ``idempotent=True``.
+    """
+
+    DEFAULT_TIMEOUT = (5.0, 60.0)  # (connect, read) seconds
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    # Statuses that mean the server did not act on the request
+    NON_IDEMPOTENT_RETRY_STATUSES = frozenset({429})
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def __init__(self, timeout: Tuple[float, float] = DEFAULT_TIMEOUT, max_retries: int = 3,
+                 backoff_base: float = 0.5, backoff_max: float = 30.0, pool_maxsize: int = 16):
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.pool_maxsize = pool_maxsize
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a GET request"""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a POST request"""
+        return self.request("POST", url, **kwargs)
+
+    def request(self, method: str, url: str, rate_limiter: Any = None, max_retries: Optional[int] = None,
+                retry_statuses: Optional[Iterable[int]] = None, idempotent: Optional[bool] = None,
+                **kwargs: Any) -> requests.Response:
+        """Send a request through the host's pooled session, retrying transient failures.
+
+        ``rate_limiter`` is an optional AdaptiveRateLimiter shared between
+        workers: each attempt holds one of its concurrency slots, and it is
+        told about 429s and successes, so one throttled worker slows all of
+        them down.
+        """
+        max_retries = self.max_retries if max_retries is None else max_retries
+        if idempotent is None:
+            idempotent = method.upper() in self.IDEMPOTENT_METHODS
+        if retry_statuses is None:
+            retry_statuses = self.RETRY_STATUSES if idempotent else self.NON_IDEMPOTENT_RETRY_STATUSES
+        retry_statuses = frozenset(retry_statuses)
+        # A dropped connection or read timeout may come after the server acted on the request
+        retry_errors = (requests.ConnectionError, requests.Timeout) if idempotent else (requests.ConnectTimeout,)
+        kwargs.setdefault("timeout", self.timeout)
+        session = self._session_for(url)
+
+        for attempt in range(max_retries + 1):
+            try:
+                with rate_limiter.slot() if rate_limiter is not None else nullcontext():
+                    response = session.request(method, url, **kwargs)
+            except retry_errors:
+                if attempt >= max_retries:
+                    raise
+                time.sleep(self._backoff(attempt))
+                continue
+
+            if response.status_code in retry_statuses and attempt < max_retries:
+                retry_after = self._retry_after(response)
+                if response.status_code == 429 and rate_limiter is not None:
+                    delay = rate_limiter.record_throttle(retry_after)
+                else:
+                    delay = self._backoff(attempt, retry_after)
+                    time.sleep(delay)
+                print(f"⏳ {urlsplit(url).netloc} returned {response.status_code}, retrying in {delay:.1f}s")
+                continue
+
+            if rate_limiter is not None and response.ok:
+                rate_limiter.record_success()
+            return response
+
+        return response
+
+    def close(self) -> None:
+        """Close every pooled session"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    def _session_for(self, url: str) -> requests.Session:
+        """Return the keep-alive session for the URL's host, creating it once"""
+        parts = urlsplit(url)
+        host_key = f"{parts.scheme}://{parts.netloc}"
+
+        with self._lock:
+            session = self._sessions.get(host_key)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+                session.mount(host_key, adapter)
+                self._sessions[host_key] = session
+            return session
+
+    def _backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Full-jitter exponential backoff, never shorter than Retry-After"""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+        return max(delay, retry_after or 0.0)
+
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """Parse the Retry-After header in seconds, if present"""
+        try:
+            return float(response.headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            return None
+
+
+_shared_client: Optional[HttpClient] = None
+_shared_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Process-wide HttpClient so every caller shares the same connection pools"""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = HttpClient()
+        return _shared_client
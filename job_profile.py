@@ -0,0 +1,107 @@
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Sequence, Tuple
+from criteria_cache import job_description_key
+from token_index import TokenIndex
+from location_engine import Location, get_location_engine
+
+
+@dataclass(frozen=True, eq=False)
+class JobProfile:
+    """Immutable analysis of one job description, computed once per search.
+
+    Built by JobDescriptionAnalyzer.build_profile and consumed by the query
+    generator, pre-scorer and SmartEvaluator, so the description is tokenized
+    and classified exactly once. ``key`` is the same job key the criteria cache
+    uses, giving the job one identity across the pipeline.
+    """
+    key: str
+    description: str
+    text: str
+    index: TokenIndex = field(repr=False, compare=False)
+    job_family: str
+    seniority: str
+    industry: str
+    skills: Mapping[str, Tuple[str, ...]]
+    locations: Tuple[str, ...]
+    is_technical: bool
+    is_leadership: bool
+    remote_eligible: bool
+    # SmartContextDetector output: industry, company_type, role_type, role_subtype
+    context: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    # Gazetteer matches behind ``locations`` (which holds their labels)
+    location_details: Tuple[Location, ...] = ()
+
+    @property
+    def company_type(self) -> str:
+        return self.context.get("company_type", "")
+
+    @property
+    def role_type(self) -> str:
+        return self.context.get("role_type", "")
+
+    @property
+    def role_subtype(self) -> str:
+        return self.context.get("role_subtype", "")
+
+    @property
+    def total_skills(self) -> int:
+        return sum(len(skills) for skills in self.skills.values())
+
+    def as_analysis(self) -> Dict[str, Any]:
+        """The job_analysis dict returned by JobDescriptionAnalyzer.analyze_job"""
+        return {
+            "job_family": self.job_family,
+            "seniority": self.seniority,
+            "industry": self.industry,
+            "skills": {category: list(skills) for category, skills in self.skills.items()},
+            "locations": list(self.locations),
+            "is_technical": self.is_technical,
+            "is_leadership": self.is_leadership,
+            "remote_eligible": self.remote_eligible,
+            "total_skills": self.total_skills
+        }
+
+    def with_description(self, description: str) -> "JobProfile":
+        """Same analysis for a reformatted copy of the description (e.g. a memo hit)"""
+        return replace(self, key=job_description_key(description), description=description,
+                       text=description.lower())
+
+    @classmethod
+    def create(cls, description: str, index: TokenIndex, skills: Dict[str, List[str]],
+               locations: List[str], context: Dict[str, str], location_details: Sequence[Location] = (),
+               **analysis: Any) -> "JobProfile":
+        """Build a profile, freezing the mutable analysis containers"""
+        return cls(
+            key=job_description_key(description),
+            description=description,
+            text=description.lower(),
+            index=index,
+            skills=MappingProxyType({category: tuple(values) for category, values in skills.items()}),
+            locations=tuple(locations),
+            location_details=tuple(location_details),
+            context=MappingProxyType(dict(context)),
+            **analysis
+        )
+
+    @classmethod
+    def from_analysis(cls, job_analysis: Dict[str, Any], job_description: str = "") -> "JobProfile":
+        """Wrap a legacy job_analysis dict (from analyze_job) and its description"""
+        locations = job_analysis.get("locations", [])
+        # Labels ("Austin, TX", "London, GB", "Remote") resolve back to the gazetteer entries behind them
+        engine = get_location_engine()
+        location_details = [location for label in locations for location in engine.extract(label)[:1]]
+        return cls.create(
+            job_description,
+            TokenIndex(job_description),
+            skills=job_analysis.get("skills", {}),
+            locations=locations,
+            location_details=location_details,
+            context=job_analysis.get("context", {}),
+            job_family=job_analysis.get("job_family", "operations"),
+            seniority=job_analysis.get("seniority", "mid"),
+            industry=job_analysis.get("industry", "tech"),
+            is_technical=job_analysis.get("is_technical", False),
+            is_leadership=job_analysis.get("is_leadership", False),
+            remote_eligible=job_analysis.get("remote_eligible", False)
+        )
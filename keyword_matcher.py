@@ -0,0 +1,131 @@
+import threading
+from collections import deque
+from typing import Dict, List, Any, Optional, Set, Tuple, Union
+from token_index import TokenIndex, phrase_variants, tokenize
+
+# {table name: {category: [keywords]}}, e.g. {"seniority": {"senior": ["senior", "sr"]}}
+KeywordTables = Dict[str, Dict[str, List[str]]]
+
+
+class KeywordHits:
+    """Result of one KeywordMatcher scan: every keyword found in the text"""
+
+    def __init__(self, matcher: "KeywordMatcher", keywords: Set[str]):
+        self._matcher = matcher
+        self.keywords = keywords
+
+    def scores(self, table: str) -> Dict[str, int]:
+        """Matched-keyword count per category, in table order, omitting zero counts"""
+        counts: Dict[str, int] = {}
+        for category, keywords in self._matcher.tables[table].items():
+            count = sum(1 for keyword in keywords if keyword in self.keywords)
+            if count > 0:
+                counts[category] = count
+        return counts
+
+    def best(self, table: str, default: Optional[str] = None) -> Optional[str]:
+        """Category with the most matched keywords; ties go to the earlier category"""
+        counts = self.scores(table)
+        return max(counts.items(), key=lambda x: x[1])[0] if counts else default
+
+    def categories(self, table: str) -> List[str]:
+        """Categories with at least one matched keyword, in table order"""
+        return [category for category, keywords in self._matcher.tables[table].items()
+                if any(keyword in self.keywords for keyword in keywords)]
+
+    def first(self, table: str, default: Optional[str] = None) -> Optional[str]:
+        """First category in table order with any matched keyword"""
+        categories = self.categories(table)
+        return categories[0] if categories else default
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over every keyword of a set of keyword tables.
+
+    Keywords are matched as whole-word token sequences (see token_index), so
+    short keywords like "pm" or "ai" only fire on the word itself. ``scan``
+    finds all keywords in one linear pass over the document's tokens, so
+    classifying a document costs O(tokens + matches) instead of one full scan
+    per keyword.
+    """
+
+    def __init__(self, tables: KeywordTables):
+        self.tables = {table: {category: list(keywords) for category, keywords in categories.items()}
+                       for table, categories in tables.items()}
+
+        # Trie over tokens as parallel arrays: goto transitions, failure links, output keywords
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[str, ...]] = [()]
+
+        vocabulary = {keyword for categories in self.tables.values()
+                      for keywords in categories.values() for keyword in keywords if keyword}
+        for keyword in sorted(vocabulary):
+            self._insert(keyword)
+        self._build_failure_links()
+
+    def scan(self, document: Union[str, TokenIndex]) -> KeywordHits:
+        """Find every keyword occurring in a text or an already built TokenIndex"""
+        tokens = document.tokens if isinstance(document, TokenIndex) else tokenize(document)
+        goto, fail, output = self._goto, self._fail, self._output
+        found: Set[str] = set()
+        state = 0
+
+        for token in tokens:
+            while token not in goto[state] and state:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            if output[state]:
+                found.update(output[state])
+
+        return KeywordHits(self, found)
+
+    def _insert(self, keyword: str) -> None:
+        """Add every token-sequence variant of the keyword, each reporting the keyword itself"""
+        for tokens in phrase_variants(keyword):
+            state = 0
+            for token in tokens:
+                next_state = self._goto[state].get(token)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                    self._goto[state][token] = next_state
+                state = next_state
+            if keyword not in self._output[state]:
+                self._output[state] = self._output[state] + (keyword,)
+
+    def _build_failure_links(self) -> None:
+        """Breadth-first pass linking each state to its longest proper suffix state"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while token not in self._goto[fallback] and fallback:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[next_state] = target if target != next_state else 0
+
+                # Keywords ending at the suffix state also end here
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+
+_matchers: Dict[Any, KeywordMatcher] = {}
+_matchers_lock = threading.Lock()
+
+
+def get_keyword_matcher(tables: KeywordTables) -> KeywordMatcher:
+    """Shared compiled matcher for a set of tables, built once per distinct content"""
+    key = tuple(
+        (table, tuple((category, tuple(keywords)) for category, keywords in categories.items()))
+        for table, categories in tables.items()
+    )
+    with _matchers_lock:
+        matcher = _matchers.get(key)
+        if matcher is None:
+            matcher = _matchers[key] = KeywordMatcher(tables)
+        return matcher
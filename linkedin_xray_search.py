@@ -1,12 +1,12 @@
 from typing import List, Dict, Optional
 import os
 import json
-import requests
 from bs4 import BeautifulSoup
 from dataclasses import dataclass
 from datetime import datetime
 import time
 from dotenv import load_dotenv
+from http_client import get_http_client
 
 load_dotenv()
 
@@ -42,7 +42,7 @@ class LinkedInXRaySearch:
         }
         
         try:
-            response = requests.get(self.base_url, params=params)
+            response = get_http_client().get(self.base_url, params=params)
             response.raise_for_status()
             results = response.json()
             
@@ -58,7 +58,7 @@ class LinkedInXRaySearch:
                 start_index = 11
                 while len(profiles) < num_results and start_index <= 100:  # Google CSE limits to 100 results
                     params["start"] = start_index
-                    response = requests.get(self.base_url, params=params)
+                    response = get_http_client().get(self.base_url, params=params)
                     response.raise_for_status()
                     results = response.json()
                     
@@ -0,0 +1,209 @@
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple
+
+DEFAULT_GAZETTEER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "gazetteer.json")
+
+_WORD_PATTERN = re.compile(r"[^\W_]+")
+# Each word as written (capitalization is checked) with the separator that follows it
+_WORD_SEPARATOR_PATTERN = re.compile(r"([^\W_]+)([\W_]*)")
+
+# Trie key holding the entries that end at a node
+_END = ""
+
+
+@dataclass(frozen=True)
+class Location:
+    """A normalized location found in a job description"""
+    kind: str  # "city", "region", "country" or "remote"
+    name: str
+    region: Optional[str] = None  # region code, e.g. "CA" or "NS"
+    country: Optional[str] = None  # ISO country code
+    metro: Optional[str] = None  # LinkedIn-style metro area, e.g. "San Francisco Bay Area"
+
+    @property
+    def label(self) -> str:
+        """Display form: "Austin, TX", "Halifax, NS", "London, GB", "Ontario", "Remote" """
+        if self.kind == "city":
+            return f"{self.name}, {self.region or self.country}"
+        return self.name
+
+    @property
+    def search_terms(self) -> List[str]:
+        """Phrases candidates use for this place on their profiles, metro first"""
+        terms = [self.metro] if self.metro else []
+        terms.append(self.name)
+        return terms
+
+
+class LocationEngine:
+    """Gazetteer-backed location extractor.
+
+    Loads the city/region/country gazetteer lazily into a token trie on first
+    use, then finds locations in one left-to-right pass over the words of a
+    text, consuming ", ST" / ", Country" qualifiers so "Halifax, Nova Scotia,
+    Canada" is a single location. Matching ignores case, except for short
+    one-word abbreviations ("LA", "SF"), which must be written in capitals.
+    """
+
+    # Longest place name in tokens ("united states of america")
+    MAX_NAME_TOKENS = 4
+    # One-word names this short ("LA", "SF", "UK") only match in capitals
+    MAX_ABBREVIATION_LENGTH = 3
+
+    def __init__(self, path: str = DEFAULT_GAZETTEER_PATH):
+        self.path = path
+        self._trie: Optional[Dict[str, Any]] = None
+        self._region_codes: Dict[Tuple[str, str], str] = {}
+        self._country_names: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def extract(self, text: str) -> List[Location]:
+        """Locations in order of first mention, without duplicates"""
+        trie = self._load()
+        words = _WORD_SEPARATOR_PATTERN.findall(text)
+
+        locations: List[Location] = []
+        i = 0
+        while i < len(words):
+            # Most words start no place name; skip them before walking the trie
+            match = self._longest_match(trie, words, i) if words[i][0].lower() in trie else None
+            if match is None:
+                i += 1
+                continue
+
+            end, entries = match
+            location, end = self._resolve(trie, words, end, entries)
+            if location not in locations:
+                locations.append(location)
+            i = end
+        return locations
+
+    def _load(self) -> Dict[str, Any]:
+        """Build the trie on first use"""
+        if self._trie is not None:
+            return self._trie
+
+        with self._lock:
+            if self._trie is None:
+                with open(self.path, encoding="utf-8") as f:
+                    gazetteer = json.load(f)
+
+                trie: Dict[str, Any] = {}
+                for code, *names in gazetteer["countries"]:
+                    self._country_names[code] = names[0]
+                    for name in names:
+                        self._insert(trie, name, ("country", names[0], None, code, None))
+
+                for country, code, name in gazetteer["regions"]:
+                    self._region_codes[(country, code)] = name
+                    self._insert(trie, name, ("region", name, code, country, None))
+
+                for name, country, region, metro, aliases in gazetteer["cities"]:
+                    for alias in [name] + aliases:
+                        self._insert(trie, alias, ("city", name, region, country, metro))
+
+                for phrase in gazetteer["remote"]:
+                    self._insert(trie, phrase, ("remote", "Remote", None, None, None))
+
+                self._trie = trie
+        return self._trie
+
+    def _insert(self, trie: Dict[str, Any], name: str, entry: tuple) -> None:
+        node = trie
+        for word in _WORD_PATTERN.findall(name.lower()):
+            node = node.setdefault(word, {})
+        node.setdefault(_END, []).append(entry)
+
+    def _longest_match(self, trie: Dict[str, Any], words: List[tuple], start: int,
+                       check_case: bool = True) -> Optional[Tuple[int, list]]:
+        """Longest gazetteer name starting at word ``start``, as (end index, entries)"""
+        node = trie
+        best = None
+        for i in range(start, min(len(words), start + self.MAX_NAME_TOKENS)):
+            node = node.get(words[i][0].lower())
+            if node is None:
+                break
+            if _END in node:
+                best = (i + 1, node[_END])
+
+        if best is None or not check_case:
+            return best
+
+        entries = [entry for entry in best[1]
+                   if entry[0] == "remote" or self._case_matches(words[start][0], best[0] - start)]
+        return (best[0], entries) if entries else None
+
+    def _case_matches(self, word: str, length: int) -> bool:
+        """Whether a match of ``length`` words starting with ``word`` is written like a place name.
+
+        Only single-word abbreviations depend on case: "LA" is a place, "la" is not.
+        """
+        if length > 1:
+            return True
+        if len(word) <= self.MAX_ABBREVIATION_LENGTH:
+            return word.isupper()
+        return True
+
+    def _resolve(self, trie: Dict[str, Any], words: List[tuple], end: int,
+                 entries: list) -> Tuple[Location, int]:
+        """Pick the entry for a match, consuming trailing ", region" / ", country" qualifiers"""
+        kind = min(entries, key=lambda entry: ("city", "region", "country", "remote").index(entry[0]))[0]
+        candidates = [entry for entry in entries if entry[0] == kind]
+        if kind == "remote":
+            return Location("remote", "Remote"), end
+
+        region = country = None
+        if kind == "city":
+            region, end = self._qualifier(trie, words, end, "region", candidates)
+        if kind in ("city", "region"):
+            country, end = self._qualifier(trie, words, end, "country", candidates)
+
+        # Ambiguous names ("Portland", "London", "Cambridge") resolve by qualifier, then prefer the major city
+        # (the listing with a metro area), so a bare "London" is London, GB rather than London, ON
+        matching = [entry for entry in candidates
+                    if (region is None or entry[2] == region) and (country is None or entry[3] == country)]
+        matching = matching or candidates
+        entry = next((entry for entry in matching if entry[4]), matching[0])
+
+        _, name, region_code, country_code, metro = entry
+        return Location(kind, name, region_code, country_code, metro), end
+
+    def _qualifier(self, trie: Dict[str, Any], words: List[tuple], end: int,
+                   kind: str, candidates: list) -> Tuple[Optional[str], int]:
+        """Match ", <region>" or ", <country>" right after word ``end``; returns (code, new end)"""
+        if end >= len(words) or words[end - 1][1].strip() != ",":
+            return None, end
+
+        word = words[end][0]
+        if kind == "region" and len(word) == 2 and word.isupper():
+            countries = {entry[3] for entry in candidates}
+            if any((country, word) in self._region_codes for country in countries):
+                return word, end + 1
+
+        # Right after a place and a comma, "london, uk" is unambiguous in any case
+        match = self._longest_match(trie, words, end, check_case=False)
+        if match is not None:
+            qualifier = [entry for entry in match[1] if entry[0] == kind]
+            if qualifier:
+                code = qualifier[0][2] if kind == "region" else qualifier[0][3]
+                return code, match[0]
+        if kind == "country" and word.isupper() and word in self._country_names:
+            return word, end + 1
+        return None, end
+
+
+_shared_engine: Optional[LocationEngine] = None
+_shared_lock = threading.Lock()
+
+
+def get_location_engine() -> LocationEngine:
+    """Process-wide engine; the gazetteer is only read when first used"""
+    global _shared_engine
+    with _shared_lock:
+        if _shared_engine is None:
+            _shared_engine = LocationEngine()
+        return _shared_engine
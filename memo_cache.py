@@ -0,0 +1,80 @@
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Bullet glyphs anywhere, and dashes/asterisks used as list markers at line start
+_BULLET_PATTERN = re.compile(r"[•·▪‣◦●○■□►▶✓✔]|^\s*[*\-–—]+(?=\s)", re.MULTILINE)
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def content_key(text: str) -> str:
+    """Hash of the text ignoring whitespace layout and bullet characters.
+
+    A JD pasted with "•" bullets and the same JD with "-" bullets or
+    re-wrapped lines get the same key.
+    """
+    normalized = _WHITESPACE_PATTERN.sub(" ", _BULLET_PATTERN.sub("", text)).strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class ContentMemo:
+    """Thread-safe LRU memo for results derived from a text, keyed by content_key"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, text: str, compute: Callable[[], T], variant: Hashable = None) -> T:
+        """Return the memoized result for the text, computing it on a miss.
+
+        ``variant`` separates results computed with different options for the
+        same text.
+        """
+        key = (content_key(text), variant)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        # Compute outside the lock; concurrent misses on one key just compute twice
+        value = compute()
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Pickles (e.g. into worker processes) as an empty memo with the same limit
+        return {"max_entries": self.max_entries}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["max_entries"])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, hits, misses and hit rate"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
@@ -0,0 +1,113 @@
+import math
+from typing import Dict, List, Any, Optional, Set, Tuple
+from keyword_matcher import KeywordHits
+from job_profile import JobProfile
+
+
+class CandidatePreScorer:
+    """Cheap local first-stage scorer run before any LLM evaluation.
+
+    Reuses the JobDescriptionAnalyzer keyword matcher and skill regexes on the
+    candidate's title and snippet, and scores skill overlap, job family and
+    seniority agreement with the analyzed job on a 0-1 scale.
+    """
+
+    WEIGHTS = {
+        "skills": 0.5,
+        "job_family": 0.3,
+        "seniority": 0.2
+    }
+
+    # Score given to a signal the candidate text says nothing about
+    NEUTRAL = 0.5
+
+    SENIORITY_RANK = {"entry": 0, "mid": 1, "senior": 2, "executive": 3}
+
+    def __init__(self, analyzer):
+        self.analyzer = analyzer
+
+    def score(self, candidate: Dict[str, Any], job: JobProfile,
+              candidate_skill_ids: Optional[Set[int]] = None,
+              job_skill_ids: Optional[Set[int]] = None) -> Dict[str, float]:
+        """Score one candidate against a job profile"""
+        text = self._candidate_text(candidate)
+        hits = self.analyzer.keyword_matcher.scan(text)
+        if candidate_skill_ids is None:
+            candidate_skill_ids = self.analyzer.extract_skill_ids_bulk([text])[0]
+        if job_skill_ids is None:
+            job_skill_ids = self.analyzer.skill_ids(job.skills)
+
+        components = {
+            "skills": self._skill_score(candidate_skill_ids, job_skill_ids),
+            "job_family": self._family_score(hits, job),
+            "seniority": self._seniority_score(hits, job)
+        }
+        components["total"] = sum(self.WEIGHTS[name] * value for name, value in components.items())
+        return components
+
+    def select(self, candidates: List[Dict[str, Any]], job: JobProfile,
+               keep_fraction: float = 0.5, min_score: Optional[float] = None,
+               min_keep: int = 0) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Split candidates into (kept, pruned) by pre-score.
+
+        Keeps the top ``keep_fraction`` of candidates, plus any scoring at least
+        ``min_score``, and never fewer than ``min_keep``. Kept candidates stay
+        in their original search order and carry their ``pre_score``.
+        """
+        if not candidates:
+            return [], []
+
+        # One regex pass finds every candidate's canonical skill ids
+        all_skill_ids = self.analyzer.extract_skill_ids_bulk([self._candidate_text(candidate) for candidate in candidates])
+        job_skill_ids = self.analyzer.skill_ids(job.skills)
+
+        scored = []
+        for i, (candidate, candidate_skill_ids) in enumerate(zip(candidates, all_skill_ids)):
+            pre_score = self.score(candidate, job, candidate_skill_ids, job_skill_ids)["total"]
+            scored.append((pre_score, i, {**candidate, "pre_score": round(pre_score, 3)}))
+
+        keep_count = max(min_keep, math.ceil(len(candidates) * keep_fraction))
+        ranked = sorted(scored, key=lambda x: (-x[0], x[1]))
+
+        keep_indices = {i for _, i, _ in ranked[:keep_count]}
+        if min_score is not None:
+            keep_indices.update(i for pre_score, i, _ in scored if pre_score >= min_score)
+
+        kept = [candidate for _, i, candidate in scored if i in keep_indices]
+        pruned = [candidate for _, i, candidate in scored if i not in keep_indices]
+        return kept, pruned
+
+    def _candidate_text(self, candidate: Dict[str, Any]) -> str:
+        # Matching is case-insensitive except for a few skills ("Go"), so keep the original case
+        return f"{candidate.get('title', '')} {candidate.get('snippet', '')}"
+
+    def _skill_score(self, candidate_skill_ids: Set[int], job_skill_ids: Set[int]) -> float:
+        """Share of the job's skills mentioned in the candidate text, compared as canonical ids"""
+        if not job_skill_ids:
+            return self.NEUTRAL
+
+        # A snippet is ~300 characters, so a handful of matches is already a strong signal
+        return min(1.0, len(job_skill_ids & candidate_skill_ids) / min(len(job_skill_ids), 4))
+
+    def _family_score(self, hits: KeywordHits, job: JobProfile) -> float:
+        """1 when the candidate's strongest job family matches the job's, 0 when it differs"""
+        family_scores = hits.scores("job_family")
+
+        if not family_scores:
+            return self.NEUTRAL
+
+        job_family = job.job_family
+        if job_family in family_scores:
+            # Titles often hit several families ("engineering director"), so partial credit
+            return family_scores[job_family] / max(family_scores.values())
+        return 0.0
+
+    def _seniority_score(self, hits: KeywordHits, job: JobProfile) -> float:
+        """Closeness of the candidate's apparent seniority to the job's"""
+        levels = [self.SENIORITY_RANK[level] for level in hits.categories("seniority")]
+        if not levels:
+            return self.NEUTRAL
+
+        job_level = self.SENIORITY_RANK.get(job.seniority, 1)
+        distance = min(abs(level - job_level) for level in levels)
+        return {0: 1.0, 1: 0.6}.get(distance, 0.1)
@@ -0,0 +1,179 @@
+import json
+import math
+import re
+import textwrap
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Any, Optional, Union
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - tiktoken is in requirements.txt
+    tiktoken = None
+
+# Pictographs, dingbats and variation selectors used as decoration in prompts
+_EMOJI_PATTERN = re.compile(
+    "[\U0001F000-\U0001FAFF\U00002600-\U000027BF\U00002B00-\U00002BFF\U0000FE0F\U0000200D]"
+)
+
+_encodings: Dict[str, Any] = {}
+_encodings_lock = threading.Lock()
+
+
+def _encoding_for(model: str):
+    """tiktoken encoding for a model, or None when tiktoken or its data is unavailable"""
+    with _encodings_lock:
+        if model not in _encodings:
+            encoding = None
+            if tiktoken is not None:
+                try:
+                    encoding = tiktoken.encoding_for_model(model)
+                except Exception:
+                    # Unknown model name or BPE file cannot be downloaded
+                    try:
+                        encoding = tiktoken.get_encoding("cl100k_base")
+                    except Exception:
+                        encoding = None
+            _encodings[model] = encoding
+        return _encodings[model]
+
+
+def count_tokens(text: str, model: str = "gpt-4") -> int:
+    """Count prompt tokens, estimating ~4 characters per token without tiktoken"""
+    encoding = _encoding_for(model)
+    if encoding is None:
+        return math.ceil(len(text) / 4)
+    return len(encoding.encode(text))
+
+
+def compact_text(text: str) -> str:
+    """Strip indentation, emoji and redundant whitespace from prompt text"""
+    text = _EMOJI_PATTERN.sub("", textwrap.dedent(text))
+    lines = [re.sub(r'[ \t]+', ' ', line).strip() for line in text.splitlines()]
+
+    compacted = []
+    for line in lines:
+        # Collapse runs of blank lines into a single separator
+        if not line and (not compacted or not compacted[-1]):
+            continue
+        compacted.append(line)
+
+    return "\n".join(compacted).strip()
+
+
+def compact_json(value: Any) -> str:
+    """Serialize without indentation or spaces after separators"""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def truncate_to_tokens(text: str, budget: int, model: str = "gpt-4") -> str:
+    """Cut text to at most ``budget`` tokens, ellipsis included, preferring a word boundary"""
+    if budget <= 0:
+        return ""
+    if count_tokens(text, model) <= budget:
+        return text
+
+    # Leave room for the ellipsis so the result still fits the budget
+    limit = budget - count_tokens("…", model)
+    if limit <= 0:
+        return ""
+
+    encoding = _encoding_for(model)
+    if encoding is None:
+        truncated = text[:limit * 4]
+    else:
+        truncated = encoding.decode(encoding.encode(text)[:limit])
+
+    # Drop a trailing partial word so truncation is stable and readable
+    if " " in truncated:
+        truncated = truncated.rsplit(" ", 1)[0]
+    result = truncated.rstrip() + "…"
+
+    # Re-encoding across the cut can merge tokens differently; shorten until it fits
+    while count_tokens(result, model) > budget and " " in truncated:
+        truncated = truncated.rsplit(" ", 1)[0]
+        result = truncated.rstrip() + "…"
+    return result if count_tokens(result, model) <= budget else ""
+
+
+def truncate_list(items: List[Any], budget: int, model: str = "gpt-4") -> List[str]:
+    """Keep list items in order until the token budget is spent"""
+    kept = []
+    used = 0
+    for item in items:
+        item_text = str(item)
+        cost = count_tokens(item_text, model) + 1  # separator
+        if used + cost > budget:
+            break
+        kept.append(item_text)
+        used += cost
+    return kept
+
+
+class PromptBuilder:
+    """Assembles compact prompts from sections with per-section token budgets"""
+
+    def __init__(self, model: str = "gpt-4"):
+        self.model = model
+        self._sections: List[str] = []
+
+    def add(self, text: str) -> "PromptBuilder":
+        """Add free text (instructions), compacted but not truncated"""
+        text = compact_text(text)
+        if text:
+            self._sections.append(text)
+        return self
+
+    def add_section(self, title: str, content: Union[str, List[Any], Dict[str, Any]],
+                    budget: Optional[int] = None) -> "PromptBuilder":
+        """Add a titled section, truncating its content to ``budget`` tokens"""
+        if isinstance(content, dict):
+            body = compact_json(content)
+        elif isinstance(content, list):
+            items = truncate_list(content, budget, self.model) if budget else [str(item) for item in content]
+            body = "; ".join(items)
+        else:
+            body = compact_text(content)
+
+        if budget and not isinstance(content, list):
+            body = truncate_to_tokens(body, budget, self.model)
+
+        self._sections.append(f"{title}:\n{body}" if "\n" in body or len(body) > 80 else f"{title}: {body}")
+        return self
+
+    def build(self) -> str:
+        """Return the assembled prompt"""
+        return "\n\n".join(self._sections)
+
+
+class TokenUsageTracker:
+    """Thread-safe record of prompt and completion tokens per call label"""
+
+    def __init__(self, max_calls: int = 1000):
+        # Recent calls only; totals below cover every call
+        self.calls: Deque[Dict[str, Any]] = deque(maxlen=max_calls)
+        self.totals: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, label: str, prompt_tokens: int, completion_tokens: int) -> None:
+        """Record token counts for one API call"""
+        with self._lock:
+            self.calls.append({
+                "label": label,
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens
+            })
+            totals = self.totals.setdefault(label, {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0})
+            totals["calls"] += 1
+            totals["prompt_tokens"] += prompt_tokens
+            totals["completion_tokens"] += completion_tokens
+
+    def summary(self) -> Dict[str, Any]:
+        """Per-label totals plus overall token counts"""
+        with self._lock:
+            return {
+                "by_label": {label: dict(totals) for label, totals in self.totals.items()},
+                "prompt_tokens": sum(t["prompt_tokens"] for t in self.totals.values()),
+                "completion_tokens": sum(t["completion_tokens"] for t in self.totals.values()),
+                "calls": sum(t["calls"] for t in self.totals.values())
+            }
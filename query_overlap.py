@@ -0,0 +1,307 @@
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Any, FrozenSet, Iterable, Optional, Set, Tuple
+from evaluation_cache import canonical_profile_url
+
+# Quoted phrases, parentheses and bare words / operators (site:, -term)
+_QUERY_TOKEN_PATTERN = re.compile(r'"[^"]*"|\(|\)|[^\s()"]+')
+
+# Google CSE ignores words past the 32nd
+MAX_QUERY_WORDS = 32
+
+
+def canonical_term(term: str) -> str:
+    """Comparison form of a query term: unquoted, lowercased, single-spaced"""
+    return " ".join(term.strip('"').lower().split())
+
+
+def count_query_words(query: str) -> int:
+    """Words Google counts toward the query limit, operators included"""
+    return sum(len(token.strip('"').split()) for token in _QUERY_TOKEN_PATTERN.findall(query)
+               if token not in ("(", ")"))
+
+
+@dataclass(frozen=True)
+class ParsedQuery:
+    """An X-Ray query as a conjunction of OR-clauses.
+
+    ``clauses`` keeps each clause's terms as written, in query order; a
+    result must match at least one term of every clause. Google binds OR
+    tighter than the implicit AND, so ``a "x" OR "y" b`` is
+    ``a AND (x OR y) AND b``.
+    """
+    query: str
+    clauses: Tuple[Tuple[str, ...], ...]
+
+    @property
+    def clause_sets(self) -> Tuple[FrozenSet[str], ...]:
+        return tuple(frozenset(canonical_term(term) for term in clause) for clause in self.clauses)
+
+    @property
+    def key(self) -> str:
+        """Order- and formatting-independent identity of the query"""
+        return " ".join(sorted("|".join(sorted(clause)) for clause in set(self.clause_sets)))
+
+    def render(self) -> str:
+        """Query text for the clauses, parenthesizing multi-term clauses"""
+        return " ".join(clause[0] if len(clause) == 1 else f"({' OR '.join(clause)})" for clause in self.clauses)
+
+
+def parse_query(query: str) -> ParsedQuery:
+    """Parse X-Ray query text into a ParsedQuery"""
+    clauses, _ = _parse_sequence(_QUERY_TOKEN_PATTERN.findall(query), 0)
+    return ParsedQuery(query, tuple(tuple(clause) for clause in clauses))
+
+
+def _parse_sequence(tokens: List[str], i: int) -> Tuple[List[List[str]], int]:
+    """Clauses up to the matching ")" or the end, and the index after it"""
+    clauses: List[List[str]] = []
+    pending_or = False
+    while i < len(tokens):
+        token = tokens[i]
+        i += 1
+        if token == ")":
+            break
+        if token == "OR":
+            pending_or = True
+            continue
+
+        if token == "(":
+            inner, i = _parse_sequence(tokens, i)
+            if not inner:
+                continue
+            # A parenthesized conjunction is one alternative of the enclosing clause
+            alternatives = inner[0] if len(inner) == 1 else [f"({ParsedQuery('', tuple(map(tuple, inner))).render()})"]
+        else:
+            alternatives = [token]
+
+        if pending_or and clauses:
+            clauses[-1].extend(term for term in alternatives if term not in clauses[-1])
+        else:
+            clauses.append(list(alternatives))
+        pending_or = False
+    return clauses, i
+
+
+def structural_overlap(a: ParsedQuery, b: ParsedQuery) -> float:
+    """Estimated share of ``a``'s results that ``b`` also returns, from the queries alone.
+
+    1.0 when every clause of ``b`` is implied by a clause of ``a`` (``a`` is
+    ``b`` or stricter). Otherwise the clauses are aligned best-match and
+    scored by term Jaccard similarity.
+    """
+    a_clauses, b_clauses = a.clause_sets, b.clause_sets
+    if not a_clauses or not b_clauses:
+        return 0.0
+    if all(any(a_clause <= b_clause for a_clause in a_clauses) for b_clause in b_clauses):
+        return 1.0
+
+    similarity = sum(
+        max(len(b_clause & a_clause) / len(b_clause | a_clause) for a_clause in a_clauses)
+        for b_clause in b_clauses
+    )
+    return similarity / max(len(a_clauses), len(b_clauses))
+
+
+def merge_queries(a: ParsedQuery, b: ParsedQuery, max_words: int = MAX_QUERY_WORDS) -> Optional[ParsedQuery]:
+    """One query covering both when they differ in a single OR-clause, else None.
+
+    The differing clause becomes the union of both clauses' terms, so the
+    merged query returns the results of both for one search call.
+    """
+    a_sets, b_sets = a.clause_sets, b.clause_sets
+    if len(a_sets) != len(b_sets):
+        return None
+
+    unmatched_b = list(range(len(b_sets)))
+    differing = []
+    for i, a_clause in enumerate(a_sets):
+        match = next((j for j in unmatched_b if b_sets[j] == a_clause), None)
+        if match is None:
+            differing.append(i)
+        else:
+            unmatched_b.remove(match)
+    if len(differing) != 1:
+        return None
+
+    i, j = differing[0], unmatched_b[0]
+    merged_clause = a.clauses[i] + tuple(
+        term for term in b.clauses[j] if canonical_term(term) not in a_sets[i]
+    )
+    clauses = a.clauses[:i] + (merged_clause,) + a.clauses[i + 1:]
+    merged = ParsedQuery("", clauses)
+    merged = ParsedQuery(merged.render(), clauses)
+    return merged if count_query_words(merged.query) <= max_words else None
+
+
+class QueryOverlapEstimator:
+    """Skips X-Ray queries that would mostly return profiles already found.
+
+    Before searching, ``plan`` merges queries that differ in one OR-clause and
+    drops queries implied by an earlier one. While searching, ``overlap_with``
+    estimates a query's overlap with the queries already executed from past
+    result sets: exact history for a query seen before, otherwise the
+    profiles that matched every one of its clauses in earlier searches.
+    ``record`` adds each executed query's profile URLs to that history, which
+    is mirrored to a JSON file when ``path`` is given.
+    """
+
+    # Fewer expected profiles than this is too little history; fall back to the query structure
+    MIN_EVIDENCE = 3
+
+    def __init__(self, threshold: float = 0.8, max_entries: int = 500, path: Optional[str] = None):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.path = path
+        # Query key -> {"query": text, "urls": [canonical profile URLs]}
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Canonical clause -> URLs of every recorded result of a query containing it
+        self._clause_urls: Dict[FrozenSet[str], Set[str]] = {}
+        self._lock = threading.Lock()
+
+        if self.path:
+            self._load()
+
+    def plan(self, queries: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Split generate_queries output into (to execute, skipped), keeping priority order.
+
+        A query implied by a kept one is skipped, one differing from a kept
+        one in a single OR-clause is merged into it, and one whose structural
+        overlap with a kept query reaches the threshold is skipped. Skipped entries carry ``skip_reason``.
+        """
+        kept: List[Dict[str, Any]] = []
+        parsed: List[ParsedQuery] = []
+        skipped: List[Dict[str, Any]] = []
+
+        for query_info in queries:
+            candidate = parse_query(query_info["query"])
+            reason = None
+            for i, existing in enumerate(parsed):
+                if candidate.key == existing.key:
+                    reason = f"duplicate of {kept[i]['strategy']}"
+                    break
+
+                overlap = structural_overlap(candidate, existing)
+                if overlap == 1.0:
+                    reason = f"covered by {kept[i]['strategy']}"
+                    break
+
+                merged = merge_queries(existing, candidate)
+                if merged is not None:
+                    parsed[i] = merged
+                    kept[i] = {
+                        **kept[i],
+                        "query": merged.query,
+                        "merged_strategies": kept[i].get("merged_strategies", [kept[i]["strategy"]]) + [query_info["strategy"]]
+                    }
+                    reason = f"merged into {kept[i]['strategy']}"
+                    break
+
+                if overlap >= self.threshold:
+                    reason = f"{overlap:.0%} overlap with {kept[i]['strategy']}"
+                    break
+
+            if reason is None:
+                kept.append(query_info)
+                parsed.append(candidate)
+            else:
+                skipped.append({**query_info, "skip_reason": reason})
+        return kept, skipped
+
+    def overlap_with(self, query: str, executed: List[str]) -> float:
+        """Estimated share of ``query``'s profiles already returned by the executed queries.
+
+        Uses result history when the query's expected results are known,
+        otherwise its structural overlap with the closest executed query.
+        """
+        if not executed:
+            return 0.0
+
+        parsed = parse_query(query)
+        executed_parsed = [parse_query(other) for other in executed]
+        expected = self.expected_results(parsed)
+        if expected is not None and len(expected) >= self.MIN_EVIDENCE:
+            seen: Set[str] = set()
+            for other in executed_parsed:
+                seen |= self.expected_results(other) or set()
+            return len(expected & seen) / len(expected)
+
+        return max(structural_overlap(parsed, other) for other in executed_parsed)
+
+    def expected_results(self, parsed: ParsedQuery) -> Optional[Set[str]]:
+        """Profile URLs the query is expected to return, or None without history"""
+        with self._lock:
+            entry = self._entries.get(parsed.key)
+            if entry is not None:
+                return set(entry["urls"])
+
+            expected: Optional[Set[str]] = None
+            for clause in parsed.clause_sets:
+                urls = self._clause_urls.get(clause)
+                if urls is None:
+                    return None
+                expected = set(urls) if expected is None else expected & urls
+            return expected
+
+    def record(self, query: str, urls: Iterable[str]) -> None:
+        """Add an executed query's result profile URLs to the history"""
+        parsed = parse_query(query)
+        canonical_urls = list(dict.fromkeys(canonical_profile_url(url) for url in urls))
+        with self._lock:
+            self._entries[parsed.key] = {"query": query, "urls": canonical_urls}
+            self._entries.move_to_end(parsed.key)
+            evicted = False
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted = True
+
+            if evicted:
+                self._rebuild_clause_index()
+            else:
+                for clause in parsed.clause_sets:
+                    self._clause_urls.setdefault(clause, set()).update(canonical_urls)
+
+            if self.path:
+                self._save()
+
+    def _rebuild_clause_index(self) -> None:
+        self._clause_urls = {}
+        for entry in self._entries.values():
+            for clause in parse_query(entry["query"]).clause_sets:
+                self._clause_urls.setdefault(clause, set()).update(entry["urls"])
+
+    def _load(self) -> None:
+        """Load history from the backing file, ignoring unreadable files"""
+        if not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except Exception as e:
+            print(f"⚠️ Could not load query history from {self.path}: {e}")
+            return
+
+        for key, entry in stored.items():
+            self._entries[key] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._rebuild_clause_index()
+
+    def _save(self) -> None:
+        """Write history to the backing file atomically"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"⚠️ Could not save query history to {self.path}: {e}")
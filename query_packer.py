@@ -0,0 +1,182 @@
+import json
+import os
+import threading
+from collections import ChainMap
+from dataclasses import dataclass
+from typing import Dict, List, Any, Mapping, Optional, Sequence, Tuple
+from query_overlap import MAX_QUERY_WORDS, canonical_term, count_query_words, parse_query
+from taxonomy import CompiledTemplate
+
+# Google caps the q parameter at 2048 characters
+MAX_QUERY_CHARS = 2048
+
+
+@dataclass(frozen=True)
+class QueryLimits:
+    """Hard limits of the search provider"""
+    max_words: int = MAX_QUERY_WORDS
+    max_chars: int = MAX_QUERY_CHARS
+
+
+class TermStats:
+    """Per-term search outcomes: how often a term was queried and the profiles it yielded.
+
+    Every term of an executed query is credited with the query's outcome.
+    ``value`` turns that into a multiplier around 1.0, shrunk toward the
+    average term while a term has little history. Mirrored to a JSON file
+    when ``path`` is given.
+    """
+
+    # Pseudo-queries of average yield blended into every term's history
+    PRIOR_QUERIES = 3.0
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        # Canonical term -> {"queries", "results", "profiles", "new_profiles"}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        # Running totals over all terms, for the average yield
+        self._total_queries = 0
+        self._total_new_profiles = 0
+        self._lock = threading.Lock()
+
+        if self.path:
+            self._load()
+
+    def record(self, query: str, total_results: int, linkedin_profiles: int, new_profiles: int) -> None:
+        """Credit every term of an executed query with its outcome"""
+        terms = {canonical_term(term) for clause in parse_query(query).clauses for term in clause}
+        with self._lock:
+            for term in terms:
+                stats = self._stats.setdefault(term, {"queries": 0, "results": 0, "profiles": 0, "new_profiles": 0})
+                stats["queries"] += 1
+                stats["results"] += total_results
+                stats["profiles"] += linkedin_profiles
+                stats["new_profiles"] += new_profiles
+                self._total_queries += 1
+                self._total_new_profiles += new_profiles
+
+            if self.path:
+                self._save()
+
+    def get(self, term: str) -> Optional[Dict[str, int]]:
+        with self._lock:
+            stats = self._stats.get(canonical_term(term))
+            return dict(stats) if stats else None
+
+    def value(self, term: str) -> float:
+        """Yield of new profiles per query relative to the average term (1.0 without history)"""
+        with self._lock:
+            if not self._total_new_profiles:
+                return 1.0
+            average = self._total_new_profiles / self._total_queries
+            stats = self._stats.get(canonical_term(term))
+
+        queries = stats["queries"] if stats else 0
+        new_profiles = stats["new_profiles"] if stats else 0
+        smoothed = (new_profiles + self.PRIOR_QUERIES * average) / (queries + self.PRIOR_QUERIES)
+        return smoothed / average
+
+    def _load(self) -> None:
+        """Load statistics from the backing file, ignoring unreadable files"""
+        if not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._stats = json.load(f)
+        except Exception as e:
+            print(f"⚠️ Could not load term statistics from {self.path}: {e}")
+            return
+
+        self._total_queries = sum(stats["queries"] for stats in self._stats.values())
+        self._total_new_profiles = sum(stats["new_profiles"] for stats in self._stats.values())
+
+    def _save(self) -> None:
+        """Write statistics to the backing file atomically"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._stats, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"⚠️ Could not save term statistics to {self.path}: {e}")
+
+
+class QueryPacker:
+    """Fills a query template's OR-clause placeholders with the most valuable terms that fit.
+
+    Candidate terms come ranked by the query generator (most relevant first).
+    Each term's value is a rank prior times its TermStats yield multiplier,
+    its weight the words it adds; a 0/1 knapsack over the word budget left
+    by the rest of the template picks the terms, and the character limit is
+    enforced by dropping the lowest value-per-word terms.
+    """
+
+    # Value of the n-th ranked candidate relative to the first
+    RANK_DECAY = 0.85
+
+    def __init__(self, limits: QueryLimits = QueryLimits(), term_stats: Optional[TermStats] = None):
+        self.limits = limits
+        self.term_stats = term_stats if term_stats is not None else TermStats()
+
+    def pack(self, template: CompiledTemplate, values: Mapping[str, str],
+             candidates: Dict[str, Sequence[str]]) -> str:
+        """Render the template, filling each placeholder in ``candidates`` with chosen terms.
+
+        ``candidates`` maps placeholder -> ranked display terms (e.g. '"python"').
+        Other placeholders come from ``values``.
+        """
+        empty = {placeholder: "" for placeholder in candidates}
+        base = template.render(ChainMap(empty, values))
+        # One "OR" per term is budgeted; the first term of each clause needs none
+        word_budget = self.limits.max_words - count_query_words(base) + len(candidates)
+
+        items = [
+            (placeholder, rank, term)
+            for placeholder, terms in candidates.items()
+            for rank, term in enumerate(dict.fromkeys(terms))
+        ]
+        chosen = self._knapsack(items, word_budget)
+
+        while True:
+            query = template.render(ChainMap(self._clauses(candidates, chosen), values))
+            if (len(query) <= self.limits.max_chars and count_query_words(query) <= self.limits.max_words) or not chosen:
+                return query
+            # Over a limit (e.g. characters): drop the least valuable term per word
+            chosen.remove(min(chosen, key=lambda item: self._value(item) / self._weight(item)))
+
+    def _clauses(self, candidates: Dict[str, Sequence[str]], chosen: List[Tuple[str, int, str]]) -> Dict[str, str]:
+        """Placeholder -> "(a OR b)" in candidate order, "" when nothing was chosen"""
+        clauses = {}
+        for placeholder in candidates:
+            terms = [term for _, _, term in sorted(item for item in chosen if item[0] == placeholder)]
+            clauses[placeholder] = f'({" OR ".join(terms)})' if terms else ""
+        return clauses
+
+    def _value(self, item: Tuple[str, int, str]) -> float:
+        _, rank, term = item
+        return self.RANK_DECAY ** rank * self.term_stats.value(term)
+
+    def _weight(self, item: Tuple[str, int, str]) -> int:
+        return count_query_words(item[2]) + 1
+
+    def _knapsack(self, items: List[Tuple[str, int, str]], capacity: int) -> List[Tuple[str, int, str]]:
+        """Highest total value subset of items within ``capacity`` words"""
+        if capacity <= 0 or not items:
+            return []
+
+        values = [self._value(item) for item in items]
+        weights = [self._weight(item) for item in items]
+
+        # best[c] = (value, chosen item indices) using at most c words
+        best: List[Tuple[float, Tuple[int, ...]]] = [(0.0, ())] * (capacity + 1)
+        for i, (value, weight) in enumerate(zip(values, weights)):
+            for c in range(capacity, weight - 1, -1):
+                candidate = best[c - weight][0] + value
+                if candidate > best[c][0]:
+                    best[c] = (candidate, best[c - weight][1] + (i,))
+        return [items[i] for i in best[capacity][1]]
@@ -0,0 +1,285 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Dict, List, Any, Optional
+from query_overlap import canonical_term, parse_query
+
+# Next to the evaluation cache in db/, in its own file
+DEFAULT_PERFORMANCE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "db", "query_performance.sqlite3")
+
+_COUNTERS = ("queries", "total_results", "linkedin_profiles", "new_profiles", "successes")
+
+
+def _new_aggregate() -> Dict[str, int]:
+    return dict.fromkeys(_COUNTERS, 0)
+
+
+def _summarize(aggregate: Dict[str, int]) -> Dict[str, Any]:
+    """Counts plus the means and yields derived from them"""
+    queries = aggregate["queries"]
+    return {
+        **aggregate,
+        "avg_linkedin_profiles": aggregate["linkedin_profiles"] / queries if queries else 0,
+        "avg_new_profiles": aggregate["new_profiles"] / queries if queries else 0,
+        "success_rate": aggregate["successes"] / queries * 100 if queries else 0,
+        "profile_yield": aggregate["linkedin_profiles"] / aggregate["total_results"] * 100 if aggregate["total_results"] else 0
+    }
+
+
+class QueryPerformanceStore:
+    """Executed-query outcomes in a bounded ring buffer with running aggregates.
+
+    The last ``capacity`` records are kept for display; counts per strategy,
+    role key and query term are updated as each record arrives, so summaries
+    never walk the history. Records and aggregates are written to SQLite every
+    ``FLUSH_INTERVAL`` records (and on ``flush``) and reloaded on start;
+    aggregates are flushed as increments, so several sessions can share a
+    file. Only the ``max_terms`` most recently used terms stay in memory; an
+    evicted term is read back from SQLite when it is used again. The raw
+    record table is pruned to the last ``capacity`` rows, and while SQLite is
+    unavailable at most ``capacity`` unsaved records are held for retry.
+    """
+
+    FLUSH_INTERVAL = 20
+
+    def __init__(self, path: Optional[str] = None, capacity: int = 100, max_terms: int = 2000):
+        self.path = path or os.getenv("SRN_QUERY_PERFORMANCE_PATH", DEFAULT_PERFORMANCE_PATH)
+        self.capacity = capacity
+        self.max_terms = max_terms
+        self._recent: deque = deque(maxlen=capacity)
+        self._totals = _new_aggregate()
+        # Scope ("strategy", "role", "term") -> key -> aggregate
+        self._aggregates: Dict[str, "OrderedDict[str, Dict[str, int]]"] = {
+            scope: OrderedDict() for scope in ("strategy", "role", "term")
+        }
+        # Raw rows beyond capacity would be pruned on flush anyway, so only the newest are held
+        self._pending_records: deque = deque(maxlen=capacity)
+        # Records added since the last flush attempt, successful or not
+        self._unflushed = 0
+        # (scope, key) -> counts added since the last flush; scope "total" has key ""
+        self._pending_deltas: Dict[tuple, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+        if self.path != ":memory:":
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS query_performance (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                query TEXT NOT NULL,
+                strategy TEXT NOT NULL,
+                role_key TEXT,
+                total_results INTEGER NOT NULL,
+                linkedin_profiles INTEGER NOT NULL,
+                new_profiles INTEGER NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS query_performance_aggregates (
+                scope TEXT NOT NULL,
+                key TEXT NOT NULL,
+                queries INTEGER NOT NULL,
+                total_results INTEGER NOT NULL,
+                linkedin_profiles INTEGER NOT NULL,
+                new_profiles INTEGER NOT NULL,
+                successes INTEGER NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (scope, key)
+            )
+            """
+        )
+        self._conn.commit()
+        self._load()
+
+    def record(self, query: str, strategy: str, total_results: int, linkedin_profiles: int,
+               new_profiles: int = 0, role_key: Optional[str] = None) -> Dict[str, Any]:
+        """Add one executed query's outcome, returning the record as ``recent`` lists it"""
+        entry = {
+            "query": query[:80] + "..." if len(query) > 80 else query,
+            "total_results": total_results,
+            "linkedin_profiles": linkedin_profiles,
+            "new_profiles": new_profiles,
+            "strategy": strategy,
+            "role_key": role_key
+        }
+        outcome = (total_results, linkedin_profiles, new_profiles, int(linkedin_profiles > 0))
+        terms = {canonical_term(term) for clause in parse_query(query).clauses for term in clause}
+
+        with self._lock:
+            self._recent.append(entry)
+            self._add(self._totals, outcome)
+            self._add(self._pending_deltas.setdefault(("total", ""), _new_aggregate()), outcome)
+            self._add_scoped("strategy", strategy, outcome)
+            if role_key:
+                self._add_scoped("role", role_key, outcome)
+            for term in terms:
+                self._add_scoped("term", term, outcome)
+
+            self._pending_records.append(
+                (query, strategy, role_key, total_results, linkedin_profiles, new_profiles, time.time())
+            )
+            self._unflushed += 1
+            if self._unflushed >= self.FLUSH_INTERVAL:
+                self._flush()
+        return entry
+
+    def recent(self) -> List[Dict[str, Any]]:
+        """The last ``capacity`` records, oldest first"""
+        with self._lock:
+            return list(self._recent)
+
+    def summary(self) -> Dict[str, Any]:
+        """Totals, means and per-strategy / per-role breakdowns, without walking the history"""
+        with self._lock:
+            return {
+                **_summarize(self._totals),
+                "by_strategy": {key: _summarize(aggregate) for key, aggregate in self._aggregates["strategy"].items()},
+                "by_role": {key: _summarize(aggregate) for key, aggregate in self._aggregates["role"].items()}
+            }
+
+    def term_summary(self, term: str) -> Optional[Dict[str, Any]]:
+        """Aggregates of every recorded query containing the term, or None if unknown"""
+        term = canonical_term(term)
+        with self._lock:
+            aggregate = self._aggregates["term"].get(term) or self._stored("term", term)
+            return _summarize(aggregate) if aggregate["queries"] else None
+
+    def flush(self) -> None:
+        """Write pending records and changed aggregates to SQLite"""
+        with self._lock:
+            self._flush()
+
+    def _add(self, aggregate: Dict[str, int], outcome: tuple) -> None:
+        total_results, linkedin_profiles, new_profiles, success = outcome
+        aggregate["queries"] += 1
+        aggregate["total_results"] += total_results
+        aggregate["linkedin_profiles"] += linkedin_profiles
+        aggregate["new_profiles"] += new_profiles
+        aggregate["successes"] += success
+
+    def _add_scoped(self, scope: str, key: str, outcome: tuple) -> None:
+        aggregates = self._aggregates[scope]
+        aggregate = aggregates.get(key)
+        if aggregate is None:
+            aggregate = aggregates[key] = self._stored(scope, key)
+        else:
+            aggregates.move_to_end(key)
+        self._add(aggregate, outcome)
+        self._add(self._pending_deltas.setdefault((scope, key), _new_aggregate()), outcome)
+
+        if len(aggregates) > self.max_terms:
+            # Memory stays bounded; the evicted key's counts live on in SQLite and _pending_deltas
+            aggregates.popitem(last=False)
+
+    def _stored(self, scope: str, key: str) -> Dict[str, int]:
+        """Counts of a key not in memory: persisted plus not yet flushed"""
+        row = self._conn.execute(
+            f"SELECT {', '.join(_COUNTERS)} FROM query_performance_aggregates WHERE scope = ? AND key = ?",
+            (scope, key)
+        ).fetchone()
+        aggregate = dict(zip(_COUNTERS, row)) if row else _new_aggregate()
+        pending = self._pending_deltas.get((scope, key))
+        if pending:
+            for counter in _COUNTERS:
+                aggregate[counter] += pending[counter]
+        return aggregate
+
+    def _flush(self) -> None:
+        self._unflushed = 0
+        if not self._pending_records and not self._pending_deltas:
+            return
+
+        now = time.time()
+        rows = [
+            (scope, key, *(delta[counter] for counter in _COUNTERS), now)
+            for (scope, key), delta in self._pending_deltas.items()
+        ]
+
+        try:
+            self._conn.executemany(
+                """
+                INSERT INTO query_performance
+                (query, strategy, role_key, total_results, linkedin_profiles, new_profiles, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                self._pending_records
+            )
+            self._conn.execute(
+                "DELETE FROM query_performance WHERE id <= (SELECT MAX(id) FROM query_performance) - ?",
+                (self.capacity,)
+            )
+            self._conn.executemany(
+                """
+                INSERT INTO query_performance_aggregates
+                (scope, key, queries, total_results, linkedin_profiles, new_profiles, successes, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (scope, key) DO UPDATE SET
+                    queries = queries + excluded.queries,
+                    total_results = total_results + excluded.total_results,
+                    linkedin_profiles = linkedin_profiles + excluded.linkedin_profiles,
+                    new_profiles = new_profiles + excluded.new_profiles,
+                    successes = successes + excluded.successes,
+                    updated_at = excluded.updated_at
+                """,
+                rows
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            print(f"⚠️ Could not save query performance to {self.path}: {e}")
+            try:
+                # Undo a partial write so the retry does not insert the records twice
+                self._conn.rollback()
+            except sqlite3.Error:
+                pass
+            # Deltas are kept in full (one per key, not per record) and retried after FLUSH_INTERVAL more records
+            return
+
+        self._pending_records.clear()
+        self._pending_deltas = {}
+
+    def _load(self) -> None:
+        """Restore the aggregates and the most recent records"""
+        rows = self._conn.execute(
+            f"""
+            SELECT scope, key, {", ".join(_COUNTERS)} FROM query_performance_aggregates
+            WHERE scope != 'term'
+            UNION ALL
+            SELECT * FROM (
+                SELECT scope, key, {", ".join(_COUNTERS)} FROM query_performance_aggregates
+                WHERE scope = 'term' ORDER BY updated_at DESC LIMIT ?
+            )
+            """,
+            (self.max_terms,)
+        ).fetchall()
+        for scope, key, *counts in reversed(rows):
+            aggregate = dict(zip(_COUNTERS, counts))
+            if scope == "total":
+                self._totals = aggregate
+            else:
+                self._aggregates[scope][key] = aggregate
+
+        records = self._conn.execute(
+            """
+            SELECT query, strategy, role_key, total_results, linkedin_profiles, new_profiles
+            FROM query_performance ORDER BY id DESC LIMIT ?
+            """,
+            (self.capacity,)
+        ).fetchall()
+        for query, strategy, role_key, total_results, linkedin_profiles, new_profiles in reversed(records):
+            self._recent.append({
+                "query": query[:80] + "..." if len(query) > 80 else query,
+                "total_results": total_results,
+                "linkedin_profiles": linkedin_profiles,
+                "new_profiles": new_profiles,
+                "strategy": strategy,
+                "role_key": role_key
+            })
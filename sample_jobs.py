@@ -0,0 +1,141 @@
+def get_sample_jobs():
+    """Sample job descriptions for testing"""
+    return {
+        "Senior DevOps Engineer (Ivo AI)": """
+Senior DevOps Engineer
+San Francisco, California
+Engineering / On-site
+
+Ivo AI is building tools to help every company in the world make sense of their contracts. The tools are getting popular - we've just raised a $16M Series A. Now, we need your help.
+
+What we're looking for:
+We're looking for a seasoned DevOps engineer to:
+• Own and shape the future of our environment. We still have a relatively minimal footprint, giving you a lot of freedom to design the system.
+• Manage dozens, hundreds, thousands (?) of customer deployments. Customers are cagey about their contracts, so each customer gets their own containers, database, VPC, etc. It's a lot to orchestrate.
+• Instrument our system so we understand performance bottlenecks, errors, etc.
+• Aggregate metrics/logs/health checks into slick dashboards and pager alerts
+• Be on call and lead infrastructure related incidents
+• Get our CI/CD system running super quickly (it currently takes ~12 minutes, boo)
+
+In addition to helping us run a solid, high-performance distributed system, we'd love someone who's as excited about LLMs as we are. You'd be deeply embedded into the engineering team and encouraged to push the DevOps frontier by, for example:
+• Developing on-the-fly LLM evals to monitor the real-time accuracy of our responses
+• Building autonomous agents to detect and diagnose production issues before they become major fires
+
+About you:
+• Passionate about orchestration and Infrastructure as Code. We're currently using Pulumi but open to change if you have strong opinions here.
+• Want to move quickly while striving for best practices.
+• Relentlessly resourceful.
+• Can write code, preferably JavaScript.
+• Experienced with either Azure and or GCP
+• Deeply knowledgeable about computers. Linux systems, containers, SQL databases, cloud infrastructure, etc.
+• 5+ years experience with Infrastructure as Code
+
+Compensation: $170K-$260K base salary
+        """,
+        
+        "ML Engineer (Audio AI Startup)": """
+Machine Learning Engineer
+Remote (US/Canada)
+Engineering / Remote
+
+We're building the future of conversational AI for sales teams. Our platform uses cutting-edge audio AI to understand and optimize sales conversations in real-time.
+
+What you'll do:
+• Design and implement ML models for speech recognition, natural language understanding, and conversation analysis
+• Build production ML pipelines that process millions of sales calls daily
+• Develop real-time inference systems with sub-100ms latency requirements
+• Create ML-powered features like sentiment analysis, objection detection, and coaching recommendations
+• Work on audio signal processing, speaker diarization, and voice activity detection
+• Optimize models for both accuracy and computational efficiency
+
+Requirements:
+• 4+ years of production ML experience, particularly in audio/speech domains
+• Strong background in TensorFlow or PyTorch for deep learning
+• Experience with speech recognition, NLP, or conversational AI systems
+• Proficiency in Python and modern ML tools (MLflow, Kubeflow, etc.)
+• Experience deploying ML models at scale in cloud environments
+• Understanding of audio signal processing and feature extraction
+• Familiarity with transformer architectures and attention mechanisms
+
+Preferred:
+• PhD in ML, Computer Science, or related field
+• Experience with real-time audio processing
+• Background in sales technology or CRM systems
+• Open source contributions to ML projects
+
+Compensation: $180K-$280K + equity
+        """,
+        
+        "Tax Director (Mid-Size CPA Firm)": """
+Tax Director
+Los Angeles, California
+Finance / On-site
+
+SingerLewak, a leading CPA and advisory firm serving privately-held businesses, is seeking an experienced Tax Director to join our growing tax practice.
+
+Responsibilities:
+• Lead and manage a team of 8-12 tax professionals including managers and senior associates
+• Oversee tax compliance and planning for high-net-worth individuals and complex business entities
+• Represent clients before the IRS and state tax authorities during audits and examinations
+• Develop tax strategies for mergers, acquisitions, and business restructuring
+• Manage client relationships and serve as primary tax advisor for key accounts
+• Supervise preparation of federal and state tax returns for individuals, partnerships, S-corps, and C-corps
+• Provide tax research and technical guidance on complex matters
+• Mentor and develop junior staff members
+
+Requirements:
+• CPA license (active and in good standing)
+• 7-10 years of progressive tax experience in public accounting
+• Bachelor's degree in Accounting, Finance, or related field
+• Strong experience with tax research, planning, and compliance
+• Proven supervisory and client management skills
+• Experience with IRS representation and audit defense
+• Knowledge of tax software (ProSystem fx, CCH Axcess, or similar)
+• Strong communication and presentation skills
+
+Preferred:
+• Master's in Taxation or Tax LLM
+• Experience with high-net-worth tax planning
+• Knowledge of estate and gift tax matters
+• Prior experience in regional or Big 4 accounting firm
+
+Compensation: $140K-$180K + bonus + benefits
+        """,
+        
+        "Senior Software Engineer (Fintech)": """
+Senior Software Engineer
+New York, NY / Remote
+Engineering / Hybrid
+
+Join our mission to revolutionize financial infrastructure. We're building next-generation payment systems that power millions of transactions for leading fintech companies.
+
+What you'll build:
+• High-performance payment processing systems handling billions in transaction volume
+• Real-time fraud detection and risk management systems
+• APIs and microservices used by hundreds of fintech partners
+• Data pipelines for financial reporting and compliance
+• Developer tools and SDKs for payment integration
+
+Tech stack:
+• Backend: Python, Java, Go, PostgreSQL, Redis, Kafka
+• Infrastructure: AWS, Kubernetes, Terraform, DataDog
+• Frontend: React, TypeScript, GraphQL
+
+Requirements:
+• 5+ years of software engineering experience
+• Strong background in building scalable backend systems
+• Experience with financial systems, payments, or regulated industries
+• Proficiency in at least two programming languages (Python, Java, Go, etc.)
+• Knowledge of microservices architecture and distributed systems
+• Experience with cloud platforms (AWS preferred)
+• Understanding of database design and optimization
+
+Preferred:
+• Experience in fintech, banking, or payments industry
+• Knowledge of financial regulations (PCI DSS, SOX, etc.)
+• Contributions to open source projects
+• Computer Science degree from top-tier university
+
+Compensation: $180K-$250K + equity + benefits
+        """
+    }
@@ -1,61 +1,96 @@
 import json
 import re
-from typing import Dict, List, Any
-import requests
+from typing import Dict, List, Any, Optional, Union
 import os
 from dotenv import load_dotenv
+from criteria_cache import CriteriaCache, job_description_key
+from evaluation_executor import AdaptiveRateLimiter
+from http_client import get_http_client
+from evaluation_cache import EvaluationCache
+from fit_scoring import apply_fit_scores, recommendations
+from keyword_matcher import KeywordHits, KeywordMatcher
+from taxonomy import CompiledTaxonomy, DEFAULT_TAXONOMY_PATH, get_taxonomy
+from token_index import TokenIndex
+from job_profile import JobProfile
+from memo_cache import ContentMemo
+from prompt_builder import (
+    PromptBuilder, TokenUsageTracker, compact_json, compact_text, count_tokens, truncate_list, truncate_to_tokens
+)
 
 load_dotenv()
 
 class SmartContextDetector:
     """Detects industry, company type, role type, and role subtype from job descriptions"""
     
-    def __init__(self):
-        self.industry_patterns = {
-            "Tech": ["software", "ai", "ml", "saas", "startup", "tech", "developer", "engineer", "data", "cloud"],
-            "Healthcare": ["hospital", "medical", "nurse", "doctor", "clinical", "patient", "healthcare", "pharma"],
-            "Finance": ["finance", "investment", "banking", "trading", "fintech", "accounting", "cpa", "tax"],
-            "Legal": ["law", "attorney", "lawyer", "legal", "litigation", "compliance", "paralegal"],
-            "Retail": ["retail", "ecommerce", "consumer", "merchandising", "store", "sales"],
-            "Education": ["education", "teacher", "professor", "university", "school", "academic"],
-            "Government": ["government", "public sector", "federal", "state", "municipal", "agency"]
-        }
-        
-        self.company_types = {
-            "VC-backed Startup": ["startup", "series a", "series b", "series c", "vc", "venture", "funding", "round"],
-            "Enterprise": ["enterprise", "fortune 500", "large company", "corporation", "multinational"],
-            "Hospital Group": ["hospital", "health system", "medical center", "clinic"],
-            "Public Sector": ["government", "public", "federal", "state", "city", "municipal"]
-        }
+    def __init__(self, memo: Optional[ContentMemo] = None, taxonomy_path: str = DEFAULT_TAXONOMY_PATH):
+        # Contexts memoized by JD content, ignoring whitespace and bullets
+        self.memo = memo if memo is not None else ContentMemo()
         
-        self.role_types = {
-            "Software Engineer": ["software engineer", "developer", "programmer", "swe"],
-            "DevOps Engineer": ["devops", "infrastructure", "site reliability", "platform engineer"],
-            "Data Scientist": ["data scientist", "ml engineer", "ai engineer", "machine learning"],
-            "Product Manager": ["product manager", "pm", "product owner"],
-            "Designer": ["designer", "ux", "ui", "creative director"],
-            "Sales": ["sales", "account manager", "business development", "revenue"],
-            "Marketing": ["marketing", "growth", "content", "brand"],
-            "Finance": ["finance", "accounting", "controller", "cfo", "analyst"],
-            "Legal": ["lawyer", "attorney", "counsel", "legal"],
-            "Operations": ["operations", "project manager", "program manager"]
-        }
+        # Keyword tables and the prebuilt matcher live in data/taxonomy.json
+        self.taxonomy_path = taxonomy_path
+    
+    @property
+    def taxonomy(self) -> CompiledTaxonomy:
+        """Shared compiled taxonomy, hot-reloaded when the data file changes"""
+        return get_taxonomy(self.taxonomy_path)
+    
+    @property
+    def version(self) -> str:
+        """Identifies the tables contexts are detected from, for keying memoized results"""
+        return self.taxonomy.source_hash
+    
+    @property
+    def industry_patterns(self) -> Dict[str, List[str]]:
+        return self.taxonomy.industry_patterns
+    
+    @property
+    def company_types(self) -> Dict[str, List[str]]:
+        return self.taxonomy.company_types
+    
+    @property
+    def role_types(self) -> Dict[str, List[str]]:
+        return self.taxonomy.role_types
+    
+    @property
+    def role_subtypes(self) -> Dict[str, Dict[str, List[str]]]:
+        return self.taxonomy.role_subtypes
+    
+    @property
+    def keyword_tables(self) -> Dict[str, Dict[str, List[str]]]:
+        """Context tables, with role subtype tables keyed "subtype:<role type>" """
+        return self.taxonomy.context_tables
+    
+    @property
+    def keyword_matcher(self) -> KeywordMatcher:
+        """Automaton shared with JobDescriptionAnalyzer, covering both sets of tables"""
+        return self.taxonomy.keyword_matcher
 
-    def detect_context(self, job_description: str) -> Dict[str, str]:
+    def detect_context(self, job_description: Union[str, TokenIndex]) -> Dict[str, str]:
         """Detect context parameters from job description"""
-        text = job_description.lower()
+        if isinstance(job_description, TokenIndex):
+            return self.context_from_hits(self.keyword_matcher.scan(job_description))
         
+        context = self.memo.get_or_compute(
+            job_description,
+            lambda: self.context_from_hits(self.keyword_matcher.scan(job_description)),
+            variant=self.taxonomy.source_hash
+        )
+        # Callers may modify the returned dict
+        return dict(context)
+    
+    def context_from_hits(self, hits: KeywordHits) -> Dict[str, str]:
+        """Context parameters from a keyword scan that covered this detector's tables"""
         # Detect industry
-        industry = self._detect_category(text, self.industry_patterns, "Tech")
+        industry = self._detect_category(hits, "context_industry", "Tech")
         
         # Detect company type
-        company_type = self._detect_category(text, self.company_types, "Enterprise")
+        company_type = self._detect_category(hits, "company_type", "Enterprise")
         
         # Detect role type
-        role_type = self._detect_category(text, self.role_types, "Software Engineer")
+        role_type = self._detect_category(hits, "role_type", "Software Engineer")
         
         # Detect role subtype (more specific)
-        role_subtype = self._detect_role_subtype(text, role_type)
+        role_subtype = self._detect_role_subtype(hits, role_type)
         
         return {
             "industry": industry,
@@ -64,61 +99,150 @@ class SmartContextDetector:
             "role_subtype": role_subtype
         }
     
-    def _detect_category(self, text: str, patterns: Dict[str, List[str]], default: str) -> str:
+    def _detect_category(self, hits: KeywordHits, table: str, default: str) -> str:
         """Detect category based on keyword patterns"""
-        scores = {}
-        for category, keywords in patterns.items():
-            score = sum(1 for keyword in keywords if keyword in text)
-            if score > 0:
-                scores[category] = score
-        
-        return max(scores.items(), key=lambda x: x[1])[0] if scores else default
+        return hits.best(table, default=default)
     
-    def _detect_role_subtype(self, text: str, role_type: str) -> str:
+    def _detect_role_subtype(self, hits: KeywordHits, role_type: str) -> str:
         """Detect specific role subtype"""
-        subtypes = {
-            "Software Engineer": {
-                "Frontend": ["frontend", "react", "angular", "vue", "ui"],
-                "Backend": ["backend", "api", "server", "database"],
-                "Full-stack": ["full-stack", "fullstack"],
-                "Mobile": ["mobile", "ios", "android", "react native"]
-            },
-            "DevOps Engineer": {
-                "Cloud Infrastructure": ["cloud", "aws", "azure", "gcp"],
-                "CI/CD": ["ci/cd", "jenkins", "pipeline"],
-                "Security": ["security", "compliance", "devsecops"]
-            },
-            "Data Scientist": {
-                "ML Engineer": ["ml engineer", "machine learning"],
-                "Data Analyst": ["data analyst", "analytics"],
-                "AI Researcher": ["ai research", "nlp", "computer vision"]
-            }
-        }
-        
-        if role_type in subtypes:
-            for subtype, keywords in subtypes[role_type].items():
-                if any(keyword in text for keyword in keywords):
-                    return subtype
+        if role_type in self.role_subtypes:
+            return hits.first(f"subtype:{role_type}", default="General")
         
         return "General"
 
 class SmartEvaluator:
     """Main class implementing SRN Smart Candidate Evaluation System"""
     
-    def __init__(self):
+    # Retries per call when OpenAI answers 429 or 5xx
+    MAX_RATE_LIMIT_RETRIES = 4
+    # GPT-4 completions (batch mode especially) can take a while to generate
+    OPENAI_TIMEOUT = (5.0, 120.0)
+    
+    # Batch mode: expected completion tokens per candidate and the per-call ceiling
+    BATCH_TOKENS_PER_EVALUATION = 350
+    BATCH_MAX_COMPLETION_TOKENS = 3000
+    # Re-asks for candidates missing from or malformed in a batch response
+    BATCH_PARSE_RETRIES = 1
+    
+    # Token budgets for the variable-length prompt sections
+    PROMPT_BUDGETS = {
+        "job_description": 1200,
+        "criteria_list": 80,
+        "candidate": 150
+    }
+    
+    CRITERIA_LISTS = (
+        ("Core Skills", "core_skills"),
+        ("Domain Expertise", "domain_expertise"),
+        ("Experience Markers", "experience_markers"),
+        ("Company Preferences", "company_preferences"),
+        ("Red Flags", "red_flags"),
+        ("Bonus Signals", "bonus_signals")
+    )
+    
+    SCORING_RUBRIC = """
+        Score each category (be conservative - 8+ only for exceptional candidates):
+        1. Education (0-10): Elite institutions, degrees, certifications
+        2. Career Trajectory (0-10): Growth, ownership, increasing responsibility
+        3. Company Relevance (0-10): High-caliber organizations, industry fit
+        4. Tenure & Stability (0-10): 1.5-3 year averages, justified moves
+        5. Core Skills (0-10): Mastery of mission-critical capabilities
+        6. Bonus Signals (0-5): Exceptional achievements, publications, OSS
+        7. Red Flags (-5 to 0): Dealbreakers, concerning patterns
+    """
+    
+    EVALUATION_SCHEMA = {
+        "scores": {
+            "education": "0-10",
+            "career_trajectory": "0-10",
+            "company_relevance": "0-10",
+            "tenure_stability": "0-10",
+            "core_skills": "0-10",
+            "bonus_signals": "0-5",
+            "red_flags": "-5 to 0"
+        },
+        "strengths": ["2-3 key strengths"],
+        "weaknesses": ["2-3 key concerns or gaps"],
+        "rationale": "2-3 sentence assessment of overall fit",
+        "override_signal": "true if extraordinary signal despite lower score"
+    }
+    
+    CRITERIA_SCHEMA = {
+        "education_requirements": "Elite university requirements or equivalent excellence",
+        "core_skills": ["4-6 mission-critical skills - what they must DO, not just know"],
+        "domain_expertise": ["4-6 technical/domain specific capabilities"],
+        "experience_markers": ["3-4 indicators of high performance and ownership"],
+        "company_preferences": ["Preferred company types, stages, or caliber"],
+        "red_flags": ["3-4 disqualifying factors or concerning patterns"],
+        "bonus_signals": ["3-4 exceptional indicators like OSS, publications, awards"]
+    }
+    
+    # Namespace for SRN FitScore results in the shared evaluation cache
+    CACHE_NAMESPACE = "srn_fitscore"
+    
+    def __init__(self, criteria_cache: Optional[CriteriaCache] = None,
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None,
+                 evaluation_cache: Optional[EvaluationCache] = None):
         self.context_detector = SmartContextDetector()
         self.api_key = os.getenv("OPENAI_API_KEY")
+        self.rate_limiter = rate_limiter if rate_limiter is not None else AdaptiveRateLimiter()
+        self.evaluation_cache = evaluation_cache if evaluation_cache is not None else EvaluationCache()
+        self.token_usage = TokenUsageTracker()
+        self.criteria_cache = criteria_cache if criteria_cache is not None else CriteriaCache(
+            path=os.getenv("SRN_CRITERIA_CACHE_PATH")
+        )
+    
+    def prepare_job(self, job: Union[str, JobProfile]) -> Dict[str, Any]:
+        """Detect context and generate hiring criteria once per job description.
+        
+        Accepts the raw description or a JobProfile, whose key and context are reused.
+        """
+        if isinstance(job, JobProfile):
+            key, job_description = job.key, job.description
+        else:
+            key, job_description = job_description_key(job), job
+        
+        cached = self.criteria_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        if isinstance(job, JobProfile) and job.context:
+            context = dict(job.context)
+        else:
+            context = self.context_detector.detect_context(job_description)
+        
+        try:
+            criteria = self._request_criteria(context, job_description)
+        except Exception:
+            # Fallback criteria are not cached so the next job preparation retries the API
+            return {
+                "job_key": key,
+                "context": context,
+                "hiring_criteria": self._get_fallback_criteria(context['role_type'])
+            }
+        
+        prepared = {
+            "job_key": key,
+            "context": context,
+            "hiring_criteria": criteria
+        }
+        self.criteria_cache.put(key, prepared)
+        return prepared
     
     def evaluate_candidate_smart(self, candidate_profile: Dict, job_description: str) -> Dict[str, Any]:
         """Complete smart evaluation pipeline"""
         
-        # Step 1: Detect context
-        context = self.context_detector.detect_context(job_description)
-        
-        # Step 2: Generate hiring criteria
-        criteria = self._generate_criteria(context, job_description)
+        # Steps 1-2: Detect context and generate hiring criteria (cached per job)
+        prepared_job = self.prepare_job(job_description)
         
         # Step 3: Evaluate candidate using SRN FitScore
+        return self.evaluate_prepared(candidate_profile, prepared_job)
+    
+    def evaluate_prepared(self, candidate_profile: Dict, prepared_job: Dict[str, Any]) -> Dict[str, Any]:
+        """Evaluate a candidate against a job prepared with prepare_job"""
+        context = prepared_job["context"]
+        criteria = prepared_job["hiring_criteria"]
+        
         evaluation = self._evaluate_candidate(candidate_profile, criteria, context)
         
         return {
@@ -129,124 +253,254 @@ class SmartEvaluator:
             "recommendation": self._generate_recommendation(evaluation["final_score"])
         }
     
-    def _generate_criteria(self, context: Dict[str, str], job_description: str) -> Dict[str, Any]:
-        """Generate elite hiring criteria based on context"""
-        
-        prompt = f"""
-        Generate elite hiring criteria for this role using SRN Smart Hiring standards:
-        
-        Industry: {context['industry']}
-        Company Type: {context['company_type']}
-        Role Type: {context['role_type']}
-        Role Subtype: {context['role_subtype']}
-        
-        Job Description:
-        {job_description}
-        
-        Create criteria for top 1-2% performers who can thrive in elite environments like:
-        - Tech: Stripe, Anthropic, OpenAI, Databricks, Google, Apple
-        - Finance: Goldman Sachs, Blackstone, Jane Street, McKinsey
-        - Healthcare: Mayo Clinic, Johns Hopkins, Cleveland Clinic
-        
-        Return a JSON object with:
-        {{
-            "education_requirements": "Elite university requirements or equivalent excellence",
-            "core_skills": ["4-6 mission-critical skills - what they must DO, not just know"],
-            "domain_expertise": ["4-6 technical/domain specific capabilities"],
-            "experience_markers": ["3-4 indicators of high performance and ownership"],
-            "company_preferences": ["Preferred company types, stages, or caliber"],
-            "red_flags": ["3-4 disqualifying factors or concerning patterns"],
-            "bonus_signals": ["3-4 exceptional indicators like OSS, publications, awards"]
-        }}
-        
-        Be demanding - these are elite hiring standards for top 1-2% performers.
-        """
-        
-        try:
-            response = self._call_openai(prompt)
-            criteria = json.loads(response)
-        except Exception:
-            # Fallback criteria
-            criteria = self._get_fallback_criteria(context['role_type'])
-        
-        return criteria
+    def _build_criteria_prompt(self, context: Dict[str, str], job_description: str) -> str:
+        """Build the hiring criteria generation prompt"""
+        
+        return (
+            PromptBuilder()
+            .add("Generate elite hiring criteria for this role using SRN Smart Hiring standards.")
+            .add_section("Context", self._context_line(context))
+            .add_section("Job Description", job_description, budget=self.PROMPT_BUDGETS["job_description"])
+            .add("""
+                Create criteria for top 1-2% performers who can thrive in elite environments like:
+                - Tech: Stripe, Anthropic, OpenAI, Databricks, Google, Apple
+                - Finance: Goldman Sachs, Blackstone, Jane Street, McKinsey
+                - Healthcare: Mayo Clinic, Johns Hopkins, Cleveland Clinic
+            """)
+            .add_section("Return a JSON object", self.CRITERIA_SCHEMA)
+            .add("Be demanding - these are elite hiring standards for top 1-2% performers.")
+            .build()
+        )
+    
+    def _request_criteria(self, context: Dict[str, str], job_description: str) -> Dict[str, Any]:
+        """Ask the model for hiring criteria, raising on API or parse errors"""
+        prompt = self._build_criteria_prompt(context, job_description)
+        response = self._call_openai(prompt, label="criteria")
+        return json.loads(response)
     
     def _evaluate_candidate(self, candidate_profile: Dict, criteria: Dict, context: Dict) -> Dict[str, Any]:
         """Evaluate candidate using SRN FitScore methodology"""
         
-        candidate_text = f"{candidate_profile.get('title', '')} {candidate_profile.get('snippet', '')}"
+        candidate_text = self._candidate_text(candidate_profile)
+        
+        cached = self.evaluation_cache.get(self.CACHE_NAMESPACE, candidate_profile, criteria)
+        if cached is not None:
+            # Category scores are cached; the weighted score follows the current weights
+            apply_fit_scores([cached])
+            return cached
+        
+        builder = PromptBuilder().add("Evaluate this candidate using the SRN FitScore methodology on a 0-10 scale.")
+        self._add_criteria_sections(builder, criteria, context)
+        evaluation_prompt = (
+            builder
+            .add_section("Candidate Profile", candidate_text, budget=self.PROMPT_BUDGETS["candidate"])
+            .add(self.SCORING_RUBRIC)
+            .add_section("Return JSON", self.EVALUATION_SCHEMA)
+            .add("Be conservative in scoring - these are elite standards.")
+            .build()
+        )
         
-        evaluation_prompt = f"""
-        Evaluate this candidate using the SRN FitScore methodology on a 0-10 scale.
+        try:
+            response = self._call_openai(evaluation_prompt, label="evaluation")
+            evaluation = json.loads(response)
+            # The weighted score is computed locally from the category scores
+            apply_fit_scores([evaluation])
+        except Exception:
+            # Fallback evaluation (never cached, so the next search retries the API)
+            return self._fallback_evaluation(candidate_text)
         
-        CONTEXT:
-        Industry: {context['industry']}
-        Company Type: {context['company_type']}
-        Role: {context['role_type']} - {context['role_subtype']}
+        self.evaluation_cache.put(self.CACHE_NAMESPACE, candidate_profile, criteria, evaluation)
+        return evaluation
+    
+    def evaluate_batch(self, candidate_profiles: List[Dict], prepared_job: Dict[str, Any],
+                       batch_size: int = 5) -> List[Dict[str, Any]]:
+        """Evaluate several candidates per LLM call against a prepared job.
+        
+        Returns one assessment per candidate, in input order, shaped like evaluate_prepared.
+        """
+        context = prepared_job["context"]
+        criteria = prepared_job["hiring_criteria"]
+        
+        evaluations = self._evaluate_candidates_batch(candidate_profiles, criteria, context, batch_size)
+        
+        return [
+            {
+                "context": context,
+                "hiring_criteria": criteria,
+                "evaluation": evaluation,
+                "fit_score": evaluation["final_score"],
+                "recommendation": self._generate_recommendation(evaluation["final_score"])
+            }
+            for evaluation in evaluations
+        ]
+    
+    def _evaluate_candidates_batch(self, candidate_profiles: List[Dict], criteria: Dict, context: Dict,
+                                   batch_size: int) -> List[Dict[str, Any]]:
+        """Score candidates in batches that fit the completion token budget"""
+        
+        # Keep each call's expected output under the completion limit
+        max_per_call = max(1, self.BATCH_MAX_COMPLETION_TOKENS // self.BATCH_TOKENS_PER_EVALUATION)
+        per_call = max(1, min(batch_size, max_per_call))
+        
+        items = [(f"c{i + 1}", profile) for i, profile in enumerate(candidate_profiles)]
+        
+        # Candidates scored recently against the same criteria skip the API entirely
+        evaluations = {}
+        pending = []
+        for candidate_id, profile in items:
+            cached = self.evaluation_cache.get(self.CACHE_NAMESPACE, profile, criteria)
+            if cached is not None:
+                evaluations[candidate_id] = cached
+            else:
+                pending.append((candidate_id, profile))
+        # Category scores are cached; the weighted score follows the current weights
+        apply_fit_scores(list(evaluations.values()))
+        
+        for start in range(0, len(pending), per_call):
+            sub_batch = pending[start:start + per_call]
+            evaluations.update(
+                self._evaluate_sub_batch(sub_batch, criteria, context, self.BATCH_PARSE_RETRIES)
+            )
+        
+        return [evaluations[candidate_id] for candidate_id, _ in items]
+    
+    def _evaluate_sub_batch(self, items: List[tuple], criteria: Dict, context: Dict,
+                            retries_left: int) -> Dict[str, Dict[str, Any]]:
+        """Score one sub-batch, splitting on truncation and retrying unparsed entries"""
         
-        ELITE HIRING CRITERIA:
-        Education: {criteria.get('education_requirements', '')}
-        Core Skills: {criteria.get('core_skills', [])}
-        Domain Expertise: {criteria.get('domain_expertise', [])}
-        Experience Markers: {criteria.get('experience_markers', [])}
-        Company Preferences: {criteria.get('company_preferences', [])}
-        Red Flags: {criteria.get('red_flags', [])}
-        Bonus Signals: {criteria.get('bonus_signals', [])}
+        if len(items) == 1:
+            candidate_id, profile = items[0]
+            return {candidate_id: self._evaluate_candidate(profile, criteria, context)}
         
-        CANDIDATE PROFILE:
-        {candidate_text}
+        prompt = self._build_batch_prompt(items, criteria, context)
+        max_tokens = self.BATCH_TOKENS_PER_EVALUATION * len(items)
         
-        Score each category (be conservative - 8+ only for exceptional candidates):
+        try:
+            choice = self._chat_completion(prompt, max_tokens=max_tokens, label="batch_evaluation")
+        except Exception:
+            # Fallback evaluation for the whole sub-batch, as for single candidates
+            return {
+                candidate_id: self._fallback_evaluation(self._candidate_text(profile))
+                for candidate_id, profile in items
+            }
         
-        1. 🎓 Education (0-10): Elite institutions, degrees, certifications
-        2. 📈 Career Trajectory (0-10): Growth, ownership, increasing responsibility  
-        3. 🏢 Company Relevance (0-10): High-caliber organizations, industry fit
-        4. ⏳ Tenure & Stability (0-10): 1.5-3 year averages, justified moves
-        5. 🎯 Core Skills (0-10): Mastery of mission-critical capabilities
-        6. 🌟 Bonus Signals (0-5): Exceptional achievements, publications, OSS
-        7. ❌ Red Flags (-5 to 0): Dealbreakers, concerning patterns
-        
-        Calculate final weighted score:
-        - Education: 20%
-        - Career Trajectory: 20% 
-        - Company Relevance: 15%
-        - Tenure & Stability: 15%
-        - Core Skills: 20%
-        - Bonus Signals: 5%
-        - Red Flags: -15%
-        
-        Return JSON:
-        {{
-            "scores": {{
-                "education": 0-10,
-                "career_trajectory": 0-10,
-                "company_relevance": 0-10,
-                "tenure_stability": 0-10,
-                "core_skills": 0-10,
-                "bonus_signals": 0-5,
-                "red_flags": -5 to 0
-            }},
-            "final_score": "calculated weighted score 0-10",
-            "strengths": ["2-3 key strengths"],
-            "weaknesses": ["2-3 key concerns or gaps"],
-            "rationale": "2-3 sentence assessment of overall fit",
-            "override_signal": "true if extraordinary signal despite lower score"
-        }}
-        
-        Be conservative in scoring - these are elite standards.
-        """
+        if choice.get("finish_reason") == "length":
+            # Output was cut off, so score each half separately
+            middle = len(items) // 2
+            evaluations = self._evaluate_sub_batch(items[:middle], criteria, context, retries_left)
+            evaluations.update(self._evaluate_sub_batch(items[middle:], criteria, context, retries_left))
+            return evaluations
+        
+        evaluations = self._parse_batch_response(choice["message"]["content"], [cid for cid, _ in items])
+        # One vectorized pass computes the weighted score for the whole sub-batch
+        apply_fit_scores(list(evaluations.values()))
+        for candidate_id, profile in items:
+            if candidate_id in evaluations:
+                self.evaluation_cache.put(self.CACHE_NAMESPACE, profile, criteria, evaluations[candidate_id])
+        
+        failed = [(candidate_id, profile) for candidate_id, profile in items if candidate_id not in evaluations]
+        if failed:
+            if retries_left > 0:
+                evaluations.update(self._evaluate_sub_batch(failed, criteria, context, retries_left - 1))
+            else:
+                for candidate_id, profile in failed:
+                    evaluations[candidate_id] = self._fallback_evaluation(self._candidate_text(profile))
+        
+        return evaluations
+    
+    def _parse_batch_response(self, response: str, candidate_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Parse a JSON array of evaluations, keeping only well-formed entries"""
         
         try:
-            response = self._call_openai(evaluation_prompt)
-            evaluation = json.loads(response)
+            entries = json.loads(response)
         except Exception:
-            # Fallback evaluation
-            evaluation = self._fallback_evaluation(candidate_text)
+            # Models sometimes wrap the array in prose or code fences
+            match = re.search(r'\[.*\]', response, re.DOTALL)
+            if not match:
+                return {}
+            try:
+                entries = json.loads(match.group(0))
+            except Exception:
+                return {}
+        
+        if not isinstance(entries, list):
+            return {}
+        
+        evaluations = {}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            candidate_id = str(entry.pop("id", ""))
+            if candidate_id not in candidate_ids:
+                continue
+            if not isinstance(entry.get("scores"), dict):
+                continue
+            evaluations[candidate_id] = entry
+        
+        return evaluations
+    
+    def _build_batch_prompt(self, items: List[tuple], criteria: Dict, context: Dict) -> str:
+        """Build one prompt that scores several candidates against the same criteria"""
+        
+        # Each snippet gets its own budget so one long profile cannot crowd out the rest
+        candidates_block = "\n".join(
+            f"[{candidate_id}] "
+            + truncate_to_tokens(compact_text(self._candidate_text(profile)), self.PROMPT_BUDGETS["candidate"])
+            for candidate_id, profile in items
+        )
         
-        return evaluation
+        builder = PromptBuilder().add("""
+            Evaluate each candidate below using the SRN FitScore methodology on a 0-10 scale.
+            Score every candidate independently against the same criteria.
+        """)
+        self._add_criteria_sections(builder, criteria, context)
+        return (
+            builder
+            .add_section("Candidate Profiles", candidates_block)
+            .add(self.SCORING_RUBRIC)
+            .add(
+                "Return a JSON array with one object per candidate. Each object has "
+                '"id" (the candidate id in brackets, e.g. "c1") plus:'
+            )
+            .add(compact_json(self.EVALUATION_SCHEMA))
+            .add("Be conservative in scoring - these are elite standards.")
+            .build()
+        )
+    
+    def _add_criteria_sections(self, builder: PromptBuilder, criteria: Dict, context: Dict) -> None:
+        """Context and hiring criteria sections shared by single and batch prompts"""
+        list_budget = self.PROMPT_BUDGETS["criteria_list"]
+        
+        lines = [
+            "Elite Hiring Criteria:",
+            f"Education: {truncate_to_tokens(str(criteria.get('education_requirements', '')), list_budget)}"
+        ]
+        for label, key in self.CRITERIA_LISTS:
+            items = criteria.get(key, [])
+            if not isinstance(items, list):
+                items = [items]
+            lines.append(f"{label}: {'; '.join(truncate_list(items, list_budget))}")
+        
+        builder.add_section("Context", self._context_line(context))
+        builder.add("\n".join(lines))
+    
+    def _context_line(self, context: Dict[str, str]) -> str:
+        """One-line summary of the detected job context"""
+        return (
+            f"Industry: {context['industry']} | Company Type: {context['company_type']} | "
+            f"Role: {context['role_type']} - {context['role_subtype']}"
+        )
+    
+    def _candidate_text(self, candidate_profile: Dict) -> str:
+        """Title and snippet text the evaluator scores"""
+        return f"{candidate_profile.get('title', '')} {candidate_profile.get('snippet', '')}"
     
-    def _call_openai(self, prompt: str) -> str:
+    def _call_openai(self, prompt: str, label: str = "chat") -> str:
         """Call OpenAI API"""
+        return self._chat_completion(prompt, label=label)["message"]["content"]
+    
+    def _chat_completion(self, prompt: str, max_tokens: Optional[int] = None, label: str = "chat") -> Dict[str, Any]:
+        """Call the OpenAI chat completions API and return the first choice"""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
@@ -257,14 +511,32 @@ class SmartEvaluator:
             "messages": [{"role": "user", "content": prompt}],
             "temperature": 0.1
         }
+        if max_tokens:
+            data["max_tokens"] = max_tokens
         
-        response = requests.post(
+        # Concurrent workers share one limiter, so a 429 slows all of them down
+        response = get_http_client().post(
             "https://api.openai.com/v1/chat/completions",
             headers=headers,
-            json=data
+            json=data,
+            timeout=self.OPENAI_TIMEOUT,
+            rate_limiter=self.rate_limiter,
+            max_retries=self.MAX_RATE_LIMIT_RETRIES,
+            # Repeating a chat completion has no side effects
+            idempotent=True
         )
         response.raise_for_status()
-        return response.json()["choices"][0]["message"]["content"]
+        body = response.json()
+        choice = body["choices"][0]
+        
+        # Prefer the API's own usage numbers, count locally if they are missing
+        usage = body.get("usage") or {}
+        self.token_usage.record(
+            label,
+            usage.get("prompt_tokens") or count_tokens(prompt),
+            usage.get("completion_tokens") or count_tokens(choice["message"].get("content") or "")
+        )
+        return choice
     
     def _get_fallback_criteria(self, role_type: str) -> Dict[str, Any]:
         """Fallback criteria when API fails"""
@@ -280,7 +552,7 @@ class SmartEvaluator:
     
     def _fallback_evaluation(self, candidate_text: str) -> Dict[str, Any]:
         """Fallback evaluation when API fails"""
-        return {
+        evaluation = {
             "scores": {
                 "education": 6.0,
                 "career_trajectory": 6.0,
@@ -290,23 +562,18 @@ class SmartEvaluator:
                 "bonus_signals": 2.0,
                 "red_flags": 0.0
             },
-            "final_score": 6.0,
             "strengths": ["Professional experience visible"],
             "weaknesses": ["Limited profile information"],
             "rationale": "Assessment based on limited LinkedIn data. Full evaluation requires detailed resume.",
             "override_signal": False
         }
+        # Same scorer as real evaluations, so rescoring a fallback leaves its score unchanged
+        apply_fit_scores([evaluation])
+        return evaluation
     
     def _generate_recommendation(self, score: float) -> str:
         """Generate hiring recommendation based on SRN FitScore"""
-        if score >= 8.5:
-            return "🟢 STRONG HIRE - Exceptional candidate meeting elite standards"
-        elif score >= 7.0:
-            return "🟡 CONSIDER - Good candidate, requires additional evaluation"
-        elif score >= 5.5:
-            return "🟠 WEAK - Below standards, significant concerns"
-        else:
-            return "🔴 NO HIRE - Does not meet minimum requirements"
+        return recommendations([score])[0]
 
 if __name__ == "__main__":
     # Test the smart evaluator
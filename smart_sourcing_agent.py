@@ -1,12 +1,14 @@
 from typing import List, Dict, Any, Optional
 import json
 from dataclasses import dataclass
-import requests
 import os
 from datetime import datetime
 from dotenv import load_dotenv
 import time
 import re
+from evaluation_cache import EvaluationCache
+from http_client import get_http_client
+from prompt_builder import PromptBuilder, TokenUsageTracker, compact_json, count_tokens
 
 load_dotenv()
 
@@ -33,9 +35,23 @@ class AgentMemory:
             }
 
 class SmartSourcingAgent:
-    def __init__(self):
+    # Namespace for this agent's 0-100 scores in the shared evaluation cache
+    CACHE_NAMESPACE = "smart_sourcing"
+    
+    # GPT-4 completions can take a while to generate
+    OPENAI_TIMEOUT = (5.0, 120.0)
+    
+    # Token budgets for the JSON blobs embedded in prompts
+    PROMPT_BUDGETS = {
+        "profile": 400,
+        "criteria": 800
+    }
+    
+    def __init__(self, evaluation_cache: Optional[EvaluationCache] = None):
         """Initialize the smart sourcing agent with memory and tools"""
         self.memory = AgentMemory()
+        self.evaluation_cache = evaluation_cache if evaluation_cache is not None else EvaluationCache()
+        self.token_usage = TokenUsageTracker()
         self.api_key = os.getenv("OPENAI_API_KEY")
         self.google_api_key = os.getenv("GOOGLE_API_KEY")
         self.search_engine_id = os.getenv("GOOGLE_SEARCH_ENGINE_ID")
@@ -54,13 +70,25 @@ class SmartSourcingAgent:
         }
         
         try:
-            response = requests.post(
+            response = get_http_client().post(
                 "https://api.openai.com/v1/chat/completions",
                 headers=headers,
-                json=data
+                json=data,
+                timeout=self.OPENAI_TIMEOUT,
+                # Repeating a chat completion has no side effects
+                idempotent=True
             )
             response.raise_for_status()
-            return response.json()["choices"][0]["message"]["content"]
+            body = response.json()
+            content = body["choices"][0]["message"]["content"]
+            
+            usage = body.get("usage") or {}
+            self.token_usage.record(
+                "chat",
+                usage.get("prompt_tokens") or count_tokens(prompt),
+                usage.get("completion_tokens") or count_tokens(content or "")
+            )
+            return content
         except Exception as e:
             print(f"OpenAI API error: {e}")
             return ""
@@ -96,33 +124,52 @@ class SmartSourcingAgent:
 
     def generate_xray_query(self, criteria: Dict) -> str:
         """Generate a LinkedIn X-Ray search query based on job criteria"""
-        prompt = f"""Generate a LinkedIn X-Ray search query based on the following job criteria:
-        {json.dumps(criteria, indent=2)}
-        
-        Create a Google X-Ray search query that will find relevant LinkedIn profiles.
-        Use Boolean operators and specific filters to target the right candidates.
-        Return only the search query string."""
+        prompt = (
+            PromptBuilder()
+            .add("Generate a LinkedIn X-Ray search query based on the following job criteria.")
+            .add_section("Job Criteria", compact_json(criteria), budget=self.PROMPT_BUDGETS["criteria"])
+            .add("""
+                Create a Google X-Ray search query that will find relevant LinkedIn profiles.
+                Use Boolean operators and specific filters to target the right candidates.
+                Return only the search query string.
+            """)
+            .build()
+        )
         
         response = self.call_openai(prompt)
         return response.strip()
 
     def evaluate_candidate(self, profile: Dict, criteria: Dict) -> Dict:
         """Evaluate a candidate's profile against job criteria"""
-        prompt = f"""Evaluate the candidate's profile against the job requirements:
-        Candidate Profile: {json.dumps(profile, indent=2)}
-        Job Context: {json.dumps(criteria, indent=2)}
-        
-        Score the candidate on:
-        1. skills_match (0-100)
-        2. experience_level (0-100)
-        3. industry_fit (0-100)
-        4. education_match (0-100)
-        5. overall_fit (0-100)
+        cached = self.evaluation_cache.get(self.CACHE_NAMESPACE, profile, criteria)
+        if cached is not None:
+            self.memory.candidate_evaluations.append({
+                "timestamp": datetime.now(),
+                "profile": profile,
+                "score": cached
+            })
+            return cached
         
-        Return ONLY a JSON object with these exact keys and numeric values."""
+        prompt = (
+            PromptBuilder()
+            .add("Evaluate the candidate's profile against the job requirements.")
+            .add_section("Candidate Profile", compact_json(profile), budget=self.PROMPT_BUDGETS["profile"])
+            .add_section("Job Context", compact_json(criteria), budget=self.PROMPT_BUDGETS["criteria"])
+            .add("""
+                Score the candidate on:
+                1. skills_match (0-100)
+                2. experience_level (0-100)
+                3. industry_fit (0-100)
+                4. education_match (0-100)
+                5. overall_fit (0-100)
+                Return ONLY a JSON object with these exact keys and numeric values.
+            """)
+            .build()
+        )
         
         response = self.call_openai(prompt)
         
+        parsed = True
         try:
             score = json.loads(response)
         except Exception:
@@ -132,6 +179,7 @@ class SmartSourcingAgent:
                 try:
                     score = json.loads(match.group(0))
                 except:
+                    parsed = False
                     score = {
                         "skills_match": 50,
                         "experience_level": 50,
@@ -140,6 +188,7 @@ class SmartSourcingAgent:
                         "overall_fit": 50
                     }
             else:
+                parsed = False
                 score = {
                     "skills_match": 50,
                     "experience_level": 50,
@@ -148,6 +197,10 @@ class SmartSourcingAgent:
                     "overall_fit": 50
                 }
         
+        # Default scores are not cached so the next run retries the API
+        if parsed:
+            self.evaluation_cache.put(self.CACHE_NAMESPACE, profile, criteria, score)
+        
         self.memory.candidate_evaluations.append({
             "timestamp": datetime.now(),
             "profile": profile,
@@ -169,7 +222,7 @@ class SmartSourcingAgent:
         print(f"📊 Requesting {min(num_results, 10)} results")
         
         try:
-            response = requests.get("https://www.googleapis.com/customsearch/v1", params=params)
+            response = get_http_client().get("https://www.googleapis.com/customsearch/v1", params=params)
             print(f"📡 API Response Status: {response.status_code}")
             response.raise_for_status()
             results = response.json()
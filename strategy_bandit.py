@@ -0,0 +1,123 @@
+import json
+import os
+import random
+import threading
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+
+
+class StrategyBandit:
+    """Thompson-sampling allocation of search calls across query strategies.
+
+    Each (role key, strategy) arm keeps a Beta posterior over the share of
+    result slots that turn into unique, well-scoring profiles. ``allocate``
+    draws one sample per arm and hands out the search's page budget greedily,
+    each extra page of a query worth ``PAGE_DECAY`` of the one before it.
+    Arms with fewer than ``WARMUP_CALLS`` calls get a page first, so a new
+    role family tries every strategy before its budget concentrates.
+    ``record`` folds a search's outcome back in; arms are mirrored to a JSON
+    file when ``path`` is given.
+    """
+
+    # Beta prior: about two useful profiles per page of ten results
+    PRIOR = (1.0, 4.0)
+    # Value of a query's next results page relative to its previous one
+    PAGE_DECAY = 0.6
+    # Google CSE serves at most 100 results per query; three pages keeps spend bounded
+    MAX_PAGES = 3
+    # Calls per arm before it competes on samples alone
+    WARMUP_CALLS = 2
+    # Evidence beyond this many result slots is scaled down so arms keep adapting
+    MAX_EVIDENCE = 500.0
+
+    def __init__(self, path: Optional[str] = None, seed: Optional[int] = None):
+        self.path = path
+        # "role_key/strategy" -> {"alpha", "beta", "calls"}
+        self._arms: Dict[str, Dict[str, float]] = {}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+        if self.path:
+            self._load()
+
+    def allocate(self, role_key: str, strategies: Sequence[str], budget: int) -> Dict[str, int]:
+        """Pages per strategy for one search, best sampled strategy first; 0 means skip it"""
+        with self._lock:
+            samples = {strategy: self._rng.betavariate(*self._posterior(role_key, strategy)) for strategy in strategies}
+            warming_up = [strategy for strategy in strategies
+                          if self._arms.get(self._key(role_key, strategy), {}).get("calls", 0) < self.WARMUP_CALLS]
+
+        pages = dict.fromkeys(sorted(strategies, key=samples.get, reverse=True), 0)
+        for strategy in sorted(warming_up, key=samples.get, reverse=True)[:budget]:
+            pages[strategy] = 1
+        for _ in range(min(budget, len(pages) * self.MAX_PAGES) - sum(pages.values())):
+            strategy = max(
+                (strategy for strategy in pages if pages[strategy] < self.MAX_PAGES),
+                key=lambda strategy: samples[strategy] * self.PAGE_DECAY ** pages[strategy]
+            )
+            pages[strategy] += 1
+        return pages
+
+    def record(self, role_key: str, strategy: str, calls: int, slots: int, reward: float) -> None:
+        """Add a strategy's outcome: ``reward`` useful profiles out of ``slots`` result slots over ``calls`` calls"""
+        reward = min(max(reward, 0.0), slots)
+        with self._lock:
+            arm = self._arms.setdefault(self._key(role_key, strategy), {"alpha": 0.0, "beta": 0.0, "calls": 0})
+            arm["alpha"] += reward
+            arm["beta"] += slots - reward
+            arm["calls"] += calls
+
+            evidence = arm["alpha"] + arm["beta"]
+            if evidence > self.MAX_EVIDENCE:
+                arm["alpha"] *= self.MAX_EVIDENCE / evidence
+                arm["beta"] *= self.MAX_EVIDENCE / evidence
+
+            if self.path:
+                self._save()
+
+    def expected_yield(self, role_key: str, strategy: str) -> float:
+        """Posterior mean share of result slots that become useful profiles"""
+        with self._lock:
+            alpha, beta = self._posterior(role_key, strategy)
+        return alpha / (alpha + beta)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-arm evidence and posterior mean, keyed "role_key/strategy" """
+        with self._lock:
+            return {
+                key: {**arm, "expected_yield": (arm["alpha"] + self.PRIOR[0]) / (arm["alpha"] + arm["beta"] + sum(self.PRIOR))}
+                for key, arm in self._arms.items()
+            }
+
+    def _key(self, role_key: str, strategy: str) -> str:
+        return f"{role_key}/{strategy}"
+
+    def _posterior(self, role_key: str, strategy: str) -> Tuple[float, float]:
+        arm = self._arms.get(self._key(role_key, strategy))
+        if arm is None:
+            return self.PRIOR
+        return arm["alpha"] + self.PRIOR[0], arm["beta"] + self.PRIOR[1]
+
+    def _load(self) -> None:
+        """Load arms from the backing file, ignoring unreadable files"""
+        if not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._arms = json.load(f)
+        except Exception as e:
+            print(f"⚠️ Could not load strategy statistics from {self.path}: {e}")
+
+    def _save(self) -> None:
+        """Write arms to the backing file atomically"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._arms, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"⚠️ Could not save strategy statistics to {self.path}: {e}")
@@ -1,8 +1,8 @@
 import streamlit as st
 import json
 import time
-from advanced_sourcing_agent import AdvancedSourcingAgent
-from smart_evaluator import SmartEvaluator
+from advanced_sourcing_agent import AdvancedSourcingAgent, SearchEvent
+from sample_jobs import get_sample_jobs
 
 # Page configuration
 st.set_page_config(
@@ -61,152 +61,11 @@ def init_session_state():
     if 'agent' not in st.session_state:
         st.session_state.agent = AdvancedSourcingAgent()
     if 'smart_evaluator' not in st.session_state:
-        st.session_state.smart_evaluator = SmartEvaluator()
+        # Share the agent's evaluator so criteria cached by "Analyze Job Only" are reused by searches
+        st.session_state.smart_evaluator = st.session_state.agent.smart_evaluator
     if 'search_results' not in st.session_state:
         st.session_state.search_results = None
 
-def get_sample_jobs():
-    """Sample job descriptions for testing"""
-    return {
-        "Senior DevOps Engineer (Ivo AI)": """
-Senior DevOps Engineer
-San Francisco, California
-Engineering / On-site
-
-Ivo AI is building tools to help every company in the world make sense of their contracts. The tools are getting popular - we've just raised a $16M Series A. Now, we need your help.
-
-What we're looking for:
-We're looking for a seasoned DevOps engineer to:
-• Own and shape the future of our environment. We still have a relatively minimal footprint, giving you a lot of freedom to design the system.
-• Manage dozens, hundreds, thousands (?) of customer deployments. Customers are cagey about their contracts, so each customer gets their own containers, database, VPC, etc. It's a lot to orchestrate.
-• Instrument our system so we understand performance bottlenecks, errors, etc.
-• Aggregate metrics/logs/health checks into slick dashboards and pager alerts
-• Be on call and lead infrastructure related incidents
-• Get our CI/CD system running super quickly (it currently takes ~12 minutes, boo)
-
-In addition to helping us run a solid, high-performance distributed system, we'd love someone who's as excited about LLMs as we are. You'd be deeply embedded into the engineering team and encouraged to push the DevOps frontier by, for example:
-• Developing on-the-fly LLM evals to monitor the real-time accuracy of our responses
-• Building autonomous agents to detect and diagnose production issues before they become major fires
-
-About you:
-• Passionate about orchestration and Infrastructure as Code. We're currently using Pulumi but open to change if you have strong opinions here.
-• Want to move quickly while striving for best practices.
-• Relentlessly resourceful.
-• Can write code, preferably JavaScript.
-• Experienced with either Azure and or GCP
-• Deeply knowledgeable about computers. Linux systems, containers, SQL databases, cloud infrastructure, etc.
-• 5+ years experience with Infrastructure as Code
-
-Compensation: $170K-$260K base salary
-        """,
-        
-        "ML Engineer (Audio AI Startup)": """
-Machine Learning Engineer
-Remote (US/Canada)
-Engineering / Remote
-
-We're building the future of conversational AI for sales teams. Our platform uses cutting-edge audio AI to understand and optimize sales conversations in real-time.
-
-What you'll do:
-• Design and implement ML models for speech recognition, natural language understanding, and conversation analysis
-• Build production ML pipelines that process millions of sales calls daily
-• Develop real-time inference systems with sub-100ms latency requirements
-• Create ML-powered features like sentiment analysis, objection detection, and coaching recommendations
-• Work on audio signal processing, speaker diarization, and voice activity detection
-• Optimize models for both accuracy and computational efficiency
-
-Requirements:
-• 4+ years of production ML experience, particularly in audio/speech domains
-• Strong background in TensorFlow or PyTorch for deep learning
-• Experience with speech recognition, NLP, or conversational AI systems
-• Proficiency in Python and modern ML tools (MLflow, Kubeflow, etc.)
-• Experience deploying ML models at scale in cloud environments
-• Understanding of audio signal processing and feature extraction
-• Familiarity with transformer architectures and attention mechanisms
-
-Preferred:
-• PhD in ML, Computer Science, or related field
-• Experience with real-time audio processing
-• Background in sales technology or CRM systems
-• Open source contributions to ML projects
-
-Compensation: $180K-$280K + equity
-        """,
-        
-        "Tax Director (Mid-Size CPA Firm)": """
-Tax Director
-Los Angeles, California
-Finance / On-site
-
-SingerLewak, a leading CPA and advisory firm serving privately-held businesses, is seeking an experienced Tax Director to join our growing tax practice.
-
-Responsibilities:
-• Lead and manage a team of 8-12 tax professionals including managers and senior associates
-• Oversee tax compliance and planning for high-net-worth individuals and complex business entities
-• Represent clients before the IRS and state tax authorities during audits and examinations
-• Develop tax strategies for mergers, acquisitions, and business restructuring
-• Manage client relationships and serve as primary tax advisor for key accounts
-• Supervise preparation of federal and state tax returns for individuals, partnerships, S-corps, and C-corps
-• Provide tax research and technical guidance on complex matters
-• Mentor and develop junior staff members
-
-Requirements:
-• CPA license (active and in good standing)
-• 7-10 years of progressive tax experience in public accounting
-• Bachelor's degree in Accounting, Finance, or related field
-• Strong experience with tax research, planning, and compliance
-• Proven supervisory and client management skills
-• Experience with IRS representation and audit defense
-• Knowledge of tax software (ProSystem fx, CCH Axcess, or similar)
-• Strong communication and presentation skills
-
-Preferred:
-• Master's in Taxation or Tax LLM
-• Experience with high-net-worth tax planning
-• Knowledge of estate and gift tax matters
-• Prior experience in regional or Big 4 accounting firm
-
-Compensation: $140K-$180K + bonus + benefits
-        """,
-        
-        "Senior Software Engineer (Fintech)": """
-Senior Software Engineer
-New York, NY / Remote
-Engineering / Hybrid
-
-Join our mission to revolutionize financial infrastructure. We're building next-generation payment systems that power millions of transactions for leading fintech companies.
-
-What you'll build:
-• High-performance payment processing systems handling billions in transaction volume
-• Real-time fraud detection and risk management systems
-• APIs and microservices used by hundreds of fintech partners
-• Data pipelines for financial reporting and compliance
-• Developer tools and SDKs for payment integration
-
-Tech stack:
-• Backend: Python, Java, Go, PostgreSQL, Redis, Kafka
-• Infrastructure: AWS, Kubernetes, Terraform, DataDog
-• Frontend: React, TypeScript, GraphQL
-
-Requirements:
-• 5+ years of software engineering experience
-• Strong background in building scalable backend systems
-• Experience with financial systems, payments, or regulated industries
-• Proficiency in at least two programming languages (Python, Java, Go, etc.)
-• Knowledge of microservices architecture and distributed systems
-• Experience with cloud platforms (AWS preferred)
-• Understanding of database design and optimization
-
-Preferred:
-• Experience in fintech, banking, or payments industry
-• Knowledge of financial regulations (PCI DSS, SOX, etc.)
-• Contributions to open source projects
-• Computer Science degree from top-tier university
-
-Compensation: $180K-$250K + equity + benefits
-        """
-    }
-
 def display_job_analysis(analysis):
     """Display job analysis results"""
     st.subheader("📊 Smart Job Analysis")
@@ -409,6 +268,66 @@ def display_performance_metrics(performance):
             success_rate = (query['linkedin_profiles']/max(query['total_results'], 1)*100)
             st.write(f"Success Rate: {success_rate:.1f}%")
             st.write("---")
+    
+    by_strategy = performance.get('by_strategy', {})
+    if by_strategy:
+        with st.expander("🧭 Performance by Strategy"):
+            for strategy, stats in by_strategy.items():
+                st.write(
+                    f"**{strategy}:** {stats['queries']} queries, {stats['avg_linkedin_profiles']:.1f} profiles/query, "
+                    f"{stats['avg_new_profiles']:.1f} new/query, {stats['success_rate']:.0f}% success"
+                )
+
+def run_streaming_search(job_description, num_candidates):
+    """Run the search and render live progress and candidate cards from its events"""
+    status = st.status("🚀 Running smart candidate search...", expanded=True)
+    progress = st.progress(0.0)
+    live_results = st.empty()
+    
+    results = {}
+    live_candidates = []
+    
+    for event in st.session_state.agent.search_candidates_stream(job_description, num_candidates):
+        if event.type == SearchEvent.ANALYSIS:
+            analysis = event.data['job_analysis']
+            status.write(f"📊 Analysis complete: {analysis['job_family']} role, {analysis['seniority']} level")
+            status.write(f"🎯 Generated {len(event.data['queries'])} search queries")
+            for query_info in event.data.get('skipped_queries', []):
+                status.write(f"⏭️ Skipped {query_info['strategy']} query: {query_info['skip_reason']}")
+        
+        elif event.type == SearchEvent.QUERY:
+            data = event.data
+            if data.get('skipped'):
+                status.write(
+                    f"⏭️ Query {data['index'] + 1}/{data['total']} ({data['query_info']['strategy']}) "
+                    f"skipped: {data['skip_reason']}"
+                )
+                continue
+            status.write(
+                f"🔍 Query {data['index'] + 1}/{data['total']} ({data['query_info']['strategy']}, "
+                f"{data.get('pages', 1)} page(s)): "
+                f"{data['linkedin_profiles']} LinkedIn profiles, {data['unique_candidates']} unique so far"
+            )
+        
+        elif event.type == SearchEvent.CANDIDATE:
+            live_candidates.append(event.data['candidate'])
+            live_candidates.sort(key=lambda x: x['fit_score'], reverse=True)
+            progress.progress(event.data['completed'] / max(event.data['total'], 1))
+            
+            # Re-render the provisional ranking with every new evaluation
+            with live_results.container():
+                st.subheader(f"⏳ Evaluated {event.data['completed']}/{event.data['total']} candidates")
+                for i, candidate in enumerate(live_candidates[:num_candidates]):
+                    display_candidate_card(candidate, i + 1)
+        
+        elif event.type == SearchEvent.FINAL:
+            results = event.data
+    
+    # The final ranking is rendered with the full results below
+    live_results.empty()
+    progress.empty()
+    status.update(label="✅ Search complete", state="complete", expanded=False)
+    return results
 
 def main():
     # Initialize session state
@@ -481,40 +400,40 @@ def main():
         if st.button("🧠 Analyze Job Only", type="secondary"):
             if job_description:
                 with st.spinner("Analyzing job description..."):
-                    analysis = st.session_state.agent.analyzer.analyze_job(job_description)
+                    agent = st.session_state.agent
+                    profile = agent.analyzer.build_profile(job_description, agent.smart_evaluator.context_detector)
                     st.success("Analysis complete!")
-                    display_job_analysis(analysis)
+                    display_job_analysis(profile.as_analysis())
                     
-                    # Generate criteria
-                    context = st.session_state.smart_evaluator.context_detector.detect_context(job_description)
-                    criteria = st.session_state.smart_evaluator._generate_criteria(context, job_description)
-                    display_smart_criteria(criteria)
+                    # Generate criteria (cached per job description)
+                    prepared_job = st.session_state.smart_evaluator.prepare_job(profile)
+                    display_smart_criteria(prepared_job["hiring_criteria"])
             else:
                 st.error("Please enter a job description first!")
         
         if st.button("🎯 Generate Queries Only", type="secondary"):
             if job_description:
                 with st.spinner("Generating search queries..."):
-                    analysis = st.session_state.agent.analyzer.analyze_job(job_description)
-                    queries = st.session_state.agent.query_generator.generate_queries(analysis, job_description)
+                    profile = st.session_state.agent.analyzer.build_profile(job_description)
+                    queries = st.session_state.agent.query_generator.generate_queries(profile)
                     st.success("Queries generated!")
                     display_search_queries(queries)
             else:
                 st.error("Please enter a job description first!")
         
-        if st.button("🔍 SEARCH CANDIDATES", type="primary"):
-            if job_description:
-                with st.spinner("🚀 Running smart candidate search..."):
-                    start_time = time.time()
-                    
-                    # Execute search
-                    results = st.session_state.agent.search_candidates(job_description, num_candidates)
-                    st.session_state.search_results = results
-                    
-                    end_time = time.time()
-                    st.success(f"Search completed in {end_time - start_time:.1f} seconds!")
-            else:
-                st.error("Please enter a job description first!")
+        search_clicked = st.button("🔍 SEARCH CANDIDATES", type="primary")
+        if search_clicked and not job_description:
+            st.error("Please enter a job description first!")
+    
+    if search_clicked and job_description:
+        start_time = time.time()
+        
+        # Execute search, rendering candidates as soon as each evaluation finishes
+        results = run_streaming_search(job_description, num_candidates)
+        st.session_state.search_results = results
+        
+        end_time = time.time()
+        st.success(f"Search completed in {end_time - start_time:.1f} seconds!")
     
     # Display results if available
     if st.session_state.search_results:
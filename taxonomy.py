@@ -0,0 +1,245 @@
+import hashlib
+import json
+import os
+import pickle
+import re
+import threading
+import time
+from string import Formatter
+from typing import Dict, List, Any, Iterable, Mapping, Optional, Tuple
+from keyword_matcher import KeywordMatcher
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "taxonomy.json")
+
+# Bump when CompiledTaxonomy's layout changes so stale artifacts are rebuilt
+ARTIFACT_FORMAT = 3
+
+
+def compile_skill_pattern(skill_terms: Dict[str, List[str]], guards: Dict[str, str],
+                          synonyms: Optional[Dict[str, List[str]]] = None,
+                          case_sensitive: Iterable[str] = ()):
+    """One case-insensitive alternation with a named group per skill category.
+
+    Synonyms ("k8s" for "kubernetes") join their canonical skill's group, so
+    one pass finds every surface form. Returns the pattern, a canonical skill
+    -> extra categories map for skills listed under several categories, and a
+    lowercased surface form -> canonical skill map.
+    """
+    synonyms = synonyms or {}
+    case_sensitive = set(case_sensitive)
+    seen: Dict[str, str] = {}
+    extra_categories: Dict[str, Tuple[str, ...]] = {}
+    canonical: Dict[str, str] = {}
+    groups = []
+    for category, terms in skill_terms.items():
+        alternatives = []
+        for term in terms:
+            if term in seen:
+                extra_categories[term] = extra_categories.get(term, ()) + (category,)
+                continue
+            seen[term] = category
+            for form in [term] + synonyms.get(term, []):
+                canonical[form.lower()] = term
+                alternatives.append(form)
+        # Longest first so "javascript" is tried before "java"
+        alternatives.sort(key=len, reverse=True)
+        escaped = []
+        for form in alternatives:
+            alternative = re.escape(form)
+            if form in case_sensitive:
+                # "Go" the language, not the verb
+                alternative = f"(?-i:{alternative})"
+            escaped.append(alternative + guards.get(form.lower(), ""))
+        groups.append(f"(?P<{category}>{'|'.join(escaped)})")
+
+    # Lookarounds instead of \b so terms ending in symbols ("c++", "c#") still match
+    pattern = re.compile(rf"(?<!\w)(?:{'|'.join(groups)})(?!\w)", re.IGNORECASE)
+    return pattern, extra_categories, canonical
+
+
+class CompiledTemplate:
+    """A query template parsed once, with its placeholder dependency list.
+
+    ``render`` fills the template in one ``format_map`` call and normalizes
+    whitespace, dropping parentheses left empty by empty placeholder values.
+    """
+
+    def __init__(self, template: str):
+        self.template = template
+        self.placeholders: Tuple[str, ...] = tuple(dict.fromkeys(
+            field for _, field, _, _ in Formatter().parse(template) if field
+        ))
+
+    def render(self, values: Mapping[str, str]) -> str:
+        """Query text for the placeholder values (a dict subclass may compute missing ones)"""
+        query = " ".join(self.template.format_map(values).split())
+        if "()" in query:
+            query = " ".join(query.replace("()", "").split())
+        return query
+
+    def __repr__(self) -> str:
+        return f"CompiledTemplate({self.template!r})"
+
+
+class CompiledTaxonomy:
+    """The keyword taxonomies with their matcher and skill regex prebuilt.
+
+    One instance is shared by every JobDescriptionAnalyzer, SmartContextDetector
+    and QueryGenerator. ``keyword_matcher`` covers the analyzer's and the
+    context detector's tables, so one scan serves both.
+    """
+
+    def __init__(self, data: Dict[str, Any], source_hash: str):
+        self.source_hash = source_hash
+
+        self.technical_skills: Dict[str, List[str]] = data["technical_skills"]
+        self.skill_guards: Dict[str, str] = data.get("skill_guards", {})
+        # Canonical skill -> other surface forms, e.g. {"kubernetes": ["k8s"]}
+        self.skill_synonyms: Dict[str, List[str]] = data.get("skill_synonyms", {})
+        self.job_families: Dict[str, List[str]] = data["job_families"]
+        self.seniority_levels: Dict[str, List[str]] = data["seniority_levels"]
+        self.industries: Dict[str, List[str]] = data["industries"]
+
+        context = data["context"]
+        self.industry_patterns: Dict[str, List[str]] = context["industries"]
+        self.company_types: Dict[str, List[str]] = context["company_types"]
+        self.role_types: Dict[str, List[str]] = context["role_types"]
+        self.role_subtypes: Dict[str, Dict[str, List[str]]] = context["role_subtypes"]
+
+        self.query_templates: Dict[str, Dict[str, str]] = data["query_templates"]
+        self.keyword_mappings: Dict[str, Dict[str, List[str]]] = data["keyword_mappings"]
+        self.compiled_templates: Dict[str, Dict[str, CompiledTemplate]] = {
+            role_key: {strategy: CompiledTemplate(template) for strategy, template in templates.items()}
+            for role_key, templates in self.query_templates.items()
+        }
+
+        self.analysis_tables = {
+            "job_family": self.job_families,
+            "seniority": self.seniority_levels,
+            "industry": self.industries
+        }
+        # Subtype tables are keyed by role type; names are distinct from the analysis tables
+        self.context_tables = {
+            "context_industry": self.industry_patterns,
+            "company_type": self.company_types,
+            "role_type": self.role_types,
+            **{f"subtype:{role_type}": subtypes for role_type, subtypes in self.role_subtypes.items()}
+        }
+
+        self.keyword_matcher = KeywordMatcher({**self.analysis_tables, **self.context_tables})
+        self.skill_pattern, self.skill_extra_categories, self.skill_canonical = compile_skill_pattern(
+            self.technical_skills, self.skill_guards, self.skill_synonyms, data.get("case_sensitive_skills", ())
+        )
+        # Small integer id per canonical skill, in taxonomy order, for cheap set comparisons
+        self.skill_names: List[str] = list(dict.fromkeys(
+            skill for skills in self.technical_skills.values() for skill in skills
+        ))
+        self.skill_ids: Dict[str, int] = {skill: i for i, skill in enumerate(self.skill_names)}
+        self.surface_skill_ids: Dict[str, int] = {
+            form: self.skill_ids[skill] for form, skill in self.skill_canonical.items()
+        }
+
+
+class TaxonomyStore:
+    """Loads data/taxonomy.json through a pickled compiled artifact and hot-reloads it.
+
+    The artifact (``<source>.compiled.pickle``) stores the built automaton, so a
+    new process or worker skips compilation while the source is unchanged.
+    ``get`` re-checks the source file's mtime at most every RELOAD_INTERVAL
+    seconds and swaps in a recompiled taxonomy when it changes; a source that
+    fails to load keeps the previous taxonomy in service.
+    """
+
+    RELOAD_INTERVAL = 2.0
+
+    def __init__(self, path: str = DEFAULT_TAXONOMY_PATH, artifact_path: Optional[str] = None):
+        self.path = path
+        self.artifact_path = artifact_path or os.path.splitext(path)[0] + ".compiled.pickle"
+        self._taxonomy: Optional[CompiledTaxonomy] = None
+        self._mtime: Optional[int] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> CompiledTaxonomy:
+        """Current taxonomy, reloading it if the source file changed"""
+        taxonomy = self._taxonomy
+        if taxonomy is not None and time.monotonic() - self._checked_at < self.RELOAD_INTERVAL:
+            return taxonomy
+
+        with self._lock:
+            self._checked_at = time.monotonic()
+            try:
+                mtime = os.stat(self.path).st_mtime_ns
+            except OSError as e:
+                if self._taxonomy is None:
+                    raise
+                print(f"⚠️ Taxonomy source unavailable, keeping loaded version: {e}")
+                return self._taxonomy
+
+            if self._taxonomy is None or mtime != self._mtime:
+                try:
+                    self._taxonomy = self._load()
+                    self._mtime = mtime
+                except (ValueError, KeyError, TypeError, OSError, pickle.UnpicklingError, EOFError) as e:
+                    if self._taxonomy is None:
+                        raise
+                    print(f"⚠️ Taxonomy reload failed, keeping loaded version: {e}")
+                    self._mtime = mtime
+            return self._taxonomy
+
+    def reload(self) -> CompiledTaxonomy:
+        """Force a reload on the next ``get``"""
+        with self._lock:
+            self._mtime = None
+            self._checked_at = 0.0
+        return self.get()
+
+    def _load(self) -> CompiledTaxonomy:
+        with open(self.path, "rb") as f:
+            source = f.read()
+        source_hash = hashlib.sha256(source).hexdigest()
+
+        taxonomy = self._read_artifact(source_hash)
+        if taxonomy is None:
+            taxonomy = CompiledTaxonomy(json.loads(source), source_hash)
+            self._write_artifact(taxonomy)
+        return taxonomy
+
+    def _read_artifact(self, source_hash: str) -> Optional[CompiledTaxonomy]:
+        """Compiled taxonomy from the artifact, if it was built from this exact source"""
+        try:
+            with open(self.artifact_path, "rb") as f:
+                artifact = pickle.load(f)
+        except Exception:
+            # A truncated or corrupt pickle can fail with almost any exception; rebuild from source
+            return None
+
+        if not isinstance(artifact, dict) or not isinstance(artifact.get("taxonomy"), CompiledTaxonomy):
+            return None
+        if artifact.get("format") != ARTIFACT_FORMAT or artifact.get("source_hash") != source_hash:
+            return None
+        return artifact["taxonomy"]
+
+    def _write_artifact(self, taxonomy: CompiledTaxonomy) -> None:
+        artifact = {"format": ARTIFACT_FORMAT, "source_hash": taxonomy.source_hash, "taxonomy": taxonomy}
+        tmp_path = f"{self.artifact_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.artifact_path)
+        except OSError as e:
+            # Read-only checkout: compile per process instead
+            print(f"⚠️ Could not write taxonomy artifact: {e}")
+
+
+_stores: Dict[str, TaxonomyStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_taxonomy(path: str = DEFAULT_TAXONOMY_PATH) -> CompiledTaxonomy:
+    """Process-wide compiled taxonomy for a source file, hot-reloaded on change"""
+    store = _stores.get(path)
+    if store is None:
+        with _stores_lock:
+            store = _stores.setdefault(path, TaxonomyStore(path))
+    return store.get()
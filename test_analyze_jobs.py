@@ -0,0 +1,43 @@
+import advanced_sourcing_agent
+from advanced_sourcing_agent import JobDescriptionAnalyzer
+from benchmark_analysis import synthetic_job_descriptions
+
+class NoPool:
+    """Replaces ProcessPoolExecutor where the analysis must stay in-process"""
+    
+    def __init__(self, *args, **kwargs):
+        raise AssertionError("analyze_jobs started a process pool")
+
+def make_analyzer() -> JobDescriptionAnalyzer:
+    analyzer = JobDescriptionAnalyzer()
+    # Small batches go through the pool too, so the test stays fast
+    analyzer.IN_PROCESS_THRESHOLD = 8
+    return analyzer
+
+def test_parallel_results_in_input_order():
+    """With two workers and small chunks, results equal analyze_job on each input, in input order"""
+    analyzer = make_analyzer()
+    descriptions = list(synthetic_job_descriptions(40, seed=7))
+    expected = [analyzer.analyze_job(description) for description in descriptions]
+    
+    results = list(analyzer.analyze_jobs(iter(descriptions), workers=2, chunk_size=3))
+    assert results == expected
+
+def test_single_worker_skips_the_pool():
+    """workers=1, or fewer inputs than IN_PROCESS_THRESHOLD, analyze in-process"""
+    analyzer = make_analyzer()
+    descriptions = list(synthetic_job_descriptions(12, seed=7))
+    expected = [analyzer.analyze_job(description) for description in descriptions]
+    
+    pool = advanced_sourcing_agent.ProcessPoolExecutor
+    advanced_sourcing_agent.ProcessPoolExecutor = NoPool
+    try:
+        assert list(analyzer.analyze_jobs(descriptions, workers=1, chunk_size=3)) == expected
+        assert list(analyzer.analyze_jobs(descriptions[:5], workers=2, chunk_size=3)) == expected[:5]
+        assert list(analyzer.analyze_jobs([], workers=2)) == []
+    finally:
+        advanced_sourcing_agent.ProcessPoolExecutor = pool
+
+if __name__ == "__main__":
+    test_parallel_results_in_input_order()
+    test_single_worker_skips_the_pool()
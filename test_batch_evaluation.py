@@ -0,0 +1,87 @@
+import json
+import re
+
+from evaluation_cache import EvaluationCache
+from smart_evaluator import SmartEvaluator
+
+PREPARED_JOB = {
+    "context": {"industry": "tech", "company_type": "startup", "role_type": "DevOps", "role_subtype": "General"},
+    "hiring_criteria": {"core_skills": ["kubernetes", "terraform"]}
+}
+
+def candidates(count: int) -> list:
+    return [
+        {"link": f"https://www.linkedin.com/in/person-{i}", "title": f"DevOps Engineer #{i}", "snippet": "AWS, k8s"}
+        for i in range(1, count + 1)
+    ]
+
+def evaluation_for(number: int) -> dict:
+    """Education score equal to the candidate number, so results can be traced back"""
+    return {"scores": {"education": number, "core_skills": 10}, "strengths": [], "weaknesses": [], "rationale": ""}
+
+class StubbedEvaluator(SmartEvaluator):
+    """SmartEvaluator whose chat completions come from a scripted function instead of the API"""
+    
+    def __init__(self, respond):
+        super().__init__(evaluation_cache=EvaluationCache(path=":memory:"))
+        self.respond = respond
+        self.calls = []
+    
+    def _chat_completion(self, prompt, max_tokens=None, label="chat"):
+        # (candidate id, candidate number) pairs in a batch prompt; one number for a single evaluation
+        batch = [(cid, int(number)) for cid, number in re.findall(r"\[(c\d+)\] DevOps Engineer #(\d+)", prompt)]
+        if not batch:
+            batch = [(None, int(number)) for number in re.findall(r"DevOps Engineer #(\d+)", prompt)]
+        self.calls.append((label, [number for _, number in batch]))
+        return self.respond(label, batch)
+
+def batch_response(entries: list, finish_reason: str = "stop") -> dict:
+    return {"message": {"content": json.dumps(entries)}, "finish_reason": finish_reason}
+
+def test_truncated_batch_is_split():
+    """A batch cut off by the token limit is re-scored in halves"""
+    def respond(label, batch):
+        if len(batch) > 2:
+            return batch_response([], finish_reason="length")
+        return batch_response([{"id": cid, **evaluation_for(number)} for cid, number in batch])
+    
+    evaluator = StubbedEvaluator(respond)
+    results = evaluator.evaluate_batch(candidates(4), PREPARED_JOB, batch_size=4)
+    print(f"Calls: {evaluator.calls}")
+    
+    assert [numbers for _, numbers in evaluator.calls] == [[1, 2, 3, 4], [1, 2], [3, 4]]
+    assert [result["evaluation"]["scores"]["education"] for result in results] == [1, 2, 3, 4]
+
+def test_malformed_entry_retried_alone():
+    """An entry without a scores object is re-asked as a single evaluation"""
+    def respond(label, batch):
+        if label == "evaluation":
+            return {"message": {"content": json.dumps(evaluation_for(batch[0][1]))}, "finish_reason": "stop"}
+        return batch_response([
+            {"id": cid, **evaluation_for(number)} if number != 2 else {"id": cid, "scores": "9/10"}
+            for cid, number in batch
+        ])
+    
+    evaluator = StubbedEvaluator(respond)
+    results = evaluator.evaluate_batch(candidates(3), PREPARED_JOB, batch_size=3)
+    
+    assert evaluator.calls == [("batch_evaluation", [1, 2, 3]), ("evaluation", [2])]
+    assert [result["evaluation"]["scores"]["education"] for result in results] == [1, 2, 3]
+
+def test_results_in_input_order():
+    """Entries answered out of order (and wrapped in prose) come back in input order"""
+    def respond(label, batch):
+        entries = [{"id": cid, **evaluation_for(number)} for cid, number in reversed(batch)]
+        return {"message": {"content": f"Here are the scores:\n{json.dumps(entries)}"}, "finish_reason": "stop"}
+    
+    evaluator = StubbedEvaluator(respond)
+    results = evaluator.evaluate_batch(candidates(5), PREPARED_JOB, batch_size=5)
+    
+    assert len(evaluator.calls) == 1
+    assert [result["evaluation"]["scores"]["education"] for result in results] == [1, 2, 3, 4, 5]
+    assert [result["fit_score"] for result in results] == sorted(result["fit_score"] for result in results)
+
+if __name__ == "__main__":
+    test_truncated_batch_is_split()
+    test_malformed_entry_retried_alone()
+    test_results_in_input_order()
@@ -0,0 +1,62 @@
+from criteria_cache import CriteriaCache
+from evaluation_cache import EvaluationCache
+from smart_evaluator import SmartEvaluator
+
+JOB = "Senior Backend Engineer at a Series B fintech. Python, Postgres, Kubernetes."
+
+class CountingEvaluator(SmartEvaluator):
+    """SmartEvaluator whose criteria requests are counted instead of sent to OpenAI"""
+    
+    def __init__(self, max_entries: int = 128):
+        super().__init__(criteria_cache=CriteriaCache(max_entries=max_entries),
+                         evaluation_cache=EvaluationCache(path=":memory:"))
+        self.requests = []
+    
+    def _request_criteria(self, context, job_description):
+        self.requests.append(job_description)
+        return {"must_have_skills": [f"criteria #{len(self.requests)}"]}
+
+def test_same_job_text_hits_cache():
+    """Preparing the same description twice, even reformatted, asks for criteria once"""
+    evaluator = CountingEvaluator()
+    first = evaluator.prepare_job(JOB)
+    second = evaluator.prepare_job(JOB)
+    reformatted = evaluator.prepare_job(f"  {JOB.upper()}\n\n")
+    
+    assert len(evaluator.requests) == 1
+    assert second is first
+    assert reformatted is first
+
+def test_changed_job_text_misses_cache():
+    """A description with different content is prepared from scratch"""
+    evaluator = CountingEvaluator()
+    first = evaluator.prepare_job(JOB)
+    changed = evaluator.prepare_job(JOB.replace("Postgres", "MySQL"))
+    
+    assert len(evaluator.requests) == 2
+    assert changed["job_key"] != first["job_key"]
+    assert changed["hiring_criteria"] == {"must_have_skills": ["criteria #2"]}
+
+def test_size_bound_evicts_least_recently_used():
+    """Past max_entries the least recently used description is evicted and re-requested"""
+    evaluator = CountingEvaluator(max_entries=2)
+    jobs = [f"{JOB} Team {n}." for n in range(3)]
+    
+    evaluator.prepare_job(jobs[0])
+    evaluator.prepare_job(jobs[1])
+    evaluator.prepare_job(jobs[0])  # Refresh job 0 so job 1 becomes the oldest
+    evaluator.prepare_job(jobs[2])
+    assert len(evaluator.criteria_cache) == 2
+    assert len(evaluator.requests) == 3
+    
+    evaluator.prepare_job(jobs[0])
+    assert len(evaluator.requests) == 3
+    
+    evaluator.prepare_job(jobs[1])
+    assert evaluator.requests[-1] == jobs[1]
+    assert len(evaluator.requests) == 4
+
+if __name__ == "__main__":
+    test_same_job_text_hits_cache()
+    test_changed_job_text_misses_cache()
+    test_size_bound_evicts_least_recently_used()
@@ -0,0 +1,63 @@
+import time
+
+from evaluation_cache import EvaluationCache
+from smart_evaluator import SmartEvaluator
+
+CRITERIA = {"core_skills": ["kubernetes", "terraform"]}
+EVALUATION = {"scores": {"education": 8, "core_skills": 9}, "final_score": 9.9}
+
+def profile(i: int, url: str = None) -> dict:
+    return {"link": url or f"https://www.linkedin.com/in/person-{i}", "title": f"DevOps Engineer {i}", "snippet": "AWS, k8s"}
+
+def test_hit_and_expiry():
+    """A stored evaluation is returned until its TTL passes, then it is a miss"""
+    cache = EvaluationCache(path=":memory:", ttl_seconds=0.05)
+    cache.put("test", profile(1), CRITERIA, EVALUATION)
+    
+    assert cache.get("test", profile(1), CRITERIA) == EVALUATION
+    assert cache.get("test", profile(1), {"core_skills": ["python"]}) is None
+    
+    time.sleep(0.1)
+    assert cache.get("test", profile(1), CRITERIA) is None
+    print(f"Cache stats: {cache.stats()}")
+    assert cache.stats()["hits"] == 1 and cache.stats()["entries"] == 0
+
+def test_lru_eviction():
+    """Past max_entries the least recently used rows are evicted"""
+    cache = EvaluationCache(path=":memory:", max_entries=3)
+    cache.EVICTION_INTERVAL = 1
+    for i in range(3):
+        cache.put("test", profile(i), CRITERIA, EVALUATION)
+        time.sleep(0.002)
+    
+    # Reading person-0 makes person-1 the least recently used
+    assert cache.get("test", profile(0), CRITERIA) is not None
+    time.sleep(0.002)
+    cache.put("test", profile(3), CRITERIA, EVALUATION)
+    
+    assert cache.stats()["entries"] == 3
+    assert cache.get("test", profile(1), CRITERIA) is None
+    assert all(cache.get("test", profile(i), CRITERIA) is not None for i in (0, 2, 3))
+
+def test_url_variants_share_entry():
+    """Regional, tracking and trailing-slash variants of a profile URL hit the same row"""
+    cache = EvaluationCache(path=":memory:")
+    cache.put("test", profile(1, "https://www.linkedin.com/in/person-1"), CRITERIA, EVALUATION)
+    
+    assert cache.get("test", profile(1, "http://ca.linkedin.com/in/Person-1/?trk=search"), CRITERIA) == EVALUATION
+    assert cache.stats()["entries"] == 1
+
+def test_cached_evaluation_is_rescored():
+    """A cache hit gets its final_score recomputed from the category scores"""
+    cache = EvaluationCache(path=":memory:")
+    cache.put(SmartEvaluator.CACHE_NAMESPACE, profile(1), CRITERIA, dict(EVALUATION))
+    evaluator = SmartEvaluator(evaluation_cache=cache)
+    
+    evaluation = evaluator._evaluate_candidate(profile(1), CRITERIA, {})
+    assert evaluation["final_score"] == 3.4
+
+if __name__ == "__main__":
+    test_hit_and_expiry()
+    test_lru_eviction()
+    test_url_variants_share_entry()
+    test_cached_evaluation_is_rescored()
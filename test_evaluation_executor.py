@@ -0,0 +1,63 @@
+import threading
+import time
+
+from evaluation_executor import AdaptiveRateLimiter, EvaluationExecutor
+
+def run_requests(limiter: AdaptiveRateLimiter, count: int, workers: int = 8) -> int:
+    """Run ``count`` fake API calls through the executor, each holding a limiter slot; returns peak concurrency"""
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+    
+    def call(_):
+        with limiter.slot():
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+        limiter.record_success()
+        return True
+    
+    results = EvaluationExecutor(max_workers=workers).map(call, list(range(count)))
+    assert all(results)
+    return state["peak"]
+
+def test_throttle_lowers_concurrency():
+    """A 429 halves the requests allowed in flight, from the peak actually reached"""
+    limiter = AdaptiveRateLimiter(initial_delay=0.01, max_concurrency=8)
+    assert run_requests(limiter, 8, workers=8) > 1
+    
+    limiter.record_throttle()
+    limit = limiter.concurrency_limit
+    print(f"Concurrency limit after a 429: {limit}")
+    assert 1 <= limit <= 4
+    
+    # Back to back throttles keep halving down to a single request
+    limiter.record_throttle()
+    limiter.record_throttle()
+    assert limiter.concurrency_limit == 1
+    assert run_requests(limiter, 1, workers=8) == 1
+
+def test_success_raises_concurrency():
+    """Each round of successful calls allows one more request in flight, up to max_concurrency"""
+    limiter = AdaptiveRateLimiter(initial_delay=0.01, max_concurrency=4)
+    limiter.concurrency_limit = 1
+    
+    # 1 + 2 + 3 successes raise the limit from 1 to 4; more stay capped
+    for _ in range(6):
+        limiter.record_success()
+    assert limiter.concurrency_limit == 4
+    for _ in range(20):
+        limiter.record_success()
+    assert limiter.concurrency_limit == 4
+    
+    # Starting throttled at 1, a burst of calls ends up running several at once again
+    limiter.concurrency_limit = 1
+    peak = run_requests(limiter, 40, workers=8)
+    print(f"Peak concurrency while recovering: {peak}, limit {limiter.concurrency_limit}")
+    assert peak > 1 and limiter.concurrency_limit == 4
+
+if __name__ == "__main__":
+    test_throttle_lowers_concurrency()
+    test_success_raises_concurrency()
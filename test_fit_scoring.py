@@ -0,0 +1,52 @@
+import copy
+
+from evaluation_cache import EvaluationCache
+from fit_scoring import CATEGORY_WEIGHTS, apply_fit_scores, recommendations, rescore_candidates
+from smart_evaluator import SmartEvaluator
+
+def test_fit_scoring():
+    """Check the local SRN FitScore arithmetic against hand-computed values"""
+    evaluations = [
+        {"scores": {"education": 9, "career_trajectory": 8, "company_relevance": 9, "tenure_stability": 7,
+                    "core_skills": 8.5, "bonus_signals": 4, "red_flags": 0}},
+        # Model output arrives as strings and red flags as a positive count
+        {"scores": {"education": "6", "career_trajectory": "6/10", "company_relevance": 6,
+                    "tenure_stability": 6, "core_skills": 6, "bonus_signals": 2, "red_flags": 2}},
+        # Out-of-range values are clamped per category
+        {"scores": {"education": 14, "red_flags": -4}}
+    ]
+
+    apply_fit_scores(evaluations)
+    scores = [evaluation["final_score"] for evaluation in evaluations]
+    print(f"Fit scores: {scores}")
+
+    assert scores == [7.7, 5.2, 1.4]
+
+    labels = recommendations([8.5, 7.0, 5.5, 5.4])
+    assert [label.split(" - ")[0] for label in labels] == ["🟢 STRONG HIRE", "🟡 CONSIDER", "🟠 WEAK", "🔴 NO HIRE"]
+
+    # Re-weighting a stored pool re-ranks it without any API call
+    pool = [
+        {"title": "A", "smart_assessment": {"evaluation": {"scores": {"education": 10, "core_skills": 2}}}},
+        {"title": "B", "smart_assessment": {"evaluation": {"scores": {"education": 2, "core_skills": 10}}}}
+    ]
+    skills_heavy = [0.0, 0.0, 0.0, 0.0, 1.0, 0.0, -0.15]
+    rescored = rescore_candidates(pool, skills_heavy)
+    print(f"Re-weighted ranking: {[c['title'] for c in rescored]}")
+
+    assert [c["title"] for c in rescored] == ["B", "A"]
+    assert rescored[0]["fit_score"] == 10.0
+
+def test_fallback_evaluation_score():
+    """The fallback's final score comes from its category scores, so rescoring it changes nothing"""
+    evaluator = SmartEvaluator(evaluation_cache=EvaluationCache(path=":memory:"))
+    fallback = evaluator._fallback_evaluation("Senior DevOps Engineer")
+    assert fallback["final_score"] == 5.5
+    
+    assert apply_fit_scores([copy.deepcopy(fallback)])[0]["final_score"] == fallback["final_score"]
+    pool = [{"title": "A", "smart_assessment": {"evaluation": fallback}}]
+    assert rescore_candidates(pool, CATEGORY_WEIGHTS)[0]["fit_score"] == fallback["final_score"]
+
+if __name__ == "__main__":
+    test_fit_scoring()
+    test_fallback_evaluation_score()
@@ -0,0 +1,134 @@
+from contextlib import contextmanager
+
+import requests
+
+import http_client
+from http_client import HttpClient
+
+API = "https://api.example.com"
+
+class FakeSession:
+    """Stands in for requests.Session: returns (status, headers) outcomes or raises exception outcomes in order"""
+    
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+    
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        status, headers = outcome if isinstance(outcome, tuple) else (outcome, {})
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers)
+        return response
+
+class FakeTime:
+    """Records backoff sleeps instead of sleeping"""
+    
+    def __init__(self):
+        self.sleeps = []
+    
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+@contextmanager
+def stubbed_client(outcomes, **options):
+    """HttpClient whose api.example.com session is a FakeSession, with sleeps recorded"""
+    client = HttpClient(**options)
+    session = FakeSession(outcomes)
+    client._sessions[API] = session
+    clock = FakeTime()
+    original = http_client.time
+    http_client.time = clock
+    try:
+        yield client, session, clock
+    finally:
+        http_client.time = original
+
+def test_retries_429_and_5xx_with_backoff():
+    """Throttling and server errors are retried with jittered exponential backoff, up to max_retries"""
+    with stubbed_client([503, 500, 200], backoff_base=0.5) as (client, session, clock):
+        assert client.get(f"{API}/search").status_code == 200
+        assert len(session.calls) == 3
+        assert len(clock.sleeps) == 2
+        assert all(0 <= delay <= 0.5 * 2 ** attempt for attempt, delay in enumerate(clock.sleeps))
+    
+    with stubbed_client([429, 200]) as (client, session, clock):
+        assert client.post(f"{API}/chat", json={}).status_code == 200
+        assert len(session.calls) == 2
+    
+    # Out of retries, the last response is returned for the caller to handle
+    with stubbed_client([503] * 4, max_retries=3) as (client, session, clock):
+        assert client.get(f"{API}/search").status_code == 503
+        assert len(session.calls) == 4 and len(clock.sleeps) == 3
+
+def test_post_not_retried_after_server_processed_it():
+    """A POST is not repeated after a 5xx or a dropped response, unless the caller marks it idempotent"""
+    with stubbed_client([503, 200]) as (client, session, clock):
+        assert client.post(f"{API}/campaigns", json={}).status_code == 503
+        assert len(session.calls) == 1 and clock.sleeps == []
+    
+    for error in [requests.ConnectionError("connection reset"), requests.ReadTimeout("read timed out")]:
+        with stubbed_client([error, 200]) as (client, session, clock):
+            try:
+                client.post(f"{API}/campaigns", json={})
+                assert False, "expected the error to propagate"
+            except type(error):
+                pass
+            assert len(session.calls) == 1
+    
+    with stubbed_client([503, 200]) as (client, session, clock):
+        assert client.post(f"{API}/chat", json={}, idempotent=True).status_code == 200
+        assert len(session.calls) == 2
+
+def test_retry_when_connection_failed_before_sending():
+    """A connect timeout never reached the server, so even a POST is retried; GETs retry any connection error"""
+    with stubbed_client([requests.ConnectTimeout("connect timed out"), 200]) as (client, session, clock):
+        assert client.post(f"{API}/campaigns", json={}).status_code == 200
+        assert len(session.calls) == 2
+    
+    with stubbed_client([requests.ConnectionError("connection reset"), 200]) as (client, session, clock):
+        assert client.get(f"{API}/search").status_code == 200
+        assert len(session.calls) == 2
+
+def test_retry_after_is_honoured():
+    """The backoff never undercuts the server's Retry-After"""
+    with stubbed_client([(429, {"Retry-After": "7"}), (503, {"Retry-After": "soon"}), 200],
+                        backoff_base=0.5) as (client, session, clock):
+        assert client.get(f"{API}/search").status_code == 200
+        assert clock.sleeps[0] == 7.0
+        # An unparseable header falls back to the normal backoff
+        assert clock.sleeps[1] <= 1.0
+
+def test_default_timeout_is_passed():
+    """Every request gets the (connect, read) timeout unless the caller sets one"""
+    with stubbed_client([200, 200]) as (client, session, clock):
+        client.get(f"{API}/search")
+        client.post(f"{API}/chat", json={}, timeout=(5.0, 120.0))
+        assert session.calls[0][2]["timeout"] == HttpClient.DEFAULT_TIMEOUT == (5.0, 60.0)
+        assert session.calls[1][2]["timeout"] == (5.0, 120.0)
+
+def test_one_pooled_session_per_host():
+    """Requests to one host share a keep-alive session; other hosts and schemes get their own"""
+    client = HttpClient(pool_maxsize=8)
+    session = client._session_for(f"{API}/v1/search?q=1")
+    
+    assert client._session_for(f"{API}/v2/chat") is session
+    assert client._session_for("https://other.example.com/") is not session
+    assert client._session_for("http://api.example.com/") is not session
+    assert session.get_adapter(f"{API}/v1/search")._pool_maxsize == 8
+    
+    client.close()
+    assert client._sessions == {}
+    assert client._session_for(f"{API}/v1/search") is not session
+
+if __name__ == "__main__":
+    test_retries_429_and_5xx_with_backoff()
+    test_post_not_retried_after_server_processed_it()
+    test_retry_when_connection_failed_before_sending()
+    test_retry_after_is_honoured()
+    test_default_timeout_is_passed()
+    test_one_pooled_session_per_host()
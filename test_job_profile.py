@@ -0,0 +1,67 @@
+from dataclasses import FrozenInstanceError, fields
+
+from advanced_sourcing_agent import JobDescriptionAnalyzer, QueryGenerator
+from criteria_cache import job_description_key
+from job_profile import JobProfile
+
+JOB = "Senior DevOps Engineer in Halifax, NS. Kubernetes, Terraform, AWS and Python. Remote friendly."
+
+analyzer = JobDescriptionAnalyzer()
+
+def comparable(profile: JobProfile) -> dict:
+    """Every field except the token index, with mappings as plain dicts"""
+    values = {f.name: getattr(profile, f.name) for f in fields(profile) if f.name != "index"}
+    values["skills"] = dict(values["skills"])
+    values["context"] = dict(values["context"])
+    return values
+
+def test_profile_is_immutable():
+    """Fields, skill lists and context cannot be changed; legacy dicts are independent copies"""
+    profile = analyzer.build_profile(JOB)
+    
+    for attempt in [lambda: setattr(profile, "seniority", "entry"),
+                    lambda: profile.skills.__setitem__("cloud", ()),
+                    lambda: profile.context.__setitem__("role_type", "Sales"),
+                    lambda: profile.locations.append("Austin, TX")]:
+        try:
+            attempt()
+            assert False, "profile was modified"
+        except (FrozenInstanceError, TypeError, AttributeError):
+            pass
+    
+    analysis = profile.as_analysis()
+    analysis["skills"]["cloud"].append("gcp")
+    analysis["locations"].clear()
+    assert "gcp" not in profile.skills["cloud"]
+    assert profile.locations == ("Halifax, NS", "Remote")
+
+def test_from_analysis_round_trip():
+    """A profile rebuilt from its own analysis dict matches it field for field (context aside)"""
+    profile = analyzer.build_profile(JOB)
+    rebuilt = JobProfile.from_analysis(profile.as_analysis(), JOB)
+    
+    assert comparable(rebuilt) == comparable(profile)
+    assert rebuilt.key == job_description_key(JOB)
+    assert rebuilt.as_analysis() == profile.as_analysis()
+    assert rebuilt.index.contains("kubernetes")
+
+def test_legacy_dict_access():
+    """Old callers get analyze_job's dict and can still pass it to the query generator"""
+    analysis = analyzer.analyze_job(JOB)
+    assert set(analysis) == {"job_family", "seniority", "industry", "skills", "locations", "is_technical",
+                             "is_leadership", "remote_eligible", "total_skills"}
+    assert analysis["job_family"] == "engineering" and analysis["seniority"] == "senior"
+    assert analysis["locations"] == ["Halifax, NS", "Remote"]
+    assert analysis["total_skills"] == sum(len(skills) for skills in analysis["skills"].values())
+    
+    generator = QueryGenerator()
+    assert generator.generate_queries(analysis, JOB) == generator.generate_queries(analyzer.build_profile(JOB))
+    
+    # Missing keys fall back to defaults
+    sparse = JobProfile.from_analysis({"job_family": "engineering"})
+    assert sparse.seniority == "mid" and sparse.locations == () and sparse.role_type == ""
+
+if __name__ == "__main__":
+    test_profile_is_immutable()
+    test_from_analysis_round_trip()
+    test_legacy_dict_access()
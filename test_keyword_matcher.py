@@ -0,0 +1,66 @@
+import json
+import re
+
+from keyword_matcher import KeywordMatcher
+from sample_jobs import get_sample_jobs
+from taxonomy import get_taxonomy
+from token_index import phrase_variants
+
+def regex_matches(tables: dict, text: str) -> set:
+    """Reference matcher: one regex per keyword variant, whole words only, as token_index defines them"""
+    found = set()
+    for categories in tables.values():
+        for keywords in categories.values():
+            for keyword in keywords:
+                for tokens in phrase_variants(keyword):
+                    pattern = r"(?<![^\W_])" + r"[\W_]+".join(map(re.escape, tokens)) + r"(?![^\W_]|[+#])"
+                    if re.search(pattern, text, re.IGNORECASE):
+                        found.add(keyword)
+    return found
+
+def test_overlapping_patterns():
+    """Keywords nested in or overlapping each other are all reported from one scan"""
+    matcher = KeywordMatcher({"roles": {
+        "ml": ["machine learning engineer", "machine learning", "learning"],
+        "eng": ["engineer", "learning engineer"],
+        "chain": ["data platform team", "platform team lead"]
+    }})
+    hits = matcher.scan("Senior Machine Learning Engineer, data platform team lead")
+    print(f"Keywords: {sorted(hits.keywords)}")
+    
+    assert hits.keywords == {
+        "machine learning engineer", "machine learning", "learning", "engineer", "learning engineer",
+        "data platform team", "platform team lead"
+    }
+    assert hits.scores("roles") == {"ml": 3, "eng": 2, "chain": 2}
+    assert hits.best("roles") == "ml"
+
+def test_word_boundaries():
+    """Short keywords only match whole words; punctuation separates words; last words inflect"""
+    matcher = KeywordMatcher({"terms": {
+        "short": ["pm", "ai", "java", "c"],
+        "symbols": ["c++", "ci/cd", "5+ years"],
+        "inflected": ["engineer"]
+    }})
+    hits = matcher.scan("npm maintainers use javascript and C++; CI-CD pipelines, 5+ years, engineering")
+    
+    assert hits.keywords == {"c++", "ci/cd", "5+ years", "engineer"}
+    assert matcher.scan("PM for AI in Java and C").keywords == {"pm", "ai", "java", "c"}
+
+def test_matches_regex_reference_on_sample_jds():
+    """The automaton finds exactly what per-keyword regexes find on the sample job descriptions"""
+    taxonomy = get_taxonomy()
+    tables = {**taxonomy.analysis_tables, **taxonomy.context_tables}
+    matcher = KeywordMatcher(tables)
+    
+    with open("jobs.json", encoding="utf-8") as f:
+        jobs = [f"{job['role']}\n{job['description']}" for job in json.load(f)]
+    texts = list(get_sample_jobs().values()) + jobs
+    
+    for text in texts:
+        assert matcher.scan(text).keywords == regex_matches(tables, text)
+
+if __name__ == "__main__":
+    test_overlapping_patterns()
+    test_word_boundaries()
+    test_matches_regex_reference_on_sample_jds()
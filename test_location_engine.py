@@ -0,0 +1,80 @@
+import time
+
+from location_engine import LocationEngine
+from job_profile import JobProfile
+
+engine = LocationEngine()
+
+def labels(text: str) -> list:
+    return [location.label for location in engine.extract(text)]
+
+def test_canadian_cities():
+    """Full and abbreviated province qualifiers resolve to one city with its metro"""
+    halifax = engine.extract("Hybrid role in Halifax, Nova Scotia, Canada")
+    assert [location.label for location in halifax] == ["Halifax, NS"]
+    assert halifax[0].search_terms == ["Halifax Metropolitan Area", "Halifax"]
+    
+    assert labels("Calgary, AB or Halifax") == ["Calgary, AB", "Halifax, NS"]
+    assert labels("calgary, alberta") == ["Calgary, AB"]
+
+def test_qualifiers_pick_between_same_named_cities():
+    """A region or country qualifier chooses the listing; the qualifier is consumed"""
+    assert labels("New York, NY") == ["New York, NY"]
+    assert labels("NYC or Brooklyn") == ["New York, NY"]
+    assert labels("London, ON") == ["London, ON"]
+    assert labels("London, UK") == ["London, GB"]
+    assert labels("london, uk") == ["London, GB"]
+    # Unqualified, a shared name is the major city
+    assert labels("London") == labels("London, England") == ["London, GB"]
+    assert labels("Portland") == ["Portland, OR"] and labels("Portland, ME") == ["Portland, ME"]
+    assert labels("London, ON or New York") == ["London, ON", "New York, NY"]
+
+def test_abbreviations_need_capitals():
+    """Short abbreviations only match in capitals; longer names match in any case"""
+    assert labels("Based in LA") == ["Los Angeles, CA"]
+    assert labels("la la land, or la") == []
+    assert labels("Austin, or remote") == ["Austin, TX", "Remote"]
+    for text in ["Phoenix, AZ", "phoenix", "PHOENIX", "pHoEnIx area"]:
+        assert labels(text) == ["Phoenix, AZ"]
+
+def test_remote():
+    """Remote phrases in any case collapse to one Remote location"""
+    remote = engine.extract("Remote (US) - work from home, WFH friendly")
+    assert [location.kind for location in remote] == ["remote"]
+    assert remote[0].label == "Remote"
+    assert remote[0].search_terms == ["Remote"]
+
+def test_long_description_scan():
+    """A long description is scanned in one pass, keeping first-mention order without duplicates"""
+    filler = "We build reliable tooling for payroll teams and ship weekly. " * 2000
+    text = f"Offices in Toronto, ON and Halifax. {filler} Also hiring in Calgary and Toronto."
+    
+    start = time.perf_counter()
+    found = labels(text)
+    elapsed = time.perf_counter() - start
+    print(f"Scanned {len(text)} chars in {elapsed * 1000:.1f} ms")
+    
+    assert found == ["Toronto, ON", "Halifax, NS", "Calgary, AB"]
+    assert elapsed < 2.0
+
+def test_from_analysis_rebuilds_location_details():
+    """A legacy analysis dict only has labels; from_analysis resolves them back to gazetteer entries"""
+    analysis = {
+        "job_family": "engineering",
+        "seniority": "senior",
+        "locations": ["Halifax, NS", "London, ON", "Remote"],
+        "remote_eligible": True
+    }
+    profile = JobProfile.from_analysis(analysis, "Senior Engineer in Halifax or London, ON. Remote friendly.")
+    
+    assert [location.label for location in profile.location_details] == ["Halifax, NS", "London, ON", "Remote"]
+    assert profile.location_details[0].metro == "Halifax Metropolitan Area"
+    assert list(profile.locations) == analysis["locations"]
+
+if __name__ == "__main__":
+    test_canadian_cities()
+    test_qualifiers_pick_between_same_named_cities()
+    test_abbreviations_need_capitals()
+    test_remote()
+    test_long_description_scan()
+    test_from_analysis_rebuilds_location_details()
@@ -0,0 +1,66 @@
+import gc
+import json
+import os
+import pickle
+import tempfile
+
+from memo_cache import ContentMemo, content_key
+from advanced_sourcing_agent import JobDescriptionAnalyzer
+from smart_evaluator import SmartContextDetector
+from taxonomy import DEFAULT_TAXONOMY_PATH
+
+JOB = "Widget Lead at a fintech startup\n• Own the widget roadmap\n• Work with engineering"
+
+def test_content_memo():
+    """Reformatted text hits, other text and other variants miss, the size bound evicts"""
+    assert content_key(JOB) == content_key(JOB.replace("•", "-").replace("\n", "\n\n  "))
+    assert content_key(JOB) != content_key(JOB.replace("fintech", "healthtech"))
+    
+    memo = ContentMemo(max_entries=2)
+    calls = []
+    def compute(value):
+        return lambda: calls.append(value) or value
+    
+    assert memo.get_or_compute(JOB, compute("a")) == "a"
+    assert memo.get_or_compute(JOB.replace("•", "*"), compute("b")) == "a"
+    assert memo.get_or_compute(JOB, compute("c"), variant="other") == "c"
+    assert memo.get_or_compute("another job", compute("d")) == "d"
+    assert memo.get_or_compute(JOB, compute("e")) == "e"  # Evicted by the two newer entries
+    assert calls == ["a", "c", "d", "e"]
+    assert memo.stats()["hits"] == 1 and memo.stats()["entries"] == 2
+    
+    # Worker processes receive an empty memo with the same limit
+    copy = pickle.loads(pickle.dumps(memo))
+    assert copy.max_entries == 2 and copy.stats()["entries"] == 0
+
+def test_build_profile_memo_keys_on_detector_configuration():
+    """Profiles are shared by equally configured detectors and recomputed for differently configured ones"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "taxonomy.json")
+        with open(DEFAULT_TAXONOMY_PATH, encoding="utf-8") as f:
+            data = json.load(f)
+        data["context"]["role_types"]["Product Manager"].append("widget lead")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        
+        analyzer = JobDescriptionAnalyzer(memo=ContentMemo())
+        custom = SmartContextDetector(taxonomy_path=path)
+        profile = analyzer.build_profile(JOB, custom)
+        assert profile.role_type == "Product Manager"
+        del custom
+        gc.collect()
+        
+        # A new detector may reuse the old one's id; its different tables must still miss
+        default = SmartContextDetector()
+        profile = analyzer.build_profile(JOB, default)
+        assert profile.role_type != "Product Manager"
+        assert analyzer.memo.stats()["misses"] == 2
+        
+        reformatted = JOB.replace("•", "-")
+        profile = analyzer.build_profile(reformatted, SmartContextDetector())
+        assert analyzer.memo.stats()["hits"] == 1
+        assert profile.description == reformatted
+
+if __name__ == "__main__":
+    test_content_memo()
+    test_build_profile_memo_keys_on_detector_configuration()
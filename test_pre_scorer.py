@@ -0,0 +1,85 @@
+from advanced_sourcing_agent import JobDescriptionAnalyzer
+from job_profile import JobProfile
+from pre_scorer import CandidatePreScorer
+
+JOB = JobProfile.from_analysis({
+    "job_family": "engineering",
+    "seniority": "senior",
+    "skills": {"programming": ["python"], "cloud": ["kubernetes", "terraform", "aws"]}
+}, "Senior DevOps Engineer. Kubernetes, Terraform, AWS and Python.")
+
+# Search order; pre-scores are 0.25, 1.0, 0.295, 0.65, 0.17, 0.625
+CANDIDATES = [
+    {"title": "Pastry Chef", "snippet": ""},
+    {"title": "Senior DevOps Engineer", "snippet": "Kubernetes, Terraform, AWS, Python"},
+    {"title": "Intern", "snippet": "AWS"},
+    {"title": "DevOps Engineer", "snippet": "k8s and terraform"},
+    {"title": "Junior Accountant", "snippet": "GAAP reporting"},
+    {"title": "Senior Software Engineer", "snippet": "Python"}
+]
+
+scorer = CandidatePreScorer(JobDescriptionAnalyzer())
+
+def titles(candidates) -> list:
+    return [candidate["title"] for candidate in candidates]
+
+def test_component_scores():
+    """Skills compare canonical ids, job family and seniority compare with the job; unknown signals are neutral"""
+    strong = scorer.score(CANDIDATES[1], JOB)
+    assert strong == {"skills": 1.0, "job_family": 1.0, "seniority": 1.0, "total": 1.0}
+    
+    # "k8s" counts as kubernetes: 2 of the job's 4 skills
+    synonyms = scorer.score(CANDIDATES[3], JOB)
+    assert synonyms["skills"] == 0.5 and synonyms["seniority"] == scorer.NEUTRAL
+    
+    assert scorer.score({"title": "Financial Analyst", "snippet": ""}, JOB)["job_family"] == 0.0
+    assert scorer.score({"title": "Head of Sales", "snippet": ""}, JOB)["seniority"] == 0.6
+    assert scorer.score({"title": "Intern", "snippet": ""}, JOB)["seniority"] == 0.1
+    
+    unknown = scorer.score(CANDIDATES[0], JOB)
+    assert unknown["job_family"] == unknown["seniority"] == scorer.NEUTRAL and unknown["skills"] == 0.0
+
+def test_keep_fraction_keeps_top_candidates_in_search_order():
+    """The top keep_fraction by pre-score are kept, listed in search order with their pre_score"""
+    kept, pruned = scorer.select(CANDIDATES, JOB, keep_fraction=0.5)
+    
+    assert titles(kept) == ["Senior DevOps Engineer", "DevOps Engineer", "Senior Software Engineer"]
+    assert titles(pruned) == ["Pastry Chef", "Intern", "Junior Accountant"]
+    assert [candidate["pre_score"] for candidate in kept] == [1.0, 0.65, 0.625]
+    assert "pre_score" not in CANDIDATES[1]
+    
+    # Rounded up: a third of six is two
+    assert len(scorer.select(CANDIDATES, JOB, keep_fraction=0.3)[0]) == 2
+    assert scorer.select([], JOB) == ([], [])
+
+def test_min_keep_floor():
+    """min_keep keeps the best candidates even when keep_fraction would keep fewer"""
+    kept, pruned = scorer.select(CANDIDATES, JOB, keep_fraction=0.0, min_keep=2)
+    assert titles(kept) == ["Senior DevOps Engineer", "DevOps Engineer"]
+    assert len(pruned) == 4
+    
+    kept, pruned = scorer.select(CANDIDATES, JOB, keep_fraction=0.0, min_keep=10)
+    assert titles(kept) == titles(CANDIDATES) and pruned == []
+
+def test_min_score_cut():
+    """Anyone at or above min_score is kept in addition to the top fraction"""
+    kept, _ = scorer.select(CANDIDATES, JOB, keep_fraction=0.0, min_score=0.28)
+    assert titles(kept) == ["Senior DevOps Engineer", "Intern", "DevOps Engineer", "Senior Software Engineer"]
+    
+    kept, _ = scorer.select(CANDIDATES, JOB, keep_fraction=0.5, min_score=2.0)
+    assert len(kept) == 3
+
+def test_ties_keep_earlier_search_results():
+    """Equal pre-scores are broken by search position, so selection is stable"""
+    candidates = [{"title": "DevOps Engineer", "snippet": "k8s and terraform", "link": f"#{i}"} for i in range(6)]
+    kept, pruned = scorer.select(candidates, JOB, keep_fraction=0.5)
+    
+    assert [candidate["link"] for candidate in kept] == ["#0", "#1", "#2"]
+    assert [candidate["link"] for candidate in pruned] == ["#3", "#4", "#5"]
+
+if __name__ == "__main__":
+    test_component_scores()
+    test_keep_fraction_keeps_top_candidates_in_search_order()
+    test_min_keep_floor()
+    test_min_score_cut()
+    test_ties_keep_earlier_search_results()
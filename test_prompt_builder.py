@@ -0,0 +1,83 @@
+import json
+
+from prompt_builder import (PromptBuilder, TokenUsageTracker, compact_json, compact_text, count_tokens,
+                            truncate_list, truncate_to_tokens)
+
+JOB = "Senior Platform Engineer 🚀 building Kubernetes, Terraform and AWS infrastructure for payments. " * 40
+
+def test_truncated_text_fits_budget():
+    """Truncated output, ellipsis included, never exceeds the budget and ends on a whole word"""
+    for text in [JOB, "x" * 400, "word " * 300]:
+        for budget in [1, 2, 3, 5, 10, 25, 64, 200]:
+            result = truncate_to_tokens(text, budget)
+            assert count_tokens(result) <= budget, (budget, result)
+            if result and result != text:
+                assert result.endswith("…")
+                assert text.startswith(result[:-1].rstrip())
+    
+    assert truncate_to_tokens("short text", 50) == "short text"
+    assert truncate_to_tokens(JOB, 0) == ""
+    assert truncate_to_tokens(JOB, 30) == truncate_to_tokens(JOB, 30)
+
+def test_list_cut_at_item_boundaries():
+    """A list keeps whole items in order until the next one would overrun the budget"""
+    items = [f"Led migration #{i} of a payments service to Kubernetes" for i in range(50)]
+    budget = 60
+    kept = truncate_list(items, budget)
+    
+    assert 0 < len(kept) < len(items)
+    assert kept == items[:len(kept)]
+    cost = sum(count_tokens(item) + 1 for item in kept)
+    assert cost <= budget < cost + count_tokens(items[len(kept)]) + 1
+    
+    prompt = PromptBuilder().add_section("Experience", items, budget=budget).build()
+    assert prompt == "Experience:\n" + "; ".join(kept)
+
+def test_compaction_is_stable():
+    """Compacting twice changes nothing; JSON is compact and round-trips"""
+    text = """
+        ## Role 🚀
+            Build   the platform\t team.
+
+
+        - Kubernetes ✅
+    """
+    compacted = compact_text(text)
+    assert compacted == "## Role\nBuild the platform team.\n\n- Kubernetes"
+    assert compact_text(compacted) == compacted
+    
+    value = {"skills": ["kubernetes", "terraform"], "years": 7, "note": "São Paulo"}
+    assert compact_json(value) == '{"skills":["kubernetes","terraform"],"years":7,"note":"São Paulo"}'
+    assert compact_json(json.loads(compact_json(value))) == compact_json(value)
+    
+    prompt = PromptBuilder().add(text).add_section("Criteria", value).build()
+    assert prompt == PromptBuilder().add(compacted).add_section("Criteria", value).build()
+
+def test_section_budget():
+    """A text section is truncated to its budget; free text is not"""
+    prompt = PromptBuilder().add_section("Job Description", JOB, budget=50).build()
+    body = prompt.split("\n", 1)[1]
+    assert count_tokens(body) <= 50 and body.endswith("…")
+    assert "🚀" not in prompt
+
+def test_usage_tracker_aggregates_and_bounds_history():
+    """Totals cover every call while only the last max_calls calls are kept"""
+    tracker = TokenUsageTracker(max_calls=3)
+    for i in range(5):
+        tracker.record("evaluation", 100 + i, 10)
+    tracker.record("criteria", 500, 50)
+    
+    assert len(tracker.calls) == 3
+    assert [call["prompt_tokens"] for call in tracker.calls] == [103, 104, 500]
+    
+    summary = tracker.summary()
+    assert summary["by_label"]["evaluation"] == {"calls": 5, "prompt_tokens": 510, "completion_tokens": 50}
+    assert summary["calls"] == 6
+    assert summary["prompt_tokens"] == 1010 and summary["completion_tokens"] == 100
+
+if __name__ == "__main__":
+    test_truncated_text_fits_budget()
+    test_list_cut_at_item_boundaries()
+    test_compaction_is_stable()
+    test_section_budget()
+    test_usage_tracker_aggregates_and_bounds_history()
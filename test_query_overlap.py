@@ -0,0 +1,45 @@
+from query_overlap import QueryOverlapEstimator, count_query_words, merge_queries, parse_query
+
+PRIMARY = 'site:linkedin.com/in/ ("DevOps Engineer" OR "SRE") ("San Francisco Bay Area" OR "San Francisco") "5+ years" OR "senior" ("python" OR "aws")'
+SPECIALIZED = 'site:linkedin.com/in/ ("DevOps Engineer" OR "SRE") ("San Francisco Bay Area" OR "San Francisco") "5+ years" OR "senior" ("kubernetes")'
+STARTUP = 'site:linkedin.com/in/ "DevOps Engineer" (startup OR series) (AWS OR Azure)'
+
+def test_parse_and_merge():
+    """OR binds tighter than AND; queries differing in one OR-clause merge into one call"""
+    parsed = parse_query(PRIMARY)
+    print(f"Clauses: {parsed.clauses}")
+    
+    assert parsed.clauses[3] == ('"5+ years"', '"senior"')
+    assert parse_query(PRIMARY.replace(" (", "  (")).key == parsed.key
+    
+    merged = merge_queries(parsed, parse_query(SPECIALIZED))
+    assert merged is not None
+    assert merged.clauses[-1] == ('"python"', '"aws"', '"kubernetes"')
+    assert count_query_words(merged.query) <= 32
+    assert merge_queries(parsed, parse_query(STARTUP)) is None
+
+def test_plan_and_history():
+    """Merged and duplicate queries are skipped up front; history flags queries returning known profiles"""
+    estimator = QueryOverlapEstimator()
+    queries = [
+        {"query": PRIMARY, "strategy": "primary"},
+        {"query": SPECIALIZED, "strategy": "specialized"},
+        {"query": STARTUP, "strategy": "industry_specific"},
+        {"query": PRIMARY, "strategy": "duplicate"}
+    ]
+    kept, skipped = estimator.plan(queries)
+    
+    assert [query["strategy"] for query in kept] == ["primary", "industry_specific"]
+    assert kept[0]["merged_strategies"] == ["primary", "specialized"]
+    assert [query["strategy"] for query in skipped] == ["specialized", "duplicate"]
+    
+    # Both queries returned the same profiles last time, so the second one would add nothing
+    urls = [f"https://www.linkedin.com/in/person-{i}" for i in range(8)]
+    estimator.record(kept[0]["query"], urls)
+    estimator.record(STARTUP, [url.replace("www.", "ca.") + "/" for url in urls])
+    assert estimator.overlap_with(STARTUP, [kept[0]["query"]]) == 1.0
+    assert estimator.overlap_with(STARTUP, []) == 0.0
+
+if __name__ == "__main__":
+    test_parse_and_merge()
+    test_plan_and_history()
@@ -0,0 +1,37 @@
+from query_overlap import count_query_words
+from query_packer import QueryLimits, QueryPacker, TermStats
+from taxonomy import CompiledTemplate
+
+TEMPLATE = CompiledTemplate('site:linkedin.com/in/ ("{job_title}") {tech_stack} {programming_languages}')
+VALUES = {"job_title": "Backend Engineer", "programming_languages": ""}
+SKILLS = [f'"skill {i}"' for i in range(20)]
+
+def test_pack_within_limits():
+    """Packed queries stay within the word and character limits, keeping the top-ranked terms"""
+    packer = QueryPacker()
+    query = packer.pack(TEMPLATE, VALUES, {"tech_stack": SKILLS, "programming_languages": ["Python", "Go"]})
+    print(f"Packed: {query}")
+    
+    assert count_query_words(query) <= 32
+    assert '"skill 0"' in query and "(Python OR Go)" in query
+    assert '"skill 19"' not in query
+    
+    short = QueryPacker(QueryLimits(max_chars=80)).pack(TEMPLATE, VALUES, {"tech_stack": SKILLS})
+    assert len(short) <= 80 and '"skill 0"' in short
+
+def test_term_stats_steer_selection():
+    """Terms that yielded new profiles before outrank higher-ranked terms that did not"""
+    stats = TermStats()
+    for _ in range(5):
+        stats.record('site:linkedin.com/in/ ("skill 5")', 10, 8, 8)
+        stats.record('site:linkedin.com/in/ ("skill 0")', 10, 0, 0)
+    
+    assert stats.value('"skill 5"') > 1.0 > stats.value("skill 0")
+    
+    packer = QueryPacker(QueryLimits(max_words=12), stats)
+    query = packer.pack(TEMPLATE, VALUES, {"tech_stack": SKILLS})
+    assert '"skill 5"' in query and '"skill 0"' not in query
+
+if __name__ == "__main__":
+    test_pack_within_limits()
+    test_term_stats_steer_selection()
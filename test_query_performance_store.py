@@ -0,0 +1,109 @@
+import os
+import sqlite3
+import tempfile
+from collections import deque
+
+from query_performance_store import QueryPerformanceStore
+
+PRIMARY = 'site:linkedin.com/in/ ("DevOps Engineer" OR "SRE") ("python" OR "aws")'
+STARTUP = 'site:linkedin.com/in/ "DevOps Engineer" (startup OR series)'
+
+def test_bounded_aggregates():
+    """Recent records are capped while totals and per-strategy / per-term counts keep accumulating"""
+    store = QueryPerformanceStore(path=":memory:", capacity=5, max_terms=3)
+    for i in range(12):
+        store.record(PRIMARY, "primary", 10, 8, 4, "devops_engineer")
+        store.record(STARTUP, "industry_specific", 10, 0, 0, "devops_engineer")
+    
+    summary = store.summary()
+    print(f"Summary: {summary}")
+    
+    assert len(store.recent()) == 5
+    assert summary["queries"] == 24
+    assert summary["success_rate"] == 50.0
+    assert summary["by_strategy"]["primary"]["avg_linkedin_profiles"] == 8
+    assert summary["by_role"]["devops_engineer"]["avg_new_profiles"] == 2
+    
+    # "python" was evicted from memory (max_terms=3) but its counts are read back
+    assert store.term_summary('"python"')["queries"] == 12
+    assert store.term_summary("devops engineer")["queries"] == 24
+    
+    # record returns the entry recent() lists, so callers can keep their own records
+    entry = store.record(STARTUP, "industry_specific", 10, 0, 0, "devops_engineer")
+    assert store.recent()[-1] is entry
+
+def test_persistence():
+    """Aggregates and recent records survive a restart"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "performance.sqlite3")
+        store = QueryPerformanceStore(path=path)
+        store.record(PRIMARY, "primary", 10, 6, 6, "devops_engineer")
+        store.flush()
+        store.record(STARTUP, "industry_specific", 10, 2, 1, "devops_engineer")
+        store.flush()
+        
+        restored = QueryPerformanceStore(path=path)
+        assert restored.summary()["queries"] == 2
+        assert restored.summary()["by_strategy"]["industry_specific"]["linkedin_profiles"] == 2
+        assert [record["strategy"] for record in restored.recent()] == ["primary", "industry_specific"]
+        assert restored.term_summary('"sre"')["new_profiles"] == 6
+
+class FailingWrites:
+    """Connection whose writes fail, as when the database file is locked or read-only"""
+    
+    def __init__(self, conn):
+        self.conn = conn
+        self.attempts = 0
+    
+    def execute(self, sql, parameters=()):
+        return self.conn.execute(sql, parameters)
+    
+    def executemany(self, sql, rows):
+        self.attempts += 1
+        raise sqlite3.OperationalError("database is locked")
+    
+    def commit(self):
+        self.conn.commit()
+    
+    def rollback(self):
+        self.conn.rollback()
+
+def test_raw_records_are_pruned():
+    """The raw record table keeps only the last capacity rows; aggregates keep every query"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "performance.sqlite3")
+        store = QueryPerformanceStore(path=path, capacity=5)
+        for i in range(3):
+            for _ in range(12):
+                store.record(PRIMARY, "primary", 10, 8, 4, "devops_engineer")
+            store.flush()
+        
+        assert store._conn.execute("SELECT COUNT(*) FROM query_performance").fetchone()[0] == 5
+        restored = QueryPerformanceStore(path=path, capacity=5)
+        assert len(restored.recent()) == 5
+        assert restored.summary()["queries"] == 36
+
+def test_failed_flush_keeps_memory_bounded():
+    """While writes fail, unsaved records stay capped, retries wait FLUSH_INTERVAL records, and no counts are lost"""
+    store = QueryPerformanceStore(path=":memory:", capacity=5)
+    conn = store._conn
+    store._conn = FailingWrites(conn)
+    for i in range(100):
+        store.record(f'site:linkedin.com/in/ "term{i}"', "primary", 10, 8, 4, "devops_engineer")
+    
+    assert len(store._pending_records) == 5
+    assert store._conn.attempts == 100 // store.FLUSH_INTERVAL
+    
+    store._conn = conn
+    store.flush()
+    assert store._pending_records == deque() and store._pending_deltas == {}
+    assert conn.execute("SELECT COUNT(*) FROM query_performance").fetchone()[0] == 5
+    assert store.term_summary('"term0"')["queries"] == 1
+    total = conn.execute("SELECT queries FROM query_performance_aggregates WHERE scope = 'total'").fetchone()[0]
+    assert total == 100
+
+if __name__ == "__main__":
+    test_bounded_aggregates()
+    test_persistence()
+    test_raw_records_are_pruned()
+    test_failed_flush_keeps_memory_bounded()
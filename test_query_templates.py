@@ -0,0 +1,56 @@
+import json
+import re
+
+from advanced_sourcing_agent import JobDescriptionAnalyzer, PlaceholderValues, QueryGenerator
+from job_profile import JobProfile
+from sample_jobs import get_sample_jobs
+from taxonomy import CompiledTemplate
+
+def legacy_render(template: str, profile: JobProfile, generator: QueryGenerator) -> str:
+    """The string-replace rendering CompiledTemplate replaced"""
+    query = template
+    for placeholder in re.findall(r'\{([^}]+)\}', template):
+        query = query.replace(f"{{{placeholder}}}", generator._generate_placeholder_value(placeholder, profile, ""))
+    query = re.sub(r'\s+', ' ', query)
+    query = re.sub(r'\(\s*\)', '', query)
+    return query.strip()
+
+def test_compiled_templates_match_string_replace():
+    """Every template renders exactly as the old string-replace did, on the sample jobs and jobs.json"""
+    analyzer = JobDescriptionAnalyzer()
+    generator = QueryGenerator()
+    
+    with open("jobs.json", encoding="utf-8") as f:
+        descriptions = list(get_sample_jobs().values()) + [job["description"] for job in json.load(f)]
+    
+    rendered = 0
+    for description in descriptions:
+        profile = analyzer.build_profile(description)
+        values = generator.placeholder_values(profile)
+        for templates in generator.compiled_templates.values():
+            for template in templates.values():
+                assert template.render(values) == legacy_render(template.template, profile, generator)
+                rendered += 1
+    print(f"Rendered {rendered} template/job pairs")
+    assert rendered > 0
+
+def test_missing_placeholders():
+    """Unknown placeholders render empty and their parentheses are dropped; a plain mapping must supply every value"""
+    template = CompiledTemplate('site:linkedin.com/in/ "DevOps Engineer" ({unknown}) {location}  {unknown}')
+    assert template.placeholders == ("unknown", "location")
+    
+    profile = JobDescriptionAnalyzer().build_profile("DevOps Engineer, Kubernetes")
+    values = PlaceholderValues(QueryGenerator(), profile)
+    assert template.render(values) == 'site:linkedin.com/in/ "DevOps Engineer"'
+    assert values == {"unknown": "", "location": ""}
+    
+    assert template.render({"unknown": "", "location": '"Austin"'}) == 'site:linkedin.com/in/ "DevOps Engineer" "Austin"'
+    try:
+        template.render({"location": '"Austin"'})
+        assert False, "expected a KeyError for the missing placeholder"
+    except KeyError as e:
+        assert e.args == ("unknown",)
+
+if __name__ == "__main__":
+    test_compiled_templates_match_string_replace()
+    test_missing_placeholders()
@@ -0,0 +1,118 @@
+import json
+import os
+import re
+import types
+
+import advanced_sourcing_agent
+from advanced_sourcing_agent import AdvancedSourcingAgent, SearchEvent
+
+JOB = "Senior DevOps Engineer in Austin. Kubernetes, Terraform, AWS and Python."
+
+def make_agent(failing_links=(), api_down=False) -> AdvancedSourcingAgent:
+    """Agent with in-memory stores and stubbed search and OpenAI calls.
+    
+    Each search returns ten LinkedIn profiles whose snippets carry a rating the
+    fake model scores them by. Candidates in ``failing_links`` make the
+    evaluator raise; ``api_down`` makes every evaluation call fail.
+    """
+    environment = {"SRN_QUERY_PERFORMANCE_PATH": ":memory:", "SRN_EVALUATION_CACHE_PATH": ":memory:"}
+    saved = {name: os.environ.get(name) for name in environment}
+    streamlit = advanced_sourcing_agent.st
+    os.environ.update(environment)
+    advanced_sourcing_agent.st = types.SimpleNamespace(secrets={"GOOGLE_API_KEY": "key", "SEARCH_ENGINE_ID": "engine"})
+    try:
+        agent = AdvancedSourcingAgent(max_concurrent_evaluations=3)
+    finally:
+        advanced_sourcing_agent.st = streamlit
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+    
+    queries = []
+    def search(query, num_results=10, start=1):
+        queries.append(query)
+        n = len(queries)
+        return [{
+            "link": f"https://www.linkedin.com/in/q{n}-{i}",
+            "title": "Senior DevOps Engineer",
+            "snippet": f"Kubernetes and AWS. rating {(n * 3 + i * 7) % 9 + 1}"
+        } for i in range(10)]
+    agent._execute_search = search
+    
+    def call_openai(prompt, label="chat"):
+        if label == "criteria":
+            return json.dumps({"core_skills": ["Kubernetes"]})
+        if api_down:
+            raise ConnectionError("OpenAI unavailable")
+        rating = float(re.search(r"rating (\d+)", prompt).group(1))
+        return json.dumps({
+            "scores": {category: rating for category in
+                       ("education", "career_trajectory", "company_relevance", "tenure_stability", "core_skills")},
+            "strengths": [], "weaknesses": [], "rationale": ""
+        })
+    agent.smart_evaluator._call_openai = call_openai
+    
+    evaluate_prepared = agent.smart_evaluator.evaluate_prepared
+    def evaluate(candidate, prepared_job):
+        if candidate["link"] in failing_links:
+            raise RuntimeError("malformed candidate")
+        return evaluate_prepared(candidate, prepared_job)
+    agent.smart_evaluator.evaluate_prepared = evaluate
+    return agent
+
+def ranking(result) -> list:
+    return [(candidate["link"], candidate["fit_score"]) for candidate in result["candidates"]]
+
+def test_event_sequence():
+    """ANALYSIS first, then QUERY events, then CANDIDATE events, then exactly one FINAL"""
+    events = list(make_agent().search_candidates_stream(JOB, num_candidates=5))
+    types_seen = [event.type for event in events]
+    print(f"Events: {types_seen}")
+    
+    assert types_seen[0] == SearchEvent.ANALYSIS
+    assert types_seen[-1] == SearchEvent.FINAL and types_seen.count(SearchEvent.FINAL) == 1
+    queries = [i for i, kind in enumerate(types_seen) if kind == SearchEvent.QUERY]
+    candidates = [i for i, kind in enumerate(types_seen) if kind == SearchEvent.CANDIDATE]
+    assert queries and candidates
+    assert max(queries) < min(candidates)
+    
+    completed = [events[i].data["completed"] for i in candidates]
+    assert completed == list(range(1, len(candidates) + 1))
+    assert events[0].data["job_analysis"]["job_family"] == "engineering"
+
+def test_final_matches_search_candidates():
+    """The streamed FINAL ranking is what search_candidates returns"""
+    events = list(make_agent().search_candidates_stream(JOB, num_candidates=5))
+    streamed = events[-1].data
+    result = make_agent().search_candidates(JOB, num_candidates=5)
+    
+    assert ranking(streamed) == ranking(result)
+    assert len(result["candidates"]) == 5
+    scores = [score for _, score in ranking(result)]
+    assert scores == sorted(scores, reverse=True)
+    
+    # Every ranked candidate was streamed as a CANDIDATE event first
+    streamed_links = {event.data["candidate"]["link"] for event in events if event.type == SearchEvent.CANDIDATE}
+    assert {link for link, _ in ranking(streamed)} <= streamed_links
+
+def test_evaluator_errors_still_yield_final():
+    """A failing API falls back to default scores; an evaluator exception drops that candidate; FINAL comes either way"""
+    events = list(make_agent(api_down=True).search_candidates_stream(JOB, num_candidates=5))
+    assert events[-1].type == SearchEvent.FINAL
+    assert [candidate["fit_score"] for candidate in events[-1].data["candidates"]]
+    
+    failing = {"https://www.linkedin.com/in/q1-0", "https://www.linkedin.com/in/q1-1"}
+    events = list(make_agent(failing_links=failing).search_candidates_stream(JOB, num_candidates=5))
+    final = events[-1]
+    assert final.type == SearchEvent.FINAL
+    assert [link for link, _ in ranking(final.data)] == [
+        "https://www.linkedin.com/in/q1-2", "https://www.linkedin.com/in/q1-3", "https://www.linkedin.com/in/q1-4"
+    ]
+    assert final.data["evaluations_skipped"] == 2
+
+if __name__ == "__main__":
+    test_event_sequence()
+    test_final_matches_search_candidates()
+    test_evaluator_errors_still_yield_final()
@@ -0,0 +1,36 @@
+from advanced_sourcing_agent import JobDescriptionAnalyzer, QueryGenerator
+
+def test_skill_synonyms():
+    """Surface forms map to one canonical skill and id; "Go" the verb is not a language"""
+    analyzer = JobDescriptionAnalyzer()
+    skills, other = analyzer.extract_skills_bulk(["K8s, Golang and Google Cloud", "Go on GCP with Kubernetes. Go-to-market, let's go"])
+    
+    assert skills["cloud"] == ["kubernetes", "gcp"] and skills["programming"] == ["golang"]
+    assert other["cloud"] == ["gcp", "kubernetes"] and other["programming"] == ["golang"]
+    
+    ids = analyzer.extract_skill_ids_bulk(["k8s and nodejs", "Kubernetes, Node.js", "go-to-market"])
+    assert ids[0] == ids[1] == analyzer.skill_ids({"cloud": ["kubernetes"], "backend": ["node.js"]})
+    assert ids[2] == set()
+
+def test_synonyms_share_one_canonical_id_in_queries():
+    """Two synonyms of one skill in a JD produce the canonical term once in the generated queries"""
+    analyzer = JobDescriptionAnalyzer()
+    generator = QueryGenerator()
+    synonyms = "Senior Backend Engineer in Austin. We run Postgres; psql tuning and K8s experience required."
+    canonical = "Senior Backend Engineer in Austin. We run PostgreSQL; PostgreSQL tuning and Kubernetes experience required."
+    
+    profile = analyzer.build_profile(synonyms)
+    assert profile.skills["databases"] == ("postgresql",)
+    assert analyzer.extract_skill_ids_bulk([synonyms]) == analyzer.extract_skill_ids_bulk([canonical])
+    
+    queries = [query["query"] for query in generator.generate_queries(profile)]
+    print(f"Queries: {queries}")
+    assert queries == [query["query"] for query in generator.generate_queries(analyzer.build_profile(canonical))]
+    
+    text = " ".join(queries).lower()
+    assert text.count('"postgresql"') == 1 and text.count('"kubernetes"') == 1
+    assert "postgres\"" not in text and "psql" not in text and "k8s" not in text
+
+if __name__ == "__main__":
+    test_skill_synonyms()
+    test_synonyms_share_one_canonical_id_in_queries()
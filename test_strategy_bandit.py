@@ -0,0 +1,39 @@
+import os
+import tempfile
+
+from strategy_bandit import StrategyBandit
+
+STRATEGIES = ["primary", "specialized", "industry_specific"]
+
+def test_allocation_follows_yield():
+    """The budget goes mostly to the strategy whose past calls returned useful profiles"""
+    bandit = StrategyBandit(seed=7)
+    for _ in range(20):
+        bandit.record("devops_engineer", "specialized", 1, 10, 6.0)
+        bandit.record("devops_engineer", "primary", 1, 10, 0.5)
+        bandit.record("devops_engineer", "industry_specific", 1, 10, 0.0)
+    
+    allocation = bandit.allocate("devops_engineer", STRATEGIES, 4)
+    print(f"Allocation: {allocation}")
+    
+    assert list(allocation)[0] == "specialized"
+    assert sum(allocation.values()) == 4
+    assert allocation["specialized"] == StrategyBandit.MAX_PAGES
+    assert allocation["industry_specific"] == 0
+    
+    # Other role families keep the prior and spread the budget
+    assert sorted(bandit.allocate("data_scientist", STRATEGIES, 3).values()) == [1, 1, 1]
+
+def test_persistence():
+    """Arms survive a restart through the JSON file"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "strategies.json")
+        StrategyBandit(path=path).record("ml_engineer", "primary", 2, 20, 5.0)
+        
+        restored = StrategyBandit(path=path)
+        assert restored.stats()["ml_engineer/primary"]["calls"] == 2
+        assert restored.expected_yield("ml_engineer", "primary") == (5.0 + 1.0) / (20 + 5.0)
+
+if __name__ == "__main__":
+    test_allocation_follows_yield()
+    test_persistence()
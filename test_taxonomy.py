@@ -0,0 +1,83 @@
+import json
+import os
+import pickle
+import shutil
+import tempfile
+
+from taxonomy import DEFAULT_TAXONOMY_PATH, CompiledTaxonomy, TaxonomyStore
+
+def make_store(directory: str) -> TaxonomyStore:
+    """Store over a private copy of the taxonomy that checks the source on every get"""
+    path = os.path.join(directory, "taxonomy.json")
+    shutil.copy(DEFAULT_TAXONOMY_PATH, path)
+    store = TaxonomyStore(path)
+    store.RELOAD_INTERVAL = 0
+    return store
+
+def write_source(store: TaxonomyStore, content: str) -> None:
+    """Rewrite the source and move its mtime forward so the change is seen"""
+    stat = os.stat(store.path)
+    with open(store.path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.utime(store.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+def test_hot_reload_picks_up_source_changes():
+    """Editing the source swaps in a recompiled taxonomy"""
+    with tempfile.TemporaryDirectory() as directory:
+        store = make_store(directory)
+        first = store.get()
+        assert store.get() is first
+        
+        with open(store.path, encoding="utf-8") as f:
+            data = json.load(f)
+        data["industries"]["tech"].append("devtools")
+        write_source(store, json.dumps(data))
+        
+        reloaded = store.get()
+        assert reloaded is not first
+        assert reloaded.keyword_matcher.scan("a devtools startup").scores("industry")["tech"] == 2
+
+def test_invalid_source_keeps_previous_taxonomy():
+    """A source that no longer parses leaves the loaded taxonomy in service"""
+    with tempfile.TemporaryDirectory() as directory:
+        store = make_store(directory)
+        first = store.get()
+        
+        write_source(store, '{"technical_skills": {')
+        assert store.get() is first
+
+def test_corrupt_artifact_is_rebuilt_from_source():
+    """A truncated or corrupt artifact is ignored and rewritten instead of failing the reload"""
+    with tempfile.TemporaryDirectory() as directory:
+        store = make_store(directory)
+        first = store.get()
+        with open(store.artifact_path, "rb") as f:
+            valid = f.read()
+        
+        for artifact in [b"", b"garbage", valid[:len(valid) // 2], pickle.dumps(["not", "a", "dict"])]:
+            with open(store.artifact_path, "wb") as f:
+                f.write(artifact)
+            
+            reloaded = store.reload()
+            assert isinstance(reloaded, CompiledTaxonomy)
+            assert reloaded.source_hash == first.source_hash
+            with open(store.artifact_path, "rb") as f:
+                assert pickle.load(f)["source_hash"] == first.source_hash
+
+def test_unpickling_error_during_reload_keeps_previous_taxonomy():
+    """Unpickling errors escaping the load keep the previous taxonomy in service"""
+    with tempfile.TemporaryDirectory() as directory:
+        store = make_store(directory)
+        first = store.get()
+        
+        for error in [pickle.UnpicklingError("invalid load key"), EOFError("Ran out of input")]:
+            def failing_load():
+                raise error
+            store._load = failing_load
+            assert store.reload() is first
+
+if __name__ == "__main__":
+    test_hot_reload_picks_up_source_changes()
+    test_invalid_source_keeps_previous_taxonomy()
+    test_corrupt_artifact_is_rebuilt_from_source()
+    test_unpickling_error_during_reload_keeps_previous_taxonomy()
@@ -0,0 +1,33 @@
+from token_index import TokenIndex
+from advanced_sourcing_agent import JobDescriptionAnalyzer, QueryGenerator
+
+def test_token_index():
+    """Short keywords must only match whole words"""
+    index = TokenIndex("Maintain our npm build pipeline, PMO reporting and R&D tooling. 5+ years with C++/C#.")
+    
+    assert not index.contains("pm")
+    assert not index.contains("ai")
+    assert not index.contains("ui")
+    assert index.contains("build pipeline")
+    assert index.contains("5+ years")
+    assert index.contains("c++") and index.contains("c#")
+    
+    # Plural and -ing forms still match their keyword
+    assert TokenIndex("Engineering team of developers").contains_any(["engineer", "developer"])
+    
+    analyzer = JobDescriptionAnalyzer()
+    analysis = analyzer.analyze_job("Senior Accounting Manager maintaining GAAP reporting for our R&D group")
+    print(f"Analysis: {analysis['job_family']}, {analysis['skills']['programming']}")
+    
+    assert analysis["job_family"] == "finance"
+    assert analysis["skills"]["programming"] == []
+    
+    generator = QueryGenerator()
+    profile = analyzer.build_profile("JavaScript shop")
+    assert generator._generate_placeholder_value("programming_languages", profile, "primary") == "(Javascript)"
+    profile = analyzer.build_profile("Machine Learning Engineer, platform team")
+    assert profile.job_family == "engineering"
+    assert generator._map_to_role_key(profile) == "ml_engineer"
+
+if __name__ == "__main__":
+    test_token_index()
@@ -0,0 +1,65 @@
+import random
+import threading
+import time
+
+from evaluation_executor import EvaluationExecutor
+from top_k import TopKCollector
+
+def test_heap_ordering():
+    """The kept top k match a stable sort of the whole pool, ties broken by input order"""
+    rng = random.Random(3)
+    scores = [round(rng.uniform(0, 10)) / 2 for _ in range(200)]
+    
+    top_k = TopKCollector(10)
+    for index, score in enumerate(scores):
+        top_k.push(score, index, index)
+    
+    expected = sorted(range(len(scores)), key=lambda index: -scores[index])[:10]
+    print(f"Top 10: {[(index, scores[index]) for index in top_k.results()]}")
+    assert top_k.results() == expected
+    assert top_k.stats()["evaluated"] == 200 and top_k.stats()["kept"] == 10
+
+def test_early_stop_threshold():
+    """The result settles once stop_count kept candidates reach stop_score, not before"""
+    top_k = TopKCollector(5, stop_score=8.0, stop_count=2)
+    for index, score in enumerate([9.0, 6.0, 7.9, 5.0]):
+        top_k.push(score, index, index)
+        assert not top_k.settled
+    
+    top_k.push(8.0, 4, 4)
+    assert top_k.settled and top_k.strong_count == 2
+    
+    # Without a stop score the collector never settles
+    unbounded = TopKCollector(1)
+    unbounded.push(10.0, 0, 0)
+    assert not unbounded.settled
+
+def test_pending_evaluations_cancelled():
+    """Closing the evaluation stream once settled cancels evaluations that have not started"""
+    started = []
+    lock = threading.Lock()
+    
+    def evaluate(score):
+        with lock:
+            started.append(score)
+        time.sleep(0.05)
+        return score
+    
+    scores = [9.0, 9.5] + [5.0] * 18
+    top_k = TopKCollector(5, stop_score=9.0, stop_count=2)
+    evaluations = EvaluationExecutor(max_workers=2).iter_completed(evaluate, scores)
+    for index, score in evaluations:
+        top_k.push(score, index, index)
+        if top_k.settled:
+            evaluations.close()
+            break
+    
+    time.sleep(0.2)
+    print(f"Started {len(started)} of {len(scores)} evaluations")
+    assert top_k.settled
+    assert len(started) <= 4
+
+if __name__ == "__main__":
+    test_heap_ordering()
+    test_early_stop_threshold()
+    test_pending_evaluations_cancelled()
@@ -0,0 +1,69 @@
+import re
+from functools import lru_cache
+from typing import FrozenSet, List, Set, Tuple
+
+# Word characters, keeping trailing + and # so "c++", "c#" and "5+" stay whole
+_TOKEN_PATTERN = re.compile(r"[^\W_]+[+#]*")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with punctuation as a boundary ("ci/cd" -> ["ci", "cd"])"""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+@lru_cache(maxsize=4096)
+def phrase_variants(phrase: str) -> FrozenSet[Tuple[str, ...]]:
+    """Token sequences a keyword phrase matches: as written, or with its last word inflected.
+
+    "engineer" also matches "engineers" and "engineering". Short words
+    (acronyms such as "aws", "sre", "pm") only match as written. Cached, since
+    the same keyword literals are checked against every document.
+    """
+    tokens = tuple(tokenize(phrase))
+    if not tokens:
+        return frozenset()
+
+    variants = {tokens}
+    last = tokens[-1]
+    if len(last) >= 4 and last.isalpha():
+        stem = last[:-1] if last.endswith("e") else last
+        forms = {last + "s", last + "es", stem + "ing", stem + "ings"}
+        if last.endswith("y"):
+            forms.add(last[:-1] + "ies")
+        variants.update(tokens[:-1] + (form,) for form in forms)
+    return frozenset(variants)
+
+
+class TokenIndex:
+    """Set of every 1..max_n token n-gram of a document.
+
+    Built once per text; ``contains`` answers "does this word or phrase occur
+    as whole words" with a few set lookups, so "pm" no longer matches
+    "npm" or "ai" inside "maintain".
+    """
+
+    def __init__(self, text: str, max_n: int = 4):
+        self.tokens = tokenize(text)
+        self.max_n = max_n
+        self.ngrams: Set[Tuple[str, ...]] = set()
+        for n in range(1, max_n + 1):
+            for i in range(len(self.tokens) - n + 1):
+                self.ngrams.add(tuple(self.tokens[i:i + n]))
+
+    def contains(self, phrase: str) -> bool:
+        """True when the phrase occurs in the document as a whole-word token sequence"""
+        return any(self._contains_tokens(tokens) for tokens in phrase_variants(phrase))
+
+    def contains_any(self, phrases: List[str]) -> bool:
+        """True when any of the phrases occurs"""
+        return any(self.contains(phrase) for phrase in phrases)
+
+    def _contains_tokens(self, tokens: Tuple[str, ...]) -> bool:
+        if len(tokens) <= self.max_n:
+            return tokens in self.ngrams
+
+        # Longer than any indexed n-gram: scan from each occurrence of the prefix
+        if tokens[:self.max_n] not in self.ngrams:
+            return False
+        n = len(tokens)
+        return any(tuple(self.tokens[i:i + n]) == tokens for i in range(len(self.tokens) - n + 1))
@@ -0,0 +1,60 @@
+import heapq
+from typing import Dict, List, Any, Optional, Tuple
+
+
+class TopKCollector:
+    """Bounded min-heap of the best ``k`` evaluated candidates.
+
+    Candidates are ranked by score, ties by input index (earlier first), which
+    is the same order a stable sort of the full pool produces. The stopping
+    rule is met once ``stop_count`` candidates scoring at least ``stop_score``
+    are held: at that point the result is treated as settled and outstanding
+    evaluations can be cancelled.
+    """
+
+    def __init__(self, k: int, stop_score: Optional[float] = None, stop_count: Optional[int] = None):
+        self.k = max(1, k)
+        self.stop_score = stop_score
+        self.stop_count = min(self.k, stop_count) if stop_count else self.k
+        self.seen = 0
+        # Heap root is the weakest kept candidate: lowest score, then latest index
+        self._heap: List[Tuple[float, int, Any]] = []
+
+    def push(self, score: float, index: int, item: Any) -> bool:
+        """Offer a candidate; returns True when it is (for now) in the top k"""
+        self.seen += 1
+        entry = (score, -index, item)
+
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+            return True
+
+        if (score, -index) > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+            return True
+        return False
+
+    @property
+    def strong_count(self) -> int:
+        """Kept candidates meeting the stop score"""
+        if self.stop_score is None:
+            return 0
+        return sum(1 for score, _, _ in self._heap if score >= self.stop_score)
+
+    @property
+    def settled(self) -> bool:
+        """True once enough strong candidates are held to stop evaluating"""
+        return self.stop_score is not None and self.strong_count >= self.stop_count
+
+    def results(self) -> List[Any]:
+        """Kept items, best first"""
+        return [item for _, _, item in sorted(self._heap, key=lambda entry: (-entry[0], -entry[1]))]
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for logging and the final search summary"""
+        return {
+            "evaluated": self.seen,
+            "kept": len(self._heap),
+            "strong": self.strong_count,
+            "settled": self.settled
+        }